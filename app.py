@@ -1,12 +1,37 @@
+import numpy as np
 import streamlit as st
-from datetime import date
+from datetime import date, timedelta
+from data_fetchers.cached_fetcher import CachedFetcher
+from data_fetchers.history_store import HistoryStore
+from data_fetchers.yahoo_fetcher import YahooFetcher
 from domain.option import Option
 from pricing.pricing_engine import PricingEngine
+from pricing.realized_volatility import realized_volatility
 import pandas as pd
-from ui.plots import plot_call_heatmap, plot_put_heatmap
+from ui.plots import HEATMAP_FIELDS, HeatmapRenderer, generate_option_grids, get_heatmap_ranges
 
-# Initialize pricing engine
-engine = PricingEngine()
+# Keep one spot fetcher and one pricing engine per process, so their caches survive reruns
+@st.cache_resource
+def get_data_provider():
+    return CachedFetcher(YahooFetcher())
+
+@st.cache_resource
+def get_pricing_engine():
+    return PricingEngine(data_provider=get_data_provider())
+
+@st.cache_resource
+def get_history_store():
+    return HistoryStore(YahooFetcher(), "~/.cache/options_pricer/history")
+
+@st.cache_data(ttl=3600)
+def estimate_volatility(ticker: str, window: int = 21):
+    """Latest Yang-Zhang realized volatility of `ticker`, or None without enough history."""
+    panel = get_history_store().history_panel([ticker], date.today() - timedelta(days=3 * window))
+    estimates = realized_volatility(panel, window)[:, 0]
+    estimates = estimates[np.isfinite(estimates)]
+    return float(estimates[-1]) if len(estimates) else None
+
+engine = get_pricing_engine()
 
 # Streamlit page configuration
 st.markdown("""
@@ -28,7 +53,14 @@ st.sidebar.subheader("Input Parameters")
 ticker = st.sidebar.text_input("Underlying Ticker", value="AAPL")
 strike = st.sidebar.number_input("Strike Price", min_value=0.0, value=100.0)
 expiry = st.sidebar.date_input("Expiration Date", value=date.today())
-vol = st.sidebar.number_input("Volatility (%)", min_value=1.0, value=20.0) / 100.0
+default_vol = 20.0
+if st.sidebar.checkbox("Default volatility to 21-day realized"):
+    realized = estimate_volatility(ticker)
+    if realized is None:
+        st.sidebar.caption(f"Not enough price history for {ticker}.")
+    else:
+        default_vol = max(round(realized * 100, 2), 1.0)
+vol = st.sidebar.number_input("Volatility (%)", min_value=1.0, value=default_vol) / 100.0
 rate = st.sidebar.number_input("Risk-Free Rate (%)", min_value=0.0, value=0.01) / 100.0
 
 # Heatmap parameters
@@ -44,9 +76,10 @@ min_vol, max_vol = st.sidebar.slider(
 )
 min_vol /= 100.0
 max_vol /= 100.0
+resolution = st.sidebar.slider("Heatmap Resolution", min_value=5, max_value=500, value=10, step=1)
 
 heatmap_ranges = {'min_spot': min_spot_price, 'max_spot': max_spot_price,
-                  'min_vol': min_vol, 'max_vol': max_vol}
+                  'min_vol': min_vol, 'max_vol': max_vol, 'resolution': resolution}
 
 call_purchase_price = st.sidebar.number_input("Call Purchase Price", min_value=0.0, value=90.0)
 put_purchase_price = st.sidebar.number_input("Put Purchase Price", min_value=0.0, value=90.0)
@@ -54,8 +87,8 @@ put_purchase_price = st.sidebar.number_input("Put Purchase Price", min_value=0.0
 
 opt = Option(underlying_symbol=ticker, strike_price=strike, expiration_date=expiry)
 
-call_results = engine.calculate_call(opt, volatility=vol, risk_free_rate=rate)
-put_results = engine.calculate_put(opt, volatility=vol, risk_free_rate=rate)
+results = engine.calculate_call_put(opt, volatility=vol, risk_free_rate=rate)
+call_results, put_results = results["call"], results["put"]
 
 call_col, put_col = st.columns([1, 1])
 
@@ -85,29 +118,23 @@ with put_col:
 st.markdown("<br><br>", unsafe_allow_html=True) 
 st.title("Options P&L Heatmaps")
 st.markdown("Visualize PNL across different spot prices and volatilities whilst considering purchase prices.")
+heatmap_field = st.selectbox("Heatmap values", list(HEATMAP_FIELDS), format_func=HEATMAP_FIELDS.get)
 call_hm_col, put_hm_col = st.columns([1, 1])
-
-with call_hm_col:
-    st.markdown("### Call Heatmap")
-    fig_call = plot_call_heatmap(
-        pricing_engine=engine,
-        option_template=opt,
-        rate=rate,
-        heatmap_ranges=heatmap_ranges,
-        purchase_price=call_purchase_price
-    )
-    st.pyplot(fig_call)
-
-with put_hm_col:
-    st.markdown("### Put Heatmap")
-    fig_put = plot_put_heatmap(
-        pricing_engine=engine,
-        option_template=opt,
-        rate=rate,
-        heatmap_ranges=heatmap_ranges,
-        purchase_price=put_purchase_price
-    )
-    st.pyplot(fig_put)
+heatmap_vol_range, heatmap_spot_range = get_heatmap_ranges(heatmap_ranges)
+# One mesh serves both sides and every field
+heatmap_grids = generate_option_grids(engine, opt, rate, heatmap_vol_range, heatmap_spot_range)
+
+# Figures are kept per session; a purchase-price change only updates their data
+if "heatmap_renderer" not in st.session_state:
+    st.session_state.heatmap_renderer = HeatmapRenderer()
+heatmap_renderer = st.session_state.heatmap_renderer
+
+for column, side, purchase_price in ((call_hm_col, "call", call_purchase_price),
+                                     (put_hm_col, "put", put_purchase_price)):
+    with column:
+        st.markdown(f"### {side.title()} Heatmap")
+        st.pyplot(heatmap_renderer.render(opt, rate, heatmap_grids, heatmap_vol_range, heatmap_spot_range,
+                                          side, heatmap_field, purchase_price), clear_figure=False)
 
 
 greeks = ["Delta", "Gamma", "Vega", "Theta", "Rho"]
@@ -0,0 +1,54 @@
+"""
+Throughput and peak memory of streaming bulk pricing.
+
+Writes synthetic option files of growing size, prices them to each output
+format and reports rows/second and the peak traced allocation, which should
+stay flat as the file grows since only one chunk is held at a time.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_bulk_pricing
+"""
+import os
+import tempfile
+import tracemalloc
+from datetime import date
+import numpy as np
+import pandas as pd
+from pricing.bulk_pricing import price_file
+
+ROW_COUNTS = (100_000, 300_000, 1_000_000)
+CHUNK_SIZE = 100_000
+
+def write_input(path, n_rows, seed=42):
+    """Write a synthetic CSV in chunks so generating it does not skew the memory figures."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_rows, CHUNK_SIZE):
+        n = min(CHUNK_SIZE, n_rows - start)
+        pd.DataFrame({
+            "spot_price": rng.uniform(50, 150, n),
+            "strike_price": rng.uniform(50, 150, n),
+            "time_to_expiration": rng.uniform(0.05, 2.0, n),
+            "volatility": rng.uniform(0.1, 0.6, n),
+            "option_type": rng.choice(["call", "put"], n),
+        }).to_csv(path, mode="a", header=start == 0, index=False)
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'rows':>10} {'format':>8} {'rows/s':>12} {'peak MB':>9}")
+        for n_rows in ROW_COUNTS:
+            input_path = os.path.join(directory, f"options_{n_rows}.csv")
+            write_input(input_path, n_rows)
+            for output_format in ("csv", "parquet", "npy"):
+                output_path = os.path.join(directory, f"priced_{n_rows}.{output_format}")
+                tracemalloc.start()
+                stats = price_file(input_path, output_path, CHUNK_SIZE, rate=0.02, valuation_date=date.today())
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"{n_rows:>10,} {output_format:>8} {stats['rows_per_second']:>12,.0f} {peak / 2**20:>9.1f}",
+                      flush=True)
+                os.remove(output_path)
+            os.remove(input_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Compare separate call/put pricing against the fused call+put path.
+
+Counts normal-CDF evaluations per option and times both paths, for the scalar
+and the batch APIs.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_fused_pricing
+"""
+import time
+from unittest.mock import patch
+import numpy as np
+import pricing.black_scholes as black_scholes
+from pricing.black_scholes import BlackScholesStrategy
+
+class FixedTimeOption:
+    def __init__(self, strike_price, time_to_expiration):
+        self.strike_price = strike_price
+        self.time = time_to_expiration
+
+    def time_to_expiration(self):
+        return self.time
+
+class CdfCounter:
+    """Wraps a CDF function and counts how many values it evaluates."""
+
+    def __init__(self, cdf):
+        self.cdf = cdf
+        self.evaluations = 0
+
+    def __call__(self, x):
+        self.evaluations += np.size(x)
+        return self.cdf(x)
+
+def count_scalar_cdfs(price_fn):
+    counter = CdfCounter(black_scholes.norm_cdf)
+    with patch.object(black_scholes, "norm_cdf", counter):
+        price_fn()
+    return counter.evaluations
+
+def count_batch_cdfs(price_fn):
+    counter = CdfCounter(black_scholes.ndtr)
+    with patch.object(black_scholes, "ndtr", counter):
+        price_fn()
+    return counter.evaluations
+
+def best_of(fn, repeats=5):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main(n_options=100_000, n_scalar=2_000, seed=42):
+    strategy = BlackScholesStrategy()
+    rng = np.random.default_rng(seed)
+    spots = rng.uniform(50, 150, n_options)
+    strikes = rng.uniform(50, 150, n_options)
+    times = rng.uniform(0.05, 2.0, n_options)
+    vols = rng.uniform(0.1, 0.6, n_options)
+    rate = 0.02
+
+    option = FixedTimeOption(100.0, 0.5)
+
+    def scalar_separate():
+        strategy.calculate_call_values(option, 105.0, 0.2, rate)
+        strategy.calculate_put_values(option, 105.0, 0.2, rate)
+
+    def scalar_fused():
+        strategy.calculate_call_put_values(option, 105.0, 0.2, rate)
+
+    def batch_separate():
+        strategy.calculate_call_values_batch(spots, strikes, times, vols, rate)
+        strategy.calculate_put_values_batch(spots, strikes, times, vols, rate)
+
+    def batch_fused():
+        strategy.calculate_call_put_values_batch(spots, strikes, times, vols, rate)
+
+    print("Normal-CDF evaluations per option (call + put):")
+    print(f"  scalar separate: {count_scalar_cdfs(scalar_separate)}")
+    print(f"  scalar fused:    {count_scalar_cdfs(scalar_fused)}")
+    print(f"  batch separate:  {count_batch_cdfs(batch_separate) / n_options:g}")
+    print(f"  batch fused:     {count_batch_cdfs(batch_fused) / n_options:g}")
+
+    def scalar_loop(fn):
+        return lambda: [fn() for _ in range(n_scalar)]
+
+    print(f"\nScalar timings ({n_scalar} options):")
+    print(f"  separate: {best_of(scalar_loop(scalar_separate)) * 1e6 / n_scalar:.2f} us/option")
+    print(f"  fused:    {best_of(scalar_loop(scalar_fused)) * 1e6 / n_scalar:.2f} us/option")
+    print(f"\nBatch timings ({n_options} options):")
+    print(f"  separate: {best_of(batch_separate) * 1e9 / n_options:.1f} ns/option")
+    print(f"  fused:    {best_of(batch_fused) * 1e9 / n_options:.1f} ns/option")
+
+if __name__ == "__main__":
+    main()
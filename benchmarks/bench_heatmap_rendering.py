@@ -0,0 +1,73 @@
+"""
+Rendering time of P&L heatmaps per mesh size.
+
+For each resolution, times three ways of producing the PNG that `st.pyplot`
+ships to the browser:
+
+- seaborn: a fresh seaborn heatmap with every cell annotated and labelled,
+  as the app drew before
+- first draw: a `HeatmapRenderer` figure drawn from scratch
+- price update: the same cached figure after only the purchase price changed
+
+Pricing the mesh is timed separately for reference.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_heatmap_rendering
+"""
+import io
+import time
+from datetime import date, timedelta
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import seaborn as sns
+from domain.option import Option
+from pricing.pricing_engine import PricingEngine
+from pricing.result_cache import ResultCache
+from ui.plots import HeatmapRenderer, generate_option_grids, get_heatmap_ranges
+
+RESOLUTIONS = (10, 20, 50, 100, 200, 500)
+SEABORN_MAX_RESOLUTION = 100  # Annotating beyond this takes minutes
+
+def to_png(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return buffer.getbuffer().nbytes
+
+def seaborn_heatmap(values, vol_range, spot_range):
+    fig, axes = plt.subplots(1, 1, figsize=(14, 6))
+    sns.heatmap(values, annot=True, fmt=".2f", xticklabels=np.round(spot_range, 2),
+                yticklabels=np.round(vol_range, 2), ax=axes,
+                cmap=sns.diverging_palette(10, 150, as_cmap=True), center=0)
+    to_png(fig)
+    plt.close(fig)
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1e3
+
+def main():
+    engine = PricingEngine(result_cache=ResultCache(max_size=0))
+    option = Option("AAPL", 100.0, date.today() + timedelta(days=90))
+    renderer = HeatmapRenderer(max_figures=1)
+    print(f"{'mesh':>9} {'pricing':>9} {'seaborn':>10} {'first draw':>11} {'price update':>13}")
+    for resolution in RESOLUTIONS:
+        ranges = {'min_spot': 80, 'max_spot': 120, 'min_vol': 0.1, 'max_vol': 0.5, 'resolution': resolution}
+        vol_range, spot_range = get_heatmap_ranges(ranges)
+        pricing = timed(generate_option_grids, engine, option, 0.02, vol_range, spot_range)
+        grids = generate_option_grids(engine, option, 0.02, vol_range, spot_range)
+        values = grids["call"]["price"] - 5.0
+
+        seaborn = (f"{timed(seaborn_heatmap, values, vol_range, spot_range):>8.1f}ms"
+                   if resolution <= SEABORN_MAX_RESOLUTION else f"{'skipped':>10}")
+        render = lambda price: to_png(renderer.render(option, 0.02, grids, vol_range, spot_range, "call", "pnl", price))
+        first = timed(render, 5.0)
+        update = timed(render, 6.0)
+        print(f"{resolution:>4}x{resolution:<4} {pricing:>7.2f}ms {seaborn} {first:>9.1f}ms {update:>11.1f}ms")
+    renderer.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Measure implied-volatility solver throughput and round-trip accuracy.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_implied_volatility
+"""
+import time
+import numpy as np
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.implied_volatility import ImpliedVolatilitySolver
+
+def make_quotes(strategy, n_options, seed):
+    rng = np.random.default_rng(seed)
+    spots = rng.uniform(50, 150, n_options)
+    strikes = spots * rng.uniform(0.7, 1.3, n_options)
+    times = rng.uniform(0.05, 2.0, n_options)
+    vols = rng.uniform(0.05, 1.0, n_options)
+    is_call = rng.random(n_options) < 0.5
+    values = strategy.calculate_call_put_values_batch(spots, strikes, times, vols, 0.02)
+    prices = np.where(is_call, values["call"]["price"], values["put"]["price"])
+    return prices, spots, strikes, times, vols, is_call, values["call"]["vega"]
+
+def main(sizes=(1_000, 10_000, 100_000, 1_000_000), seed=42):
+    strategy = BlackScholesStrategy()
+    solver = ImpliedVolatilitySolver(strategy)
+    print(f"{'options':>10} {'seconds':>10} {'options/s':>12} {'mean iters':>11} {'failed':>7} {'max |err|':>10}")
+    for n_options in sizes:
+        prices, spots, strikes, times, vols, is_call, vega = make_quotes(strategy, n_options, seed)
+        start = time.perf_counter()
+        result = solver.solve(prices, spots, strikes, times, 0.02, is_call)
+        elapsed = time.perf_counter() - start
+        converged = result["converged"]
+        # Quotes with negligible vega carry no volatility information; judge accuracy on the rest
+        informative = converged & (vega > 1e-3)
+        error = np.abs(result["volatility"][informative] - vols[informative]).max()
+        print(f"{n_options:>10} {elapsed:>10.4f} {n_options / elapsed:>12,.0f} "
+              f"{result['iterations'].mean():>11.2f} {(~converged).sum():>7} {error:>10.2e}")
+
+if __name__ == "__main__":
+    main()
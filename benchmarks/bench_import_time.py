@@ -0,0 +1,54 @@
+"""
+Measure cold import times against a start-up budget.
+
+Each module is imported in a fresh interpreter with `-X importtime`, and the
+cumulative time is compared against its budget. Heavy optional dependencies
+that a module should not load on import are reported as violations as well.
+Exits non-zero if any budget is exceeded or a heavy dependency is loaded.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_import_time
+"""
+import argparse
+import subprocess
+import sys
+
+# Cumulative import budget in milliseconds, including NumPy (~70 ms on its own)
+BUDGETS_MS = {
+    "pricing.black_scholes": 250,
+    "pricing.pricing_engine": 300,
+    "ui.plots": 250,
+}
+HEAVY_MODULES = ("scipy.stats", "yfinance", "pandas", "requests", "matplotlib", "seaborn")
+
+def measure(module: str, repeats: int = 3):
+    """Best cumulative import time in ms over `repeats` cold starts, and the heavy modules it loaded."""
+    script = f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    best, loaded = float("inf"), []
+    for _ in range(repeats):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                                   capture_output=True, text=True, check=True)
+        for line in completed.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                best = min(best, int(fields[1]) / 1e3)
+        loaded = [name for name in completed.stdout.strip().split(",") if name]
+    return best, loaded
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module, budget in BUDGETS_MS.items():
+        milliseconds, loaded = measure(module, args.repeats)
+        over = milliseconds > budget or bool(loaded)
+        failed |= over
+        print(f"{module:<26} {milliseconds:>8.1f} ms (budget {budget} ms)"
+              f"{'  loads ' + ', '.join(loaded) if loaded else ''}{'  OVER' if over else ''}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
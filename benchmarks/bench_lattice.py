@@ -0,0 +1,45 @@
+"""
+Time lattice pricing (price plus all Greeks) at several step counts.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_lattice
+"""
+import time
+import numpy as np
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.lattice import LatticeStrategy
+
+class FixedTimeOption:
+    def __init__(self, strike_price, time_to_expiration):
+        self.strike_price = strike_price
+        self.time = time_to_expiration
+
+    def time_to_expiration(self):
+        return self.time
+
+def best_of(fn, repeats=3):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main(step_counts=(100, 250, 500, 1000, 2000), n_strikes=50):
+    option = FixedTimeOption(100.0, 1.0)
+    strikes = np.linspace(80.0, 120.0, n_strikes)
+    european_put = BlackScholesStrategy().calculate_put_values(option, 100.0, 0.2, 0.01)["price"]
+
+    print(f"{'method':>10} {'steps':>6} {'1 strike ms':>12} {f'{n_strikes} strikes ms':>15} {'EU err':>10}")
+    for method in ("binomial", "trinomial"):
+        for steps in step_counts:
+            american = LatticeStrategy(steps=steps, method=method)
+            european = LatticeStrategy(steps=steps, method=method, american=False)
+            single = best_of(lambda: american.calculate_put_values(option, 100.0, 0.2, 0.01))
+            chain = best_of(lambda: american.calculate_put_values_batch(100.0, strikes, 1.0, 0.2, 0.01))
+            error = european.calculate_put_values(option, 100.0, 0.2, 0.01)["price"] - european_put
+            print(f"{method:>10} {steps:>6} {single * 1e3:>12.2f} {chain * 1e3:>15.2f} {error:>10.2e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measure the cost of the engine's instrumentation.
+
+Times the scalar fused call+put and a 10k-option batch four ways: the bare
+formulas with no instrumentation at all, the strategy with metrics disabled,
+the engine with metrics disabled, and the engine with metrics enabled. Each
+is reported with its per-call overhead against the bare formulas. Neither
+engine path consults the result cache, so the overhead is the instrumentation
+alone; the run fails if a cache lookup creeps back in.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_metrics_overhead
+"""
+from datetime import date, timedelta
+from math import exp, log, sqrt
+import numpy as np
+from benchmarks.suite import time_case
+from domain.option import Option
+from pricing.black_scholes import SQRT_2PI, BlackScholesStrategy, ndtr, norm_cdf, norm_pdf
+from pricing.metrics import Metrics
+from pricing.pricing_engine import PricingEngine
+
+ROUNDS = 3
+
+def bare_call_put(option, S, sigma, r):
+    """The scalar fused call+put with no metrics object in sight."""
+    T, K = option.time_to_expiration(), option.strike_price
+    sqrt_T = sqrt(T)
+    d1 = (log(S / K) + (r + sigma ** 2 / 2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    return BlackScholesStrategy._assemble_call_put(S, K, r, sigma, T, sqrt_T, exp(-r * T),
+                                                   norm_cdf(d1), norm_cdf(d2), norm_pdf(d1))
+
+def bare_call_put_batch(S, K, T, sigma, r):
+    """The batch fused call+put with no metrics object in sight; inputs must all be live."""
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + sigma ** 2 / 2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    return BlackScholesStrategy._assemble_call_put(S, K, r, sigma, T, sqrt_T, np.exp(-r * T),
+                                                   ndtr(d1), ndtr(d2), np.exp(-0.5 * d1 ** 2) / SQRT_2PI)
+
+def main():
+    option = Option(underlying_symbol="AAPL", strike_price=100.0, expiration_date=date.today() + timedelta(days=90))
+    rng = np.random.default_rng(42)
+    batch = (rng.uniform(50, 150, 10_000), rng.uniform(50, 150, 10_000),
+             rng.uniform(0.05, 2.0, 10_000), rng.uniform(0.1, 0.6, 10_000), 0.02)
+
+    disabled = PricingEngine()
+    enabled = PricingEngine(metrics=Metrics(enabled=True))
+    strategy = disabled.strategies['Black-Scholes']
+
+    cases = {
+        "scalar call+put": (lambda: bare_call_put(option, 105.0, 0.2, 0.01),
+                            lambda: strategy.calculate_call_put_values(option, 105.0, 0.2, 0.01),
+                            lambda: disabled.calculate_call_put(option, 0.2, 0.01, spot=105.0),
+                            lambda: enabled.calculate_call_put(option, 0.2, 0.01, spot=105.0)),
+        "batch call+put 10k": (lambda: bare_call_put_batch(*batch),
+                               lambda: strategy.calculate_call_put_values_batch(*batch),
+                               lambda: disabled.calculate_call_put_batch(*batch),
+                               lambda: enabled.calculate_call_put_batch(*batch)),
+    }
+    print(f"{'case':<20} {'bare':>11} {'strategy':>11} {'engine off':>11} {'engine on':>11} "
+          f"{'strat ovh':>10} {'off ovh':>10} {'on ovh':>10}")
+    for name, fns in cases.items():
+        # Interleaved rounds, keeping each variant's best, so drift on a busy machine hits all alike
+        times = [float("inf")] * len(fns)
+        for _ in range(ROUNDS):
+            times = [min(best, time_case(fn)) for best, fn in zip(times, fns)]
+        bare = times[0]
+        print(f"{name:<20} " + " ".join(f"{t * 1e6:>9.2f}us" for t in times) + " "
+              + " ".join(f"{(t - bare) * 1e9:>8.0f}ns" for t in times[1:]))
+    for engine in (disabled, enabled):
+        cache = engine.result_cache
+        if cache.hits + cache.misses:
+            raise RuntimeError("engine consulted the result cache; the overhead is not the timer's alone")
+
+if __name__ == "__main__":
+    main()
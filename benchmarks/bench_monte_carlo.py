@@ -0,0 +1,39 @@
+"""
+Measure Monte Carlo throughput (paths/second) against worker count.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_monte_carlo
+"""
+import os
+import time
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.monte_carlo import MonteCarloStrategy
+
+class FixedTimeOption:
+    def __init__(self, strike_price, time_to_expiration):
+        self.strike_price = strike_price
+        self.time = time_to_expiration
+
+    def time_to_expiration(self):
+        return self.time
+
+def main(n_paths=4_000_000, chunk_size=100_000, seed=42):
+    option = FixedTimeOption(100.0, 1.0)
+    reference = BlackScholesStrategy().calculate_call_values(option, 100.0, 0.2, 0.01)["price"]
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+
+    print(f"{n_paths:,} paths, chunk size {chunk_size:,}, Black-Scholes price {reference:.5f}")
+    print(f"{'workers':>8} {'seconds':>9} {'paths/s':>14} {'price':>9} {'std err':>9}")
+    for n_workers in worker_counts:
+        strategy = MonteCarloStrategy(n_paths=n_paths, chunk_size=chunk_size, n_workers=n_workers, seed=seed)
+        strategy.calculate_call_values(option, 100.0, 0.2, 0.01)  # Warm up the worker pool
+        start = time.perf_counter()
+        result = strategy.calculate_call_values(option, 100.0, 0.2, 0.01)
+        elapsed = time.perf_counter() - start
+        strategy.close()
+        print(f"{n_workers:>8} {elapsed:>9.3f} {n_paths / elapsed:>14,.0f} "
+              f"{result['price']:>9.5f} {result['std_error']:>9.5f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare a list of `Option` objects with an array-backed `OptionChain`.
+
+For a 100k-contract chain, reports construction time, memory per contract
+and the cost of computing every year fraction. Memory is the traced allocation
+of the container itself; symbol strings, floats and dates shared with the
+inputs are not counted for either side.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_option_chain
+"""
+import time
+import tracemalloc
+from datetime import date, timedelta
+import numpy as np
+from domain.option import Option
+from domain.option_chain import OptionChain
+
+N_CONTRACTS = 100_000
+
+def measure(build):
+    """Return (seconds, bytes) to build an object, timing and tracing separately."""
+    start = time.perf_counter()
+    build()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    built = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, size, built
+
+def main():
+    rng = np.random.default_rng(42)
+    today = date.today()
+    symbols = [f"SYM{i}" for i in rng.integers(0, 500, N_CONTRACTS)]
+    strikes = rng.uniform(50, 150, N_CONTRACTS).tolist()
+    offsets = rng.integers(1, 730, N_CONTRACTS).tolist()
+    expiries = [today + timedelta(days=days) for days in offsets]
+    expiry_column = np.datetime64(today, "D") + np.array(offsets)
+
+    list_seconds, list_bytes, options = measure(
+        lambda: [Option(s, k, e) for s, k, e in zip(symbols, strikes, expiries)])
+    chain_seconds, chain_bytes, chain = measure(
+        lambda: OptionChain(symbols, strikes, expiry_column, valuation_date=today))
+    from_options_seconds, _, _ = measure(lambda: OptionChain.from_options(options, valuation_date=today))
+
+    start = time.perf_counter()
+    [option.time_to_expiration(today) for option in options]
+    list_times = time.perf_counter() - start
+    start = time.perf_counter()
+    chain.time_to_expiration()
+    chain_times = time.perf_counter() - start
+    start = time.perf_counter()
+    chain.time_to_expiration()
+    cached_times = time.perf_counter() - start
+
+    print(f"{N_CONTRACTS:,} contracts")
+    print(f"{'':<26} {'build':>10} {'bytes/contract':>15} {'year fractions':>15}")
+    print(f"{'list of Option':<26} {list_seconds * 1e3:>8.1f}ms {list_bytes / N_CONTRACTS:>15.1f} "
+          f"{list_times * 1e3:>13.2f}ms")
+    print(f"{'OptionChain (columns)':<26} {chain_seconds * 1e3:>8.1f}ms {chain_bytes / N_CONTRACTS:>15.1f} "
+          f"{chain_times * 1e3:>13.2f}ms")
+    print(f"{'OptionChain.from_options':<26} {from_options_seconds * 1e3:>8.1f}ms")
+    print(f"{'cached year fractions':<26} {'':>10} {'':>15} {cached_times * 1e6:>13.2f}us")
+    print(f"column storage: {chain.nbytes / N_CONTRACTS:.1f} bytes/contract")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Scaling of sharded Black-Scholes batch pricing with the number of workers.
+
+Prices one large random batch in-process, then through `ParallelBatchExecutor`
+with a growing worker pool, and reports options per second and speed-up. For
+comparison, the largest pool also runs a naive `ProcessPoolExecutor.map` that
+pickles array chunks to the workers and their results back.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_parallel_batch --size 2000000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.parallel_batch import ParallelBatchExecutor
+
+def make_batch(size: int, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(50, 150, size), rng.uniform(50, 150, size), rng.uniform(0.01, 2.0, size),
+            rng.uniform(0.1, 0.6, size), 0.03)
+
+def best_time(price, inputs, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        price(*inputs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _price_pickled(spot, strike, time_to_expiration, volatility, risk_free_rate):
+    return BlackScholesStrategy().calculate_call_put_values_batch(spot, strike, time_to_expiration,
+                                                                  volatility, risk_free_rate)
+
+def pickled_map(pool, n_workers, inputs):
+    chunks = [np.array_split(x, n_workers) if np.ndim(x) else [x] * n_workers for x in inputs]
+    return list(pool.map(_price_pickled, *chunks))
+
+def main(argv=None):
+    default_workers = sorted({1, 2, *(2 ** i for i in range(1, 7) if 2 ** i <= (os.cpu_count() or 1))})
+    parser = argparse.ArgumentParser(description="Benchmark sharded batch pricing across worker counts.")
+    parser.add_argument("--size", type=int, default=2_000_000, help="options per batch")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    inputs = make_batch(args.size)
+    print(f"{args.size:,} options, {os.cpu_count()} CPUs, best of {args.repeats}")
+    print(f"{'workers':>8} {'seconds':>9} {'options/s':>14} {'speed-up':>9}")
+    baseline = best_time(BlackScholesStrategy().calculate_call_put_values_batch, inputs, args.repeats)
+    print(f"{'in-proc':>8} {baseline:>9.3f} {args.size / baseline:>14,.0f} {1.0:>8.2f}x")
+    for n_workers in args.workers:
+        if n_workers <= 1:
+            continue
+        with ParallelBatchExecutor(n_workers=n_workers, min_parallel_size=0) as executor:
+            executor.calculate_call_put_values_batch(*inputs)  # Start the workers and map the blocks
+            seconds = best_time(executor.calculate_call_put_values_batch, inputs, args.repeats)
+        print(f"{n_workers:>8} {seconds:>9.3f} {args.size / seconds:>14,.0f} {baseline / seconds:>8.2f}x")
+
+    n_workers = max(args.workers)
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            pickled_map(pool, n_workers, inputs)
+            seconds = best_time(lambda *x: pickled_map(pool, n_workers, x), inputs, args.repeats)
+        print(f"{'pickled':>8} {seconds:>9.3f} {args.size / seconds:>14,.0f} {baseline / seconds:>8.2f}x"
+              f"  ({n_workers} workers, arrays pickled both ways)")
+
+if __name__ == "__main__":
+    main()
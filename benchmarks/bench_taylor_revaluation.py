@@ -0,0 +1,78 @@
+"""
+Compare Taylor fast revaluation with full Black-Scholes repricing of a book.
+
+Replays a stream of small spot ticks (and a slow volatility drift) against a
+100k-position book. Reports time per revaluation, the fraction of positions
+that fell back to full repricing, and the price error of the approximation
+against a full reprice at the same inputs.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_taylor_revaluation
+"""
+import time
+from datetime import date, timedelta
+import numpy as np
+from domain.portfolio import Portfolio
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.portfolio_valuation import PortfolioValuation
+from pricing.taylor_valuation import TaylorValuation
+
+N_POSITIONS = 100_000
+N_SYMBOLS = 50
+N_TICKS = 50
+RATE = 0.03
+
+def make_portfolio(rng) -> Portfolio:
+    today = date.today()
+    return Portfolio(
+        symbols=[f"SYM{i}" for i in rng.integers(0, N_SYMBOLS, N_POSITIONS)],
+        strikes=rng.uniform(70, 130, N_POSITIONS),
+        expiries=[today + timedelta(days=int(days)) for days in rng.integers(7, 730, N_POSITIONS)],
+        is_call=rng.random(N_POSITIONS) < 0.5,
+        quantities=rng.integers(-50, 50, N_POSITIONS),
+    )
+
+def replay(portfolio, tick_size, rng, **thresholds):
+    strategy = BlackScholesStrategy()
+    spots = dict.fromkeys(portfolio.symbols, 100.0)
+    volatility = 0.25
+    fast = TaylorValuation(portfolio, strategy, volatility, RATE, **thresholds).revalue(spots)
+    full = PortfolioValuation(portfolio, strategy, volatility, RATE).revalue(spots)
+    fast_seconds = full_seconds = 0.0
+    errors = []
+    start_repriced = fast.repriced
+    for _ in range(N_TICKS):
+        spots = {symbol: spot * np.exp(tick_size * rng.standard_normal()) for symbol, spot in spots.items()}
+        volatility += 0.1 * tick_size * rng.standard_normal()
+        start = time.perf_counter()
+        fast.revalue(spots, volatility=volatility)
+        fast_seconds += time.perf_counter() - start
+        full.volatility = np.broadcast_to(volatility, (len(portfolio),))
+        start = time.perf_counter()
+        full.revalue(spots)
+        full_seconds += time.perf_counter() - start
+        errors.append(np.abs(fast.unit_values["price"] - full.unit_values["price"]))
+    errors = np.concatenate(errors)
+    return {
+        "fast_ms": fast_seconds / N_TICKS * 1e3,
+        "full_ms": full_seconds / N_TICKS * 1e3,
+        "fallback": (fast.repriced - start_repriced) / (N_TICKS * len(portfolio)),
+        "mean_error": float(errors.mean()),
+        "max_error": float(errors.max()),
+    }
+
+def main():
+    rng = np.random.default_rng(42)
+    portfolio = make_portfolio(rng)
+    print(f"{N_POSITIONS:,} positions on {N_SYMBOLS} underlyings, {N_TICKS} ticks of cumulative moves")
+    print(f"{'tick size':>10} {'full':>10} {'taylor':>10} {'speedup':>8} {'fallback':>9} "
+          f"{'mean err':>10} {'max err':>10}")
+    for tick_size in (0.0005, 0.001, 0.002, 0.005):
+        result = replay(portfolio, tick_size, rng)
+        print(f"{tick_size:>10.2%} {result['full_ms']:>8.2f}ms {result['fast_ms']:>8.2f}ms "
+              f"{result['full_ms'] / result['fast_ms']:>7.1f}x {result['fallback']:>9.1%} "
+              f"{result['mean_error']:>10.2e} {result['max_error']:>10.2e}")
+
+if __name__ == "__main__":
+    main()
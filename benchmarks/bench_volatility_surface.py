@@ -0,0 +1,53 @@
+"""
+Volatility-surface lookup and refit costs.
+
+Compares a vectorised surface lookup for a whole chain against a Python-level
+dict lookup per option, and an incremental single-expiry refit against
+rebuilding the whole surface.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_volatility_surface
+"""
+import numpy as np
+from benchmarks.suite import time_case
+from pricing.volatility_surface import VolatilitySurface
+
+SPOT = 100.0
+N_EXPIRIES = 24
+CHAIN_SIZES = (1_000, 10_000, 100_000)
+
+def synthetic_quotes(rng):
+    strikes = np.linspace(60, 140, 41)
+    k = np.log(strikes / SPOT)
+    return {expiry: (strikes, 0.2 + 0.05 / np.sqrt(expiry) * (k ** 2 - 0.2 * k) + rng.normal(0, 0.002, k.size))
+            for expiry in np.linspace(1 / 12, 2.0, N_EXPIRIES)}
+
+def main():
+    rng = np.random.default_rng(42)
+    quotes = synthetic_quotes(rng)
+    surface = VolatilitySurface(SPOT, n_times=512).fit(quotes)
+    expiries = list(quotes)
+
+    print(f"{'chain size':>10} {'surface':>12} {'dict/option':>12} {'speed-up':>9}")
+    for n in CHAIN_SIZES:
+        expiry_ids = rng.integers(0, N_EXPIRIES, n)
+        strike_ids = rng.integers(0, 41, n)
+        times = np.array(expiries)[expiry_ids]
+        strikes = quotes[expiries[0]][0][strike_ids]
+        table = {(expiry, float(strike)): float(vol)
+                 for expiry, (strike_row, vol_row) in quotes.items() for strike, vol in zip(strike_row, vol_row)}
+        pairs = list(zip(times.tolist(), strikes.tolist()))
+
+        vectorised = time_case(lambda: surface.lookup(strikes, times))
+        per_option = time_case(lambda: np.array([table[pair] for pair in pairs]))
+        print(f"{n:>10,} {vectorised * 1e3:>10.3f}ms {per_option * 1e3:>10.3f}ms {per_option / vectorised:>8.1f}x")
+
+    middle = expiries[N_EXPIRIES // 2]
+    refit = time_case(lambda: surface.update_expiry(middle, *quotes[middle]))
+    rebuild = time_case(lambda: VolatilitySurface(SPOT, n_times=512).fit(quotes))
+    print(f"single-expiry refit {refit * 1e3:.3f} ms vs full rebuild {rebuild * 1e3:.3f} ms "
+          f"({rebuild / refit:.1f}x)")
+
+if __name__ == "__main__":
+    main()
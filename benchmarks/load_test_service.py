@@ -0,0 +1,102 @@
+"""
+Load test of the pricing service with micro-batching on and off.
+
+Starts the service in a subprocess for each configuration, drives it from
+many concurrent keep-alive connections on localhost for a fixed duration,
+and reports client-side throughput and latency percentiles alongside the
+server's own batch statistics.
+
+Run from the repository root with:
+
+    python -m benchmarks.load_test_service --connections 64 --duration 5
+"""
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+import numpy as np
+
+OPTION = {"spot_price": 105.0, "strike_price": 100.0, "time_to_expiration": 0.5,
+          "volatility": 0.2, "risk_free_rate": 0.01}
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+async def read_response(reader) -> bytes:
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = next(int(line.split(b":")[1]) for line in head.split(b"\r\n") if line.lower().startswith(b"content-length"))
+    return await reader.readexactly(length)
+
+async def get(port, path):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+    body = await read_response(reader)
+    writer.close()
+    return json.loads(body)
+
+async def client(port, deadline, latencies, rng):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    while time.perf_counter() < deadline:
+        body = json.dumps({**OPTION, "spot_price": float(rng.uniform(80, 120))}).encode()
+        started = time.perf_counter()
+        writer.write(b"POST /price HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                     b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body)
+        await read_response(reader)
+        latencies.append(time.perf_counter() - started)
+    writer.close()
+
+async def drive(port, connections, duration):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    rngs = np.random.default_rng(42).spawn(connections)
+    started = time.perf_counter()
+    await asyncio.gather(*(client(port, deadline, latencies, rng) for rng in rngs))
+    elapsed = time.perf_counter() - started
+    return latencies, elapsed, await get(port, "/stats")
+
+async def wait_until_up(port, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return await get(port, "/health")
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+def run_configuration(window_ms, connections, duration):
+    port = free_port()
+    server = subprocess.Popen([sys.executable, "-m", "service.pricing_service", "--port", str(port),
+                               "--window-ms", str(window_ms)], stdout=subprocess.DEVNULL)
+    try:
+        async def scenario():
+            await wait_until_up(port)
+            return await drive(port, connections, duration)
+        return asyncio.run(scenario())
+    finally:
+        server.terminate()
+        server.wait()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--window-ms", type=float, default=2.0, help="batching window of the batched run")
+    args = parser.parse_args(argv)
+
+    print(f"{args.connections} connections, {args.duration:.0f} s per run")
+    print(f"{'batching':<22} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'batches':>9} {'mean batch':>11}")
+    for label, window_ms in (("off", 0.0), (f"on ({args.window_ms:g} ms window)", args.window_ms)):
+        latencies, elapsed, stats = run_configuration(window_ms, args.connections, args.duration)
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+        print(f"{label:<22} {len(latencies) / elapsed:>10,.0f} {p50:>8.2f} {p99:>8.2f} "
+              f"{stats['batches']:>9,} {stats['mean_batch_size']:>11.1f}", flush=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
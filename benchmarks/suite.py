@@ -0,0 +1,173 @@
+"""
+Benchmark suite for the pricing, grid and fetch hot paths.
+
+Every case uses fixed seeds and reports the best time per call over several
+repeats. Results are written as JSON and can be compared against a stored
+baseline, flagging cases that got slower by more than a threshold.
+
+Run from the repository root with:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.25
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+import numpy as np
+from data_fetchers.cached_fetcher import CachedFetcher
+from data_fetchers.yahoo_fetcher import YahooFetcher
+from domain.option import Option
+from domain.portfolio import Portfolio
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.pricing_engine import PricingEngine
+from pricing.result_cache import ResultCache
+
+BATCH_SIZES = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+GRID_SIZES = (10, 50, 200, 500)
+SEED = 42
+
+def _option(days=90, strike=100.0):
+    return Option(underlying_symbol="AAPL", strike_price=strike, expiration_date=date.today() + timedelta(days=days))
+
+def _uncached_engine():
+    """An engine whose result cache holds nothing, so every call reprices."""
+    return PricingEngine(result_cache=ResultCache(max_size=0))
+
+def _batch_inputs(n_options, seed=SEED):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(50, 150, n_options), rng.uniform(50, 150, n_options),
+            rng.uniform(0.05, 2.0, n_options), rng.uniform(0.1, 0.6, n_options), 0.02)
+
+def scalar_cases():
+    strategy = BlackScholesStrategy()
+    option = _option()
+    yield "bs_scalar_call", 1, lambda: strategy.calculate_call_values(option, 105.0, 0.2, 0.01)
+    yield "bs_scalar_put", 1, lambda: strategy.calculate_put_values(option, 105.0, 0.2, 0.01)
+    yield "bs_scalar_call_put", 1, lambda: strategy.calculate_call_put_values(option, 105.0, 0.2, 0.01)
+
+def grid_cases():
+    from ui.plots import generate_option_price_grid
+
+    engine = _uncached_engine()
+    cached = PricingEngine()
+    option = _option()
+    for size in GRID_SIZES:
+        vol_range, spot_range = np.linspace(0.1, 0.5, size), np.linspace(80, 120, size)
+        yield (f"grid_{size}x{size}", size * size,
+               lambda v=vol_range, s=spot_range: generate_option_price_grid(engine, option, "call", 0.01, 5.0, v, s))
+        yield (f"grid_{size}x{size}_result_cache", size * size,
+               lambda v=vol_range, s=spot_range: generate_option_price_grid(cached, option, "call", 0.01, 5.0, v, s))
+
+def engine_cases():
+    option = _option()
+    stubbed = patch.object(YahooFetcher, "fetch_ticker_price", return_value=105.0)
+    stubbed.start()
+    uncached = _uncached_engine()
+    uncached.data_provider = YahooFetcher()
+    cached = _uncached_engine()
+    cached.data_provider = CachedFetcher(YahooFetcher())
+    yield "engine_call_put_stub_fetch", 1, lambda: uncached.calculate_call_put(option, 0.2, 0.01)
+    yield "engine_call_put_cached_fetch", 1, lambda: cached.calculate_call_put(option, 0.2, 0.01)
+    yield "engine_call_put_given_spot", 1, lambda: cached.calculate_call_put(option, 0.2, 0.01, spot=105.0)
+    stubbed.stop()
+
+def batch_cases():
+    strategy = BlackScholesStrategy()
+    for n_options in BATCH_SIZES:
+        inputs = _batch_inputs(n_options)
+        yield f"bs_batch_call_{n_options}", n_options, lambda a=inputs: strategy.calculate_call_values_batch(*a)
+        yield f"bs_batch_call_put_{n_options}", n_options, lambda a=inputs: strategy.calculate_call_put_values_batch(*a)
+
+def implied_volatility_cases():
+    engine = PricingEngine()
+    for n_options in BATCH_SIZES:
+        spots, strikes, times, vols, rate = _batch_inputs(n_options)
+        prices = engine.calculate_call_batch(spots, strikes, times, vols, rate)["price"]
+        yield (f"implied_volatility_{n_options}", n_options,
+               lambda a=(prices, spots, strikes, times, rate, True): engine.calculate_implied_volatility(*a))
+
+def portfolio_cases():
+    engine = PricingEngine()
+    rng = np.random.default_rng(SEED)
+    for n_positions in BATCH_SIZES[3:]:
+        symbols = rng.choice([f"SYM{i}" for i in range(50)], n_positions)
+        expiries = np.datetime64(date.today(), "D") + rng.integers(7, 720, n_positions)
+        portfolio = Portfolio(symbols, rng.uniform(50, 150, n_positions), expiries,
+                              rng.random(n_positions) < 0.5, rng.integers(-10, 10, n_positions))
+        spots = {symbol: 100.0 for symbol in portfolio.symbols}
+        yield (f"portfolio_price_{n_positions}", n_positions,
+               lambda p=portfolio, s=spots: engine.price_portfolio(p, 0.25, 0.02, spots=s))
+
+CASES = (scalar_cases, grid_cases, engine_cases, batch_cases, implied_volatility_cases, portfolio_cases)
+
+def time_case(fn, repeats=5):
+    """Best seconds per call, calibrating the loop count so each repeat runs for at least 0.1s."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(np.ceil(number * 0.1 / 0.2)))
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+def run(pattern=None, repeats=5):
+    results = {}
+    for group in CASES:
+        for name, items, fn in group():
+            if pattern and pattern not in name:
+                continue
+            seconds = time_case(fn, repeats)
+            results[name] = {"seconds": seconds, "items": items, "seconds_per_item": seconds / items}
+            print(f"{name:<36} {seconds * 1e3:>12.4f} ms {seconds / items * 1e9:>12.1f} ns/item", flush=True)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+def compare_results(current: dict, baseline: dict, threshold: float) -> list:
+    """Return (name, baseline seconds, current seconds, ratio) for cases slower than 1 + threshold."""
+    regressions = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        ratio = result["seconds"] / reference["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append((name, reference["seconds"], result["seconds"], ratio))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="flag cases slower than the baseline by more than this fraction (default 0.25)")
+    parser.add_argument("--filter", help="only run cases whose name contains this string")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    current = run(args.filter, args.repeats)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(current, baseline, args.threshold)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before * 1e3:.4f} ms -> {after * 1e3:.4f} ms ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from data_fetchers.base_fetcher import BaseFetcher
+
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/"
+
+class AsyncQuoteFetcher(BaseFetcher):
+    """
+    Fetches spot prices concurrently over a bounded pool of worker threads.
+
+    Each worker keeps its own pooled HTTP session so connections are reused
+    between requests. Every request has a timeout and is retried with
+    exponential backoff on connection errors, timeouts and 429/5xx responses.
+    """
+
+    def __init__(self, base_url: str = YAHOO_CHART_URL, max_workers: int = 16, timeout: float = 5.0,
+                 retries: int = 2, backoff: float = 0.1):
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="quote-fetch")
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+
+    def fetch_ticker_price(self, symbol: str) -> float:
+        return self._executor.submit(self._fetch_with_retry, symbol).result()
+
+    def fetch_ticker_prices(self, symbols) -> dict:
+        futures = {symbol: self._executor.submit(self._fetch_with_retry, symbol) for symbol in dict.fromkeys(symbols)}
+        prices = {}
+        for symbol, future in futures.items():
+            try:
+                prices[symbol] = future.result()
+            except (ValueError, requests.RequestException):
+                continue
+        return prices
+
+    async def fetch_ticker_price_async(self, symbol: str) -> float:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._fetch_with_retry, symbol)
+
+    async def fetch_ticker_prices_async(self, symbols) -> dict:
+        """
+        Fetch many symbols concurrently.
+
+        :return: A dictionary with "prices" (symbol to price) for the symbols that
+            succeeded and "errors" (symbol to exception) for those that failed.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(*(self.fetch_ticker_price_async(symbol) for symbol in symbols),
+                                       return_exceptions=True)
+        prices, errors = {}, {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                errors[symbol] = result
+            else:
+                prices[symbol] = result
+        return {"prices": prices, "errors": errors}
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = "Mozilla/5.0"
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _fetch_with_retry(self, symbol: str) -> float:
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.metrics.increment("fetch_retry")
+            try:
+                with self.metrics.timer("http_request"):
+                    return self._request_price(symbol)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error = exc
+            except requests.HTTPError as exc:
+                status = exc.response.status_code
+                if status != 429 and status < 500:
+                    raise ValueError(f"Could not fetch price for ticker: {symbol}") from exc
+                error = exc
+            if attempt < self.retries:
+                time.sleep(self.backoff * 2 ** attempt)
+        raise error
+
+    def _request_price(self, symbol: str) -> float:
+        response = self._session().get(self.base_url + symbol, params={"range": "1d", "interval": "1d"},
+                                       timeout=self.timeout)
+        response.raise_for_status()
+        try:
+            result = response.json()["chart"]["result"][0]
+        except (ValueError, KeyError, IndexError, TypeError):
+            raise ValueError(f"Could not fetch price for ticker: {symbol}")
+        price = result.get("meta", {}).get("regularMarketPrice")
+        if price is None:
+            closes = [c for c in result.get("indicators", {}).get("quote", [{}])[0].get("close", []) if c is not None]
+            if not closes:
+                raise ValueError(f"Could not fetch price for ticker: {symbol}")
+            price = closes[-1]
+        return float(price)
@@ -1,9 +1,11 @@
 import abc
+from pricing.metrics import DISABLED_METRICS
 
 class BaseFetcher(abc.ABC):
     """
     Base class for data fetchers.
     """
+    metrics = DISABLED_METRICS
 
     def __init__(self, symbol: str):
         pass
@@ -12,4 +14,28 @@ class BaseFetcher(abc.ABC):
         """
         Fetch data for the given symbol.
         """
-        raise NotImplementedError("Subclasses should implement this method.")
\ No newline at end of file
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def fetch_ticker_prices(self, symbols) -> dict:
+        """
+        Fetch prices for many symbols, returning a dict of symbol to price.
+
+        Symbols that could not be priced are omitted. Subclasses that can fetch
+        several symbols in one round-trip should override this.
+        """
+        prices = {}
+        for symbol in dict.fromkeys(symbols):
+            try:
+                prices[symbol] = self.fetch_ticker_price(symbol)
+            except ValueError:
+                continue
+        return prices
+
+    def fetch_ohlc_history(self, symbol: str, start, end) -> dict:
+        """
+        Fetch daily OHLC bars for `symbol` between the `start` and `end` dates inclusive.
+
+        Returns a dict with a "date" datetime64[D] column and float64 "open", "high",
+        "low" and "close" columns, sorted by date. Days without trading have no row.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from data_fetchers.base_fetcher import BaseFetcher
+
+class CachedFetcher(BaseFetcher):
+    """
+    Caches spot prices from another fetcher.
+
+    Entries expire after `ttl` seconds and the least recently used symbol is
+    evicted once `max_size` entries are held. Concurrent requests for a symbol
+    that is already being fetched wait for that fetch instead of starting another.
+    """
+
+    def __init__(self, fetcher: BaseFetcher, ttl: float = 60.0, max_size: int = 256, clock=time.monotonic):
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def fetch_ticker_price(self, symbol: str) -> float:
+        with self._lock:
+            price = self._lookup(symbol)
+            if price is not None:
+                return price
+            future, owner = self._claim(symbol)
+        if not owner:
+            return future.result()
+        try:
+            price = self.fetcher.fetch_ticker_price(symbol)
+        except Exception as exc:
+            self._fail(symbol, future, exc)
+            raise
+        self._store(symbol, future, price)
+        return price
+
+    def fetch_ticker_prices(self, symbols) -> dict:
+        prices, owned, waiting = {}, {}, {}
+        with self._lock:
+            for symbol in dict.fromkeys(symbols):
+                price = self._lookup(symbol)
+                if price is not None:
+                    prices[symbol] = price
+                    continue
+                future, owner = self._claim(symbol)
+                (owned if owner else waiting)[symbol] = future
+
+        if owned:
+            try:
+                fetched = self.fetcher.fetch_ticker_prices(list(owned))
+            except Exception as exc:
+                for symbol, future in owned.items():
+                    self._fail(symbol, future, exc)
+                raise
+            for symbol, future in owned.items():
+                if symbol in fetched:
+                    self._store(symbol, future, fetched[symbol])
+                    prices[symbol] = fetched[symbol]
+                else:
+                    self._fail(symbol, future, ValueError(f"Could not fetch price for ticker: {symbol}"))
+
+        for symbol, future in waiting.items():
+            try:
+                prices[symbol] = future.result()
+            except ValueError:
+                continue
+        return prices
+
+    def invalidate(self, symbol: str = None):
+        """Drop the cached price for `symbol`, or every cached price if no symbol is given."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _lookup(self, symbol):
+        """Return a fresh cached price and record the hit or miss. Caller holds the lock."""
+        entry = self._entries.get(symbol)
+        if entry is not None and self.clock() - entry[1] < self.ttl:
+            self._entries.move_to_end(symbol)
+            self.hits += 1
+            self.metrics.increment("fetch_cache_hit")
+            return entry[0]
+        self.misses += 1
+        self.metrics.increment("fetch_cache_miss")
+        return None
+
+    def _claim(self, symbol):
+        """Return the in-flight future for `symbol` and whether the caller owns the fetch. Caller holds the lock."""
+        future = self._in_flight.get(symbol)
+        if future is not None:
+            return future, False
+        future = Future()
+        self._in_flight[symbol] = future
+        return future, True
+
+    def _store(self, symbol, future, price):
+        with self._lock:
+            self._entries[symbol] = (price, self.clock())
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            del self._in_flight[symbol]
+        future.set_result(price)
+
+    def _fail(self, symbol, future, exc):
+        with self._lock:
+            del self._in_flight[symbol]
+        future.set_exception(exc)
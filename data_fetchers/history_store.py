@@ -0,0 +1,168 @@
+import json
+import os
+import threading
+from datetime import date
+import numpy as np
+from data_fetchers.base_fetcher import BaseFetcher
+
+COLUMNS = ("date", "open", "high", "low", "close")
+ONE_DAY = np.timedelta64(1, "D")
+
+class HistoryStore(BaseFetcher):
+    """
+    Keeps daily OHLC history from another fetcher in a local columnar store.
+
+    Each symbol is a directory of one `.npy` file per column plus a small
+    `coverage.json` holding the date range that has been requested from the
+    wrapped fetcher. Coverage never reaches today, whose bar may still change.
+    Columns are opened memory-mapped, so loads read only the pages they touch.
+    A request only fetches the parts of its range outside the covered one, and
+    a fully covered request never reaches the wrapped fetcher.
+    Spot prices are passed straight through.
+    """
+
+    def __init__(self, fetcher: BaseFetcher, root: str):
+        """
+        :param fetcher: Fetcher providing `fetch_ohlc_history` for ranges not yet stored.
+        :param root: Directory holding the store; created if missing.
+        """
+        self.fetcher = fetcher
+        self.root = os.path.expanduser(root)
+        self.fetches = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    def fetch_ticker_price(self, symbol: str) -> float:
+        return self.fetcher.fetch_ticker_price(symbol)
+
+    def fetch_ticker_prices(self, symbols) -> dict:
+        return self.fetcher.fetch_ticker_prices(symbols)
+
+    def fetch_ohlc_history(self, symbol: str, start, end=None, include_today: bool = False) -> dict:
+        """
+        Return bars of `symbol` from `start` to `end` (default today) inclusive.
+
+        Bars up to yesterday are stored, fetching missing parts of the range
+        first, and returned as read-only views of the memory-mapped files, so a
+        repeat load never reaches the wrapped fetcher. Today's bar may belong to
+        a session still trading and is never stored; it is left out unless
+        `include_today` is set.
+
+        :param include_today: Also fetch the bars from today to `end`, on every
+            call. Best effort: if that fetch fails, only the stored bars are returned.
+        """
+        start = np.datetime64(start, "D")
+        end = np.datetime64(end or date.today(), "D")
+        settled = min(end, np.datetime64(date.today(), "D") - ONE_DAY)
+        columns = {"date": np.empty(0, dtype="datetime64[D]"), **{name: np.empty(0) for name in COLUMNS[1:]}}
+        if start <= settled:
+            with self._lock:
+                coverage = self._coverage(symbol)
+                missing = self._missing_ranges(coverage, start, settled)
+                if missing:
+                    self._extend(symbol, coverage, missing)
+                columns = self._load(symbol)
+            lower, upper = np.searchsorted(columns["date"], [start, settled + ONE_DAY])
+            columns = {name: column[lower:upper] for name, column in columns.items()}
+        if include_today and end > settled:
+            columns = self._append_unsettled(symbol, columns, max(start, settled + ONE_DAY), end)
+        return columns
+
+    def _append_unsettled(self, symbol, columns, start, end) -> dict:
+        """Fetch the bars from `start` to `end`, which are not stored, after the stored `columns`."""
+        self.fetches += 1
+        try:
+            fetched = self.fetcher.fetch_ohlc_history(symbol, start.item(), end.item())
+        except Exception:
+            return columns
+        dates = np.asarray(fetched["date"]).astype("datetime64[D]")
+        keep = (dates >= start) & (dates <= end)
+        tail = {name: np.concatenate([columns[name], dates[keep] if name == "date" else
+                                      np.asarray(fetched[name], dtype=np.float64)[keep]])
+                for name in COLUMNS}
+        for column in tail.values():
+            column.flags.writeable = False
+        return tail
+
+    def history_panel(self, symbols, start, end=None, include_today: bool = False) -> dict:
+        """
+        Aligned OHLC history of many symbols, for vectorised estimators.
+
+        `include_today` is passed on to `fetch_ohlc_history`.
+
+        :return: A dict with "symbols", the sorted union of trading "dates", and 2-D
+            (date x symbol) float64 arrays "open", "high", "low" and "close", NaN where
+            a symbol has no bar for a date.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        histories = [self.fetch_ohlc_history(symbol, start, end, include_today) for symbol in symbols]
+        dates = np.unique(np.concatenate([history["date"] for history in histories]))
+        panel = {"symbols": symbols, "dates": dates}
+        for name in COLUMNS[1:]:
+            panel[name] = np.full((len(dates), len(symbols)), np.nan)
+        for j, history in enumerate(histories):
+            rows = np.searchsorted(dates, history["date"])
+            for name in COLUMNS[1:]:
+                panel[name][rows, j] = history[name]
+        return panel
+
+    @staticmethod
+    def _missing_ranges(coverage, start, end) -> list:
+        """Date ranges to fetch so the covered range, kept contiguous, spans [start, end]."""
+        if coverage is None:
+            return [(start, end)]
+        covered_start, covered_end = coverage
+        missing = []
+        if start < covered_start:
+            missing.append((start, covered_start - ONE_DAY))
+        if end > covered_end:
+            missing.append((covered_end + ONE_DAY, end))
+        return missing
+
+    def _extend(self, symbol, coverage, missing):
+        fetched = []
+        for start, end in missing:
+            self.fetches += 1
+            fetched.append(self.fetcher.fetch_ohlc_history(symbol, start.item(), end.item()))
+        if coverage is not None:
+            fetched.append(self._load(symbol))
+        merged = {name: np.concatenate([np.asarray(history[name]) for history in fetched]) for name in COLUMNS}
+        merged["date"] = merged["date"].astype("datetime64[D]")
+        dates, first = np.unique(merged["date"], return_index=True)
+        bounds = [day for day_range in missing for day in day_range] + list(coverage or ())
+        self._write(symbol, {name: column[first] for name, column in merged.items()}, min(bounds), max(bounds))
+
+    def _directory(self, symbol: str) -> str:
+        return os.path.join(self.root, symbol)
+
+    def _coverage(self, symbol):
+        try:
+            with open(os.path.join(self._directory(symbol), "coverage.json")) as f:
+                coverage = json.load(f)
+        except FileNotFoundError:
+            return None
+        return np.datetime64(coverage["start"], "D"), np.datetime64(coverage["end"], "D")
+
+    def _load(self, symbol) -> dict:
+        directory = self._directory(symbol)
+        return {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in COLUMNS}
+
+    def _write(self, symbol, columns, start, end):
+        """
+        Replace the stored columns, then the coverage.
+
+        Every file is written beside its target before any is renamed over it,
+        which narrows a torn update to the renames themselves; the coverage is
+        renamed last, so a store that has data beyond its coverage refetches it.
+        """
+        directory = self._directory(symbol)
+        os.makedirs(directory, exist_ok=True)
+        paths = [os.path.join(directory, f"{name}.npy") for name in COLUMNS]
+        for name, path in zip(COLUMNS, paths):
+            with open(path + ".tmp", "wb") as f:
+                np.save(f, np.ascontiguousarray(columns[name], dtype="datetime64[D]" if name == "date" else np.float64))
+        path = os.path.join(directory, "coverage.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump({"start": str(start), "end": str(end)}, f)
+        for path in paths + [path]:
+            os.replace(path + ".tmp", path)
@@ -1,15 +1,18 @@
 from data_fetchers.base_fetcher import BaseFetcher
-import yfinance as yf
 
 class YahooFetcher(BaseFetcher):
     """
     Fetches data from Yahoo Finance.
+
+    yfinance (and pandas with it) is imported on the first fetch rather than
+    at import time, since it dominates the package's start-up cost.
     """
 
     def __init__(self):
         pass
 
     def fetch_ticker_price(self, ticker: str) -> float:
+        import yfinance as yf
         stock = yf.Ticker(ticker)
         data = stock.history(period="1d")
         if not data.empty:
@@ -19,4 +22,40 @@ class YahooFetcher(BaseFetcher):
         price = info.get('currentPrice') or info.get('regularMarketPrice')
         if price is None:
             raise ValueError(f"Could not fetch price for ticker: {ticker}")
-        return float(price)
\ No newline at end of file
+        return float(price)
+
+    def fetch_ohlc_history(self, symbol: str, start, end) -> dict:
+        import numpy as np
+        import yfinance as yf
+        # yfinance treats `end` as exclusive
+        end = np.datetime64(end, "D") + 1
+        data = yf.Ticker(symbol).history(start=str(np.datetime64(start, "D")), end=str(end), auto_adjust=False)
+        history = {"date": np.array([day.date() for day in data.index], dtype="datetime64[D]")}
+        for column in ("Open", "High", "Low", "Close"):
+            history[column.lower()] = data[column].to_numpy(dtype=np.float64) if len(data) else np.empty(0)
+        return history
+
+    def fetch_ticker_prices(self, symbols) -> dict:
+        """Fetch last closes for many tickers in a single download, falling back per ticker for gaps."""
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        import yfinance as yf
+        data = yf.download(symbols, period="1d", progress=False, auto_adjust=False, threads=False)
+        prices = {}
+        if data is not None and not data.empty:
+            closes = data['Close']
+            if not hasattr(closes, 'columns'):
+                closes = closes.to_frame(symbols[0])
+            for symbol in symbols:
+                if symbol in closes.columns:
+                    series = closes[symbol].dropna()
+                    if not series.empty:
+                        prices[symbol] = float(series.iloc[-1])
+        for symbol in symbols:
+            if symbol not in prices:
+                try:
+                    prices[symbol] = self.fetch_ticker_price(symbol)
+                except ValueError:
+                    continue
+        return prices
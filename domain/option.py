@@ -1,7 +1,7 @@
 from datetime import date
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class Option:
     underlying_symbol: str
     strike_price: float
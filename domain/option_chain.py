@@ -0,0 +1,102 @@
+from datetime import date
+import numpy as np
+from domain.option import Option
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+class OptionChain:
+    """
+    Many option contracts stored as typed NumPy columns.
+
+    Underlyings are stored once and referenced by int32 ids, strikes as float64
+    and expiries as datetime64[D]. Years to expiration for the whole chain are
+    computed in one pass against a pinned valuation date and cached until that
+    date changes.
+    """
+
+    def __init__(self, symbols, strikes, expiries, valuation_date: date = None):
+        symbols = np.asarray(symbols, dtype=object).astype(str)
+        underlyings, symbol_ids = np.unique(symbols, return_inverse=True)
+        self.underlyings = [str(symbol) for symbol in underlyings]
+        self.symbol_ids = symbol_ids.astype(np.int32)
+        self.strikes = np.asarray(strikes, dtype=np.float64)
+        self.expiries = np.asarray(expiries, dtype="datetime64[D]")
+        if not len(self.symbol_ids) == len(self.strikes) == len(self.expiries):
+            raise ValueError("Symbols, strikes and expiries must have the same length.")
+        self._valuation_date = valuation_date or date.today()
+        self._times = None
+
+    @classmethod
+    def from_options(cls, options, valuation_date: date = None):
+        """Build a chain from `Option` objects."""
+        options = list(options)
+        expiries = [option.expiration_date for option in options]
+        try:
+            # Day ordinals convert ~10x faster than datetime64 parsing of date objects
+            days = np.fromiter((expiry.toordinal() for expiry in expiries), np.int64, len(expiries))
+            expiries = (days - _EPOCH_ORDINAL).astype("datetime64[D]")
+        except AttributeError:
+            pass
+        return cls(
+            symbols=[option.underlying_symbol for option in options],
+            strikes=np.fromiter((option.strike_price for option in options), np.float64, len(options)),
+            expiries=expiries,
+            valuation_date=valuation_date,
+        )
+
+    @property
+    def valuation_date(self) -> date:
+        return self._valuation_date
+
+    @valuation_date.setter
+    def valuation_date(self, valuation_date: date):
+        if valuation_date != self._valuation_date:
+            self._valuation_date = valuation_date
+            self._times = None
+
+    @property
+    def symbols(self) -> np.ndarray:
+        """The underlying symbol of every contract."""
+        return np.asarray(self.underlyings, dtype=object)[self.symbol_ids]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the per-contract columns."""
+        return self.symbol_ids.nbytes + self.strikes.nbytes + self.expiries.nbytes
+
+    def __len__(self):
+        return len(self.strikes)
+
+    def __getitem__(self, index):
+        """An `Option` for an integer index, or a sub-chain for a slice, mask or index array."""
+        if isinstance(index, (int, np.integer)):
+            return Option(underlying_symbol=self.underlyings[self.symbol_ids[index]],
+                          strike_price=float(self.strikes[index]),
+                          expiration_date=self.expiries[index].item())
+        chain = object.__new__(OptionChain)
+        chain.underlyings = self.underlyings
+        chain.symbol_ids = self.symbol_ids[index]
+        chain.strikes = self.strikes[index]
+        chain.expiries = self.expiries[index]
+        chain._valuation_date = self._valuation_date
+        chain._times = None
+        if self._times is not None:
+            chain._times = self._times[index]
+            chain._times.flags.writeable = False
+        return chain
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def time_to_expiration(self) -> np.ndarray:
+        """
+        Years to expiration of every contract as of the valuation date.
+
+        Computed once per valuation date; the returned array is read-only.
+        """
+        if self._times is None:
+            days = (self.expiries - np.datetime64(self._valuation_date, "D")).astype(np.float64)
+            self._times = days / 365.0
+            self._times.flags.writeable = False
+        return self._times
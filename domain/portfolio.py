@@ -0,0 +1,69 @@
+from datetime import date
+import numpy as np
+
+class Portfolio:
+    """
+    A book of option positions stored as contiguous NumPy columns.
+
+    Positions are ordered by underlying so that each underlying's positions form
+    one contiguous slice of every column. `order` maps that internal order back
+    to the order the positions were given in: internal position i is input
+    position `order[i]`. Per-position inputs are permuted into internal order
+    with `per_position` and per-position results back with `in_input_order`.
+    """
+
+    def __init__(self, symbols, strikes, expiries, is_call, quantities):
+        symbols = np.asarray(symbols, dtype=object)
+        self.symbols, symbol_ids = np.unique(symbols.astype(str), return_inverse=True)
+        self.symbols = [str(symbol) for symbol in self.symbols]
+        order = np.argsort(symbol_ids, kind="stable")
+        self.order = order
+        self.inverse_order = np.argsort(order)
+
+        self.symbol_ids = symbol_ids[order].astype(np.int32)
+        self.strikes = np.asarray(strikes, dtype=np.float64)[order]
+        self.expiries = np.asarray(expiries, dtype="datetime64[D]")[order]
+        self.is_call = np.asarray(is_call, dtype=bool)[order]
+        self.quantities = np.asarray(quantities, dtype=np.float64)[order]
+
+        bounds = np.searchsorted(self.symbol_ids, np.arange(len(self.symbols) + 1))
+        self._slices = {symbol: slice(bounds[i], bounds[i + 1]) for i, symbol in enumerate(self.symbols)}
+
+    @classmethod
+    def from_options(cls, options, quantities, is_call):
+        """Build a portfolio from `Option` objects and matching quantities and call/put flags."""
+        options = list(options)
+        return cls(
+            symbols=[option.underlying_symbol for option in options],
+            strikes=[option.strike_price for option in options],
+            expiries=[option.expiration_date for option in options],
+            is_call=is_call,
+            quantities=quantities,
+        )
+
+    def __len__(self):
+        return len(self.strikes)
+
+    def per_position(self, values) -> np.ndarray:
+        """Broadcast a scalar or one value per position, given in input order, to internal order."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 0:
+            return np.broadcast_to(values, (len(self),))
+        return np.broadcast_to(values, (len(self),))[self.order]
+
+    def in_input_order(self, column) -> np.ndarray:
+        """Reorder a per-position column from internal order to the order positions were given in."""
+        return np.asarray(column)[self.inverse_order]
+
+    def positions_for(self, symbol: str) -> slice:
+        """Return the slice of the columns holding positions on `symbol`."""
+        return self._slices[symbol]
+
+    def time_to_expiration(self, today: date = None) -> np.ndarray:
+        """
+        Calculate the time to expiration in years for every position.
+        """
+        if today is None:
+            today = date.today()
+        days = (self.expiries - np.datetime64(today, "D")).astype(np.float64)
+        return days / 365.0
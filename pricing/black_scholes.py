@@ -1,8 +1,55 @@
-from math import log, sqrt, exp
-from scipy.stats import norm
+from copy import copy
+from math import erfc, exp, log, pi, sqrt
+import numpy as np
 from pricing.strategy_base import PricingStrategy
 
+SQRT_2 = sqrt(2.0)
+SQRT_2PI = sqrt(2.0 * pi)
+
+def norm_cdf(x: float) -> float:
+    """Standard normal CDF of a scalar, via math.erfc so the scalar path needs no SciPy."""
+    return 0.5 * erfc(-x / SQRT_2)
+
+def norm_pdf(x: float) -> float:
+    return exp(-0.5 * x * x) / SQRT_2PI
+
+def ndtr(x):
+    """Standard normal CDF of an array; scipy.special is imported on first use."""
+    from scipy.special import ndtr as _ndtr
+    return _ndtr(x)
+
+def _intermediates(S, K, r, sigma, T):
+    """sqrt(T), the discount factor, N(d1), N(d2) and n(d1) of a scalar option, in one call."""
+    sqrt_T = sqrt(T)
+    d1 = (log(S / K) + (r + sigma ** 2 / 2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    return sqrt_T, exp(-r * T), norm_cdf(d1), norm_cdf(d2), norm_pdf(d1)
+
+def _derivatives(S, K, r, sigma, T):
+    sqrt_T = sqrt(T)
+    d1 = (log(S / K) + (r + sigma ** 2 / 2) * T) / (sigma * sqrt_T)
+    return d1, d1 - sigma * sqrt_T
+
+def _common_factors(d1, d2):
+    return norm_cdf(d1), norm_cdf(d2), norm_pdf(d1)
+
+def _derivatives_batch(S, K, r, sigma, T):
+    sigma_sqrt_T = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + sigma ** 2 / 2) * T) / sigma_sqrt_T
+    return d1, d1 - sigma_sqrt_T
+
+def _common_factors_batch(d1, d2):
+    return ndtr(d1), ndtr(d2), np.exp(-0.5 * d1 ** 2) / SQRT_2PI
+
 class BlackScholesStrategy(PricingStrategy):
+    """
+    Closed-form Black-Scholes pricing of European options, one at a time or in arrays.
+
+    With metrics enabled the d1/d2, CDF and assembly stages are timed separately;
+    disabled, each method checks once and runs the same stages untimed, so the
+    instrumentation costs nothing measurable.
+    """
+
     def calculate_call_values(self, option, spot_price: float, volatility: float, risk_free_rate: float) -> dict:
         """
         Calculate the price of the option using the Black-Scholes formula.
@@ -16,28 +63,14 @@ class BlackScholesStrategy(PricingStrategy):
         T = option.time_to_expiration()
         if T <= 0:
             return {"price": 0.0, "delta": 0.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0, "rho": 0.0}
-        
+
         S, K, r, sigma = spot_price, option.strike_price, risk_free_rate, volatility
+        if not self.metrics.enabled:
+            return self._assemble_call(S, K, r, sigma, T, *_intermediates(S, K, r, sigma, T))
         d1, d2 = self.calculate_derivatives(S, K, r, sigma, T)
         N_d1, N_d2, n_d1 = self.calculate_common_factors(d1, d2)
-
-        price = S * N_d1 - K * exp(-r * T) * N_d2
-        delta = N_d1
-        theta = -(S * n_d1 * sigma) / (2 * sqrt(T)) - r * K * exp(-r * T) * N_d2
-        rho = K * T * exp(-r * T) * N_d2
-        gamma = n_d1 / (S * sigma * sqrt(T))
-        vega = S * n_d1 * sqrt(T) / 100 # Convert to per 1% change in volatility
-        theta /= 365  # Convert to per day
-
-        return {
-            "price": price,
-            "delta": delta,
-            "gamma": gamma,
-            "vega": vega,
-            "theta": theta,
-            "rho": rho
-        }
-    
+        with self.metrics.timer("assembly"):
+            return self._assemble_call(S, K, r, sigma, T, sqrt(T), exp(-r * T), N_d1, N_d2, n_d1)
 
     def calculate_put_values(self, option, spot_price: float, volatility: float, risk_free_rate: float) -> dict:
         """
@@ -52,34 +85,203 @@ class BlackScholesStrategy(PricingStrategy):
         T = option.time_to_expiration()
         if T <= 0:
             return {"price": 0.0, "delta": 0.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0, "rho": 0.0}
-        
+
+        S, K, r, sigma = spot_price, option.strike_price, risk_free_rate, volatility
+        if not self.metrics.enabled:
+            return self._assemble_put(S, K, r, sigma, T, *_intermediates(S, K, r, sigma, T))
+        d1, d2 = self.calculate_derivatives(S, K, r, sigma, T)
+        N_d1, N_d2, n_d1 = self.calculate_common_factors(d1, d2)
+        with self.metrics.timer("assembly"):
+            return self._assemble_put(S, K, r, sigma, T, sqrt(T), exp(-r * T), N_d1, N_d2, n_d1)
+
+    def calculate_call_put_values(self, option, spot_price: float, volatility: float, risk_free_rate: float) -> dict:
+        """
+        Calculate call and put values together from one set of shared intermediates.
+
+        d1, d2, N(d1), N(d2), n(d1), the discount factor and sqrt(T) are evaluated once;
+        the put side uses N(-d) = 1 - N(d) rather than further CDF evaluations.
+
+        :param option: The option to price.
+        :param spot_price: The current spot price of the underlying asset.
+        :param volatility: The volatility of the underlying asset.
+        :param risk_free_rate: The risk-free interest rate.
+        :return: A dictionary with "call" and "put" entries, each as returned by the single-sided methods.
+        """
+        T = option.time_to_expiration()
+        if T <= 0:
+            zeros = {"price": 0.0, "delta": 0.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0, "rho": 0.0}
+            return {"call": zeros, "put": dict(zeros)}
+
         S, K, r, sigma = spot_price, option.strike_price, risk_free_rate, volatility
+        if not self.metrics.enabled:
+            return self._assemble_call_put(S, K, r, sigma, T, *_intermediates(S, K, r, sigma, T))
         d1, d2 = self.calculate_derivatives(S, K, r, sigma, T)
-        N_d1, _, n_d1 = self.calculate_common_factors(d1, d2)
-        
-        price = K * exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
-        delta = N_d1 - 1.0
-        theta = -(S * n_d1 * sigma) / (2 * sqrt(T)) + r * K * exp(-r * T) * norm.cdf(-d2)
-        rho = -K * T * exp(-r * T) * norm.cdf(-d2)
-        gamma = n_d1 / (S * sigma * sqrt(T))
-        vega = S * n_d1 * sqrt(T) / 100 # Convert to per 1% change in volatility
-        theta /= 365  # Convert to per day
-        
+        N_d1, N_d2, n_d1 = self.calculate_common_factors(d1, d2)
+        with self.metrics.timer("assembly"):
+            return self._assemble_call_put(S, K, r, sigma, T, sqrt(T), exp(-r * T), N_d1, N_d2, n_d1)
+
+    def calculate_derivatives(self, S, K, r, sigma, T):
+        if not self.metrics.enabled:
+            return _derivatives(S, K, r, sigma, T)
+        with self.metrics.timer("d1_d2"):
+            return _derivatives(S, K, r, sigma, T)
+
+    def calculate_common_factors(self, d1, d2):
+        if not self.metrics.enabled:
+            return _common_factors(d1, d2)
+        with self.metrics.timer("cdf"):
+            return _common_factors(d1, d2)
+
+    def calculate_call_values_batch(self, spot_price, strike_price, time_to_expiration,
+                                    volatility, risk_free_rate) -> dict:
+        """
+        Calculate call prices and Greeks for arrays of inputs in one vectorised pass.
+
+        All inputs are broadcast against each other following NumPy rules.
+
+        :param spot_price: Spot prices of the underlying asset.
+        :param strike_price: Strike prices of the options.
+        :param time_to_expiration: Times to expiration in years.
+        :param volatility: Volatilities of the underlying asset.
+        :param risk_free_rate: Risk-free interest rates.
+        :return: A dictionary mapping "price" and each Greek to an array of the broadcast shape.
+        """
+        return self._batch(self._assemble_call, spot_price, strike_price, time_to_expiration,
+                           volatility, risk_free_rate)
+
+    def calculate_put_values_batch(self, spot_price, strike_price, time_to_expiration,
+                                   volatility, risk_free_rate) -> dict:
+        """
+        Calculate put prices and Greeks for arrays of inputs in one vectorised pass.
+
+        All inputs are broadcast against each other following NumPy rules.
+
+        :param spot_price: Spot prices of the underlying asset.
+        :param strike_price: Strike prices of the options.
+        :param time_to_expiration: Times to expiration in years.
+        :param volatility: Volatilities of the underlying asset.
+        :param risk_free_rate: Risk-free interest rates.
+        :return: A dictionary mapping "price" and each Greek to an array of the broadcast shape.
+        """
+        return self._batch(self._assemble_put, spot_price, strike_price, time_to_expiration,
+                           volatility, risk_free_rate)
+
+    def calculate_call_put_values_batch(self, spot_price, strike_price, time_to_expiration,
+                                        volatility, risk_free_rate) -> dict:
+        """
+        Calculate call and put values for arrays of inputs from one set of shared intermediates.
+
+        :param spot_price: Spot prices of the underlying asset.
+        :param strike_price: Strike prices of the options.
+        :param time_to_expiration: Times to expiration in years.
+        :param volatility: Volatilities of the underlying asset.
+        :param risk_free_rate: Risk-free interest rates.
+        :return: A dictionary with "call" and "put" entries, each as returned by the single-sided batch methods.
+        """
+        S, K, T, sigma, r, live = self._prepare_batch(spot_price, strike_price, time_to_expiration,
+                                                      volatility, risk_free_rate)
+        results = self._batch_stages(self._assemble_call_put, S, K, T, sigma, r)
+        return {side: self._mask_expired(values, live) for side, values in results.items()}
+
+    def calculate_derivatives_batch(self, S, K, r, sigma, T):
+        if not self.metrics.enabled:
+            return _derivatives_batch(S, K, r, sigma, T)
+        with self.metrics.timer("d1_d2"):
+            return _derivatives_batch(S, K, r, sigma, T)
+
+    def calculate_common_factors_batch(self, d1, d2):
+        if not self.metrics.enabled:
+            return _common_factors_batch(d1, d2)
+        with self.metrics.timer("cdf"):
+            return _common_factors_batch(d1, d2)
+
+    def _batch(self, assemble, spot_price, strike_price, time_to_expiration, volatility, risk_free_rate) -> dict:
+        S, K, T, sigma, r, live = self._prepare_batch(spot_price, strike_price, time_to_expiration,
+                                                      volatility, risk_free_rate)
+        return self._mask_expired(self._batch_stages(assemble, S, K, T, sigma, r), live)
+
+    def _batch_stages(self, assemble, S, K, T, sigma, r) -> dict:
+        """Run the d1/d2, CDF and assembly stages over prepared arrays, timing each when metrics are on."""
+        if not self.metrics.enabled:
+            return assemble(S, K, r, sigma, T, np.sqrt(T), np.exp(-r * T),
+                            *_common_factors_batch(*_derivatives_batch(S, K, r, sigma, T)))
+        d1, d2 = self.calculate_derivatives_batch(S, K, r, sigma, T)
+        N_d1, N_d2, n_d1 = self.calculate_common_factors_batch(d1, d2)
+        with self.metrics.timer("assembly"):
+            return assemble(S, K, r, sigma, T, np.sqrt(T), np.exp(-r * T), N_d1, N_d2, n_d1)
+
+    @staticmethod
+    def _assemble_call(S, K, r, sigma, T, sqrt_T, discount, N_d1, N_d2, n_d1) -> dict:
+        """Build call results from the shared intermediates; works on floats and arrays."""
+        K_discount = K * discount
         return {
-            "price": price,
-            "delta": delta,
+            "price": S * N_d1 - K_discount * N_d2,
+            "delta": N_d1,
+            "gamma": n_d1 / (S * sigma * sqrt_T),
+            "vega": S * n_d1 * sqrt_T / 100,  # Convert to per 1% change in volatility
+            "theta": (-(S * n_d1 * sigma) / (2 * sqrt_T) - r * K_discount * N_d2) / 365,  # Convert to per day
+            "rho": K_discount * T * N_d2
+        }
+
+    @staticmethod
+    def _assemble_put(S, K, r, sigma, T, sqrt_T, discount, N_d1, N_d2, n_d1) -> dict:
+        """Build put results from the shared intermediates, using N(-d) = 1 - N(d)."""
+        K_discount = K * discount
+        N_minus_d1, N_minus_d2 = 1.0 - N_d1, 1.0 - N_d2
+        return {
+            "price": K_discount * N_minus_d2 - S * N_minus_d1,
+            "delta": N_d1 - 1.0,
+            "gamma": n_d1 / (S * sigma * sqrt_T),
+            "vega": S * n_d1 * sqrt_T / 100,
+            "theta": (-(S * n_d1 * sigma) / (2 * sqrt_T) + r * K_discount * N_minus_d2) / 365,
+            "rho": -K_discount * T * N_minus_d2
+        }
+
+    @staticmethod
+    def _assemble_call_put(S, K, r, sigma, T, sqrt_T, discount, N_d1, N_d2, n_d1) -> dict:
+        """Build call and put results from shared intermediates; works on floats and arrays."""
+        K_discount = K * discount
+        N_minus_d1, N_minus_d2 = 1.0 - N_d1, 1.0 - N_d2
+        decay = -(S * n_d1 * sigma) / (2 * sqrt_T)
+        gamma = n_d1 / (S * sigma * sqrt_T)
+        vega = S * n_d1 * sqrt_T / 100  # Convert to per 1% change in volatility
+
+        call = {
+            "price": S * N_d1 - K_discount * N_d2,
+            "delta": N_d1,
             "gamma": gamma,
             "vega": vega,
-            "theta": theta,
-            "rho": rho
+            "theta": (decay - r * K_discount * N_d2) / 365,  # Convert to per day
+            "rho": K_discount * T * N_d2
         }
-    
-    def calculate_derivatives(self, S, K, r, sigma, T):
-        d1 = (log(S / K) + (r + sigma ** 2 / 2) * T) / (sigma * sqrt(T))
-        d2 = d1 - sigma * sqrt(T)
-        return d1, d2
+        put = {
+            "price": K_discount * N_minus_d2 - S * N_minus_d1,
+            "delta": N_d1 - 1.0,
+            # Own arrays, so writing to one side's Greeks cannot change the other's
+            "gamma": copy(gamma),
+            "vega": copy(vega),
+            "theta": (decay + r * K_discount * N_minus_d2) / 365,
+            "rho": -K_discount * T * N_minus_d2
+        }
+        return {"call": call, "put": put}
 
-    def calculate_common_factors(self, d1, d2):
-        N_d1, N_d2 = norm.cdf(d1), norm.cdf(d2)
-        n_d1 = norm.pdf(d1)
-        return N_d1, N_d2, n_d1
\ No newline at end of file
+    @staticmethod
+    def _prepare_batch(spot_price, strike_price, time_to_expiration, volatility, risk_free_rate):
+        """
+        Broadcast the batch inputs to float arrays of a common shape.
+
+        Expired entries (T <= 0) get a placeholder time of one year so the formulas stay
+        finite; their results are zeroed afterwards by `_mask_expired`.
+        """
+        S, K, T, sigma, r = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (
+            spot_price, strike_price, time_to_expiration, volatility, risk_free_rate)))
+        live = T > 0
+        if not live.all():
+            T = np.where(live, T, 1.0)
+        return S, K, T, sigma, r, live
+
+    @staticmethod
+    def _mask_expired(results: dict, live) -> dict:
+        if live.all():
+            return results
+        return {key: np.where(live, value, 0.0) for key, value in results.items()}
@@ -0,0 +1,117 @@
+import numpy as np
+from pricing.black_scholes import BlackScholesStrategy
+
+class ImpliedVolatilitySolver:
+    """
+    Vectorised implied-volatility solver built on the batch Black-Scholes pricer.
+
+    Each element starts from a Corrado-Miller initial guess and is refined with
+    Halley steps using the strategy's vega. Steps leaving the current bracket fall
+    back to bisection, so every element converges or ends with a bounded error.
+    Elements that have converged are dropped from later iterations.
+    """
+
+    def __init__(self, strategy=None, tolerance: float = 1e-8, max_iterations: int = 50,
+                 min_volatility: float = 1e-4, max_volatility: float = 5.0):
+        self.strategy = strategy or BlackScholesStrategy()
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.min_volatility = min_volatility
+        self.max_volatility = max_volatility
+
+    def solve(self, market_price, spot_price, strike_price, time_to_expiration,
+              risk_free_rate, is_call) -> dict:
+        """
+        Invert market prices into Black-Scholes implied volatilities.
+
+        Inputs are array-like and broadcast against each other.
+
+        :param market_price: Quoted option prices.
+        :param spot_price: Spot prices of the underlying asset.
+        :param strike_price: Strike prices of the options.
+        :param time_to_expiration: Times to expiration in years.
+        :param risk_free_rate: Risk-free interest rates.
+        :param is_call: True for calls, False for puts.
+        :return: A dictionary with "volatility" (NaN where no solution was found),
+            "iterations" and "converged" arrays of the broadcast shape.
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (
+            market_price, spot_price, strike_price, time_to_expiration, risk_free_rate, is_call)))
+        shape = arrays[0].shape
+        price, S, K, T, r, call_flag = (a.ravel() for a in arrays)
+        call_flag = call_flag.astype(bool)
+
+        volatility = np.full(price.shape, np.nan)
+        iterations = np.zeros(price.shape, dtype=np.int64)
+        converged = np.zeros(price.shape, dtype=bool)
+
+        valid = self._within_arbitrage_bounds(price, S, K, T, r, call_flag)
+        idx = np.flatnonzero(valid)
+        sigma = self._initial_guess(price[idx], S[idx], K[idx], T[idx], r[idx], call_flag[idx])
+        lower = np.full(idx.shape, self.min_volatility)
+        upper = np.full(idx.shape, self.max_volatility)
+
+        for _ in range(self.max_iterations):
+            if idx.size == 0:
+                break
+            iterations[idx] += 1
+            target, S_i, K_i, T_i, r_i = price[idx], S[idx], K[idx], T[idx], r[idx]
+
+            values = self.strategy.calculate_call_put_values_batch(S_i, K_i, T_i, sigma, r_i)
+            model_price = np.where(call_flag[idx], values["call"]["price"], values["put"]["price"])
+            vega = values["call"]["vega"] * 100  # Undo the per-1% scaling
+            diff = model_price - target
+
+            done = np.abs(diff) < self.tolerance * vega  # First-order volatility error below tolerance
+            too_high = diff > 0
+            upper = np.where(too_high, sigma, upper)
+            lower = np.where(too_high, lower, sigma)
+
+            d1, d2 = self.strategy.calculate_derivatives_batch(S_i, K_i, r_i, sigma, T_i)
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                newton = diff / vega
+                volga_ratio = d1 * d2 / sigma  # vomma / vega
+                step = newton / (1.0 - 0.5 * newton * volga_ratio)
+                candidate = sigma - step
+            bisect = ~np.isfinite(candidate) | (candidate <= lower) | (candidate >= upper)
+            candidate = np.where(bisect, 0.5 * (lower + upper), candidate)
+            done |= ~bisect & (np.abs(candidate - sigma) < self.tolerance)
+            done |= ((upper - lower) < self.tolerance) & (lower > self.min_volatility) & (upper < self.max_volatility)
+
+            volatility[idx[done]] = np.where(bisect, sigma, candidate)[done]
+            converged[idx[done]] = True
+            keep = ~done
+            idx, sigma = idx[keep], candidate[keep]
+            lower, upper = lower[keep], upper[keep]
+
+        return {
+            "volatility": volatility.reshape(shape),
+            "iterations": iterations.reshape(shape),
+            "converged": converged.reshape(shape),
+        }
+
+    @staticmethod
+    def _within_arbitrage_bounds(price, S, K, T, r, call_flag):
+        """Mask of quotes strictly inside the no-arbitrage bounds, where a solution exists."""
+        with np.errstate(invalid="ignore"):
+            K_discount = K * np.exp(-r * np.maximum(T, 0.0))
+            lower = np.where(call_flag, np.maximum(S - K_discount, 0.0), np.maximum(K_discount - S, 0.0))
+            upper = np.where(call_flag, S, K_discount)
+            return (np.isfinite(price) & (T > 0) & (S > 0) & (K > 0)
+                    & (price > lower) & (price < upper))
+
+    def _initial_guess(self, price, S, K, T, r, call_flag):
+        """
+        Corrado-Miller approximation, falling back to the Manaster-Koehler
+        guess sqrt(2|ln(F/K)| / T) where the approximation breaks down.
+        """
+        K_discount = K * np.exp(-r * T)
+        call_price = np.where(call_flag, price, price + S - K_discount)  # Put-call parity
+        half_moneyness = (S - K_discount) / 2
+        excess = call_price - half_moneyness
+        discriminant = excess ** 2 - (S - K_discount) ** 2 / np.pi
+        with np.errstate(invalid="ignore"):
+            guess = np.sqrt(2 * np.pi / T) / (S + K_discount) * (excess + np.sqrt(np.maximum(discriminant, 0.0)))
+            fallback = np.sqrt(2 * np.abs(np.log(S / K_discount)) / T)
+        guess = np.where((discriminant > 0) & np.isfinite(guess) & (guess > 0), guess, fallback)
+        return np.clip(guess, 2 * self.min_volatility, 0.5 * self.max_volatility)
@@ -0,0 +1,199 @@
+from math import exp, sqrt
+import numpy as np
+from pricing.strategy_base import PricingStrategy
+
+class LatticeStrategy(PricingStrategy):
+    """
+    Binomial (Cox-Ross-Rubinstein) or trinomial (Boyle) lattice pricing with
+    optional early exercise.
+
+    Backward induction runs in place over one buffer of terminal node values,
+    with scratch buffers of the same size, so memory is O(steps) per strike
+    rather than a full tree. An array of strikes shares the same lattice and is
+    priced in one sweep. Delta, gamma and theta are
+    read from the nodes near the root; vega and rho come from central differences
+    of repriced lattices.
+    """
+
+    VOLATILITY_BUMP = 1e-3
+    RATE_BUMP = 1e-4
+
+    def __init__(self, steps: int = 500, method: str = "binomial", american: bool = True):
+        if method not in ("binomial", "trinomial"):
+            raise ValueError(f"Unknown lattice method: {method}")
+        if steps < 3:
+            # Delta, gamma and theta are read from the nodes of the first two steps
+            raise ValueError(f"A lattice needs at least 3 steps, got {steps}")
+        self.steps = steps
+        self.method = method
+        self.american = american
+
+    def calculate_call_values(self, option, spot_price: float, volatility: float, risk_free_rate: float) -> dict:
+        """
+        Calculate the price and Greeks of the call on the lattice.
+
+        :param option: The option to price.
+        :param spot_price: The current spot price of the underlying asset.
+        :param volatility: The volatility of the underlying asset.
+        :param risk_free_rate: The risk-free interest rate.
+        :return: A dictionary containing the calculated price and Greeks.
+        """
+        results = self._price(spot_price, option.strike_price, option.time_to_expiration(),
+                              volatility, risk_free_rate, is_call=True)
+        return {key: float(value[0]) for key, value in results.items()}
+
+    def calculate_put_values(self, option, spot_price: float, volatility: float, risk_free_rate: float) -> dict:
+        """
+        Calculate the price and Greeks of the put on the lattice.
+
+        :param option: The option to price.
+        :param spot_price: The current spot price of the underlying asset.
+        :param volatility: The volatility of the underlying asset.
+        :param risk_free_rate: The risk-free interest rate.
+        :return: A dictionary containing the calculated price and Greeks.
+        """
+        results = self._price(spot_price, option.strike_price, option.time_to_expiration(),
+                              volatility, risk_free_rate, is_call=False)
+        return {key: float(value[0]) for key, value in results.items()}
+
+    def calculate_call_values_batch(self, spot_price, strike_price, time_to_expiration,
+                                    volatility, risk_free_rate) -> dict:
+        """
+        Price an array of call strikes in one lattice sweep.
+
+        Spot, time, volatility and rate must be scalars since they define the lattice.
+        """
+        return self._price_strikes(spot_price, strike_price, time_to_expiration, volatility, risk_free_rate, True)
+
+    def calculate_put_values_batch(self, spot_price, strike_price, time_to_expiration,
+                                   volatility, risk_free_rate) -> dict:
+        """
+        Price an array of put strikes in one lattice sweep.
+
+        Spot, time, volatility and rate must be scalars since they define the lattice.
+        """
+        return self._price_strikes(spot_price, strike_price, time_to_expiration, volatility, risk_free_rate, False)
+
+    def _price_strikes(self, spot_price, strike_price, time_to_expiration, volatility, risk_free_rate, is_call):
+        if any(np.ndim(x) for x in (spot_price, time_to_expiration, volatility, risk_free_rate)):
+            raise ValueError("Lattice batch pricing takes an array of strikes with scalar spot, time, volatility and rate.")
+        strikes = np.asarray(strike_price, dtype=np.float64)
+        results = self._price(float(spot_price), strikes.ravel(), float(time_to_expiration),
+                              float(volatility), float(risk_free_rate), is_call)
+        return {key: value.reshape(strikes.shape) for key, value in results.items()}
+
+    def _price(self, S, K, T, sigma, r, is_call) -> dict:
+        K = np.atleast_1d(np.asarray(K, dtype=np.float64))
+        if T <= 0:
+            return {key: np.zeros(K.shape) for key in ("price", "delta", "gamma", "vega", "theta", "rho")}
+
+        price, delta, gamma, theta = self._induct(S, K, T, sigma, r, is_call, with_greeks=True)
+        h_sigma = min(self.VOLATILITY_BUMP, sigma / 2)
+        vega = (self._induct(S, K, T, sigma + h_sigma, r, is_call)
+                - self._induct(S, K, T, sigma - h_sigma, r, is_call)) / (2 * h_sigma)
+        rho = (self._induct(S, K, T, sigma, r + self.RATE_BUMP, is_call)
+               - self._induct(S, K, T, sigma, r - self.RATE_BUMP, is_call)) / (2 * self.RATE_BUMP)
+
+        return {
+            "price": price,
+            "delta": delta,
+            "gamma": gamma,
+            "vega": vega / 100,  # Convert to per 1% change in volatility
+            "theta": theta / 365,  # Convert to per day
+            "rho": rho
+        }
+
+    def _induct(self, S, K, T, sigma, r, is_call, with_greeks=False):
+        if self.method == "binomial":
+            return self._induct_binomial(S, K, T, sigma, r, is_call, with_greeks)
+        return self._induct_trinomial(S, K, T, sigma, r, is_call, with_greeks)
+
+    def _check_probabilities(self, *probabilities):
+        """Reject a lattice whose step moves cannot match the drift, which prices garbage."""
+        if not all(0.0 <= p <= 1.0 for p in probabilities):
+            raise ValueError(f"{self.method.capitalize()} lattice probabilities {probabilities} fall outside [0, 1]; "
+                             f"the rate is too large for the volatility over one step, so use more steps")
+
+    def _induct_binomial(self, S, K, T, sigma, r, is_call, with_greeks):
+        N = self.steps
+        dt = T / N
+        u = exp(sigma * sqrt(dt))
+        p = (exp(r * dt) - 1 / u) / (u - 1 / u)
+        self._check_probabilities(p, 1 - p)
+        disc = exp(-r * dt)
+        discounted_up, discounted_down = disc * p, disc * (1 - p)
+        # Node j at step i sits at S * u ** (2j - i), i.e. powers[N + 2j - i]
+        powers = S * u ** np.arange(-N, N + 1, dtype=np.float64)
+        sign = 1.0 if is_call else -1.0
+        powers = powers[:, np.newaxis]
+
+        # Rows are nodes and columns strikes, so each step works on a contiguous block
+        values = np.maximum(sign * (powers[::2] - K), 0.0)
+        scratch = np.empty_like(values)
+        snapshots = {}
+        for i in range(N - 1, -1, -1):
+            live, work = values[:i + 1], scratch[:i + 1]
+            np.multiply(values[1:i + 2], discounted_up, out=work)
+            live *= discounted_down
+            live += work
+            if self.american:
+                np.subtract(powers[N - i:N + i + 1:2], K, out=work)
+                work *= sign
+                np.maximum(live, work, out=live)
+            if with_greeks and i in (1, 2):
+                snapshots[i] = live.copy()
+
+        price = values[0].copy()
+        if not with_greeks:
+            return price
+        (V10, V11), (V20, V21, V22) = snapshots[1], snapshots[2]
+        S_d, S_u, S_dd, S_uu = S / u, S * u, S / u ** 2, S * u ** 2
+        delta = (V11 - V10) / (S_u - S_d)
+        gamma = ((V22 - V21) / (S_uu - S) - (V21 - V20) / (S - S_dd)) / (0.5 * (S_uu - S_dd))
+        theta = (V21 - price) / (2 * dt)
+        return price, delta, gamma, theta
+
+    def _induct_trinomial(self, S, K, T, sigma, r, is_call, with_greeks):
+        N = self.steps
+        dt = T / N
+        u = exp(sigma * sqrt(2 * dt))
+        half_up, half_down = exp(sigma * sqrt(dt / 2)), exp(-sigma * sqrt(dt / 2))
+        drift = exp(r * dt / 2)
+        p_up = ((drift - half_down) / (half_up - half_down)) ** 2
+        p_down = ((half_up - drift) / (half_up - half_down)) ** 2
+        self._check_probabilities(p_up, p_down, 1 - p_up - p_down)
+        disc = exp(-r * dt)
+        discounted_up, discounted_down = disc * p_up, disc * p_down
+        discounted_mid = disc * (1 - p_up - p_down)
+        # Node j at step i sits at S * u ** (j - i), i.e. powers[N + j - i]
+        powers = S * u ** np.arange(-N, N + 1, dtype=np.float64)
+        sign = 1.0 if is_call else -1.0
+        powers = powers[:, np.newaxis]
+
+        values = np.maximum(sign * (powers - K), 0.0)
+        scratch, scratch_up = np.empty_like(values), np.empty_like(values)
+        snapshot = None
+        for i in range(N - 1, -1, -1):
+            width = 2 * i + 1
+            live, work, work_up = values[:width], scratch[:width], scratch_up[:width]
+            np.multiply(values[1:width + 1], discounted_mid, out=work)
+            np.multiply(values[2:width + 2], discounted_up, out=work_up)
+            live *= discounted_down
+            live += work
+            live += work_up
+            if self.american:
+                np.subtract(powers[N - i:N + i + 1], K, out=work)
+                work *= sign
+                np.maximum(live, work, out=live)
+            if with_greeks and i == 1:
+                snapshot = live.copy()
+
+        price = values[0].copy()
+        if not with_greeks:
+            return price
+        V10, V11, V12 = snapshot
+        S_d, S_u = S / u, S * u
+        delta = (V12 - V10) / (S_u - S_d)
+        gamma = ((V12 - V11) / (S_u - S) - (V11 - V10) / (S - S_d)) / (0.5 * (S_u - S_d))
+        theta = (V11 - price) / dt
+        return price, delta, gamma, theta
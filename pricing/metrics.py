@@ -0,0 +1,153 @@
+import cProfile
+import functools
+import pstats
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0, float("inf"))
+
+class _NullTimer:
+    """Shared no-op context manager handed out while metrics are disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class _StageTimer:
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+class Metrics:
+    """
+    Opt-in per-stage timers, event counters and latency histograms.
+
+    While disabled, `timer` returns a shared no-op context manager and
+    `increment` returns immediately, so instrumented code pays only a method call.
+    """
+
+    def __init__(self, enabled: bool = False, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._timers = {}
+            self._counters = {}
+
+    def timer(self, stage: str):
+        """Context manager recording the time spent in `stage`."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self, stage)
+
+    def observe(self, stage: str, seconds: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            timer = self._timers.get(stage)
+            if timer is None:
+                timer = self._timers[stage] = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+                                               "buckets": [0] * len(self.buckets)}
+            timer["count"] += 1
+            timer["total_seconds"] += seconds
+            timer["max_seconds"] = max(timer["max_seconds"], seconds)
+            timer["buckets"][bisect_left(self.buckets, seconds)] += 1
+
+    def increment(self, event: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[event] = self._counters.get(event, 0) + amount
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current metrics.
+
+        Timers map each stage to its count, total and max seconds and cumulative
+        histogram counts keyed by bucket upper bound.
+        """
+        with self._lock:
+            timers = {}
+            for stage, timer in self._timers.items():
+                cumulative, running = {}, 0
+                for bound, count in zip(self.buckets, timer["buckets"]):
+                    running += count
+                    cumulative[bound] = running
+                timers[stage] = {"count": timer["count"], "total_seconds": timer["total_seconds"],
+                                 "max_seconds": timer["max_seconds"], "histogram": cumulative}
+            return {"timers": timers, "counters": dict(self._counters)}
+
+    def to_prometheus(self, prefix: str = "options_pricer") -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [f"# HELP {prefix}_stage_seconds Time spent per pricing stage.",
+                 f"# TYPE {prefix}_stage_seconds histogram"]
+        for stage, timer in sorted(snapshot["timers"].items()):
+            for bound, count in timer["histogram"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{le}"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {timer["total_seconds"]!r}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {timer["count"]}')
+        lines += [f"# HELP {prefix}_events_total Counted pricing and data events.",
+                  f"# TYPE {prefix}_events_total counter"]
+        for event, count in sorted(snapshot["counters"].items()):
+            lines.append(f'{prefix}_events_total{{event="{event}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    @contextmanager
+    def profile(self, path: str = None, sort: str = "cumulative", limit: int = 25, stream=None):
+        """
+        Run the enclosed block under cProfile.
+
+        Stats are dumped to `path` when given (readable with `pstats`), otherwise
+        the top `limit` entries are printed to `stream`.
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            if path is not None:
+                profiler.dump_stats(path)
+            else:
+                pstats.Stats(profiler, stream=stream or sys.stdout).sort_stats(sort).print_stats(limit)
+
+def timed(stage: str):
+    """
+    Decorator timing a method as `stage` and counting its calls, using the
+    instance's `metrics`. Costs one extra call while metrics are disabled.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            metrics = self.metrics
+            if not metrics.enabled:
+                return method(self, *args, **kwargs)
+            metrics.increment(f"{stage}_calls")
+            with metrics.timer(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+# Default for components that have not been given a Metrics instance
+DISABLED_METRICS = Metrics(enabled=False)
@@ -0,0 +1,141 @@
+from concurrent.futures import ProcessPoolExecutor
+from math import exp, sqrt
+import numpy as np
+from pricing.strategy_base import PricingStrategy
+
+# Running sums accumulated per chunk; see _simulate_chunk
+_SUMS = ("n", "y", "yy", "x", "xx", "xy", "delta", "gamma", "vega", "theta", "rho")
+
+def _simulate_chunk(seed_sequence, n_samples, S, K, T, sigma, r, is_call, antithetic):
+    """
+    Simulate one chunk of terminal GBM prices and return running sums.
+
+    A sample is one path, or the average of an antithetic pair. The control
+    variate X is the discounted terminal spot, whose expectation is S.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    Z = rng.standard_normal(n_samples)
+    if antithetic:
+        Z = np.concatenate([Z, -Z])
+
+    sqrt_T = sqrt(T)
+    discount = exp(-r * T)
+    S_T = S * np.exp((r - 0.5 * sigma ** 2) * T + sigma * sqrt_T * Z)
+    sign = 1.0 if is_call else -1.0
+    payoff = np.maximum(sign * (S_T - K), 0.0)
+    slope = sign * (payoff > 0)  # Derivative of the payoff with respect to S_T
+
+    estimates = {
+        "y": discount * payoff,
+        "x": discount * S_T,
+        "delta": discount * slope * S_T / S,
+        "gamma": discount * slope * S_T / S ** 2 * (Z / (sigma * sqrt_T) - 1.0),
+        "vega": discount * slope * S_T * (np.log(S_T / S) - (r + 0.5 * sigma ** 2) * T) / sigma,
+        "theta": r * discount * payoff - discount * slope * S_T * ((r - 0.5 * sigma ** 2) + sigma * Z / (2 * sqrt_T)),
+        "rho": T * discount * (slope * S_T - payoff),
+    }
+    if antithetic:
+        estimates = {key: 0.5 * (value[:n_samples] + value[n_samples:]) for key, value in estimates.items()}
+
+    y, x = estimates["y"], estimates["x"]
+    sums = {"n": float(n_samples), "y": y.sum(), "yy": y @ y, "x": x.sum(), "xx": x @ x, "xy": x @ y}
+    sums.update({greek: estimates[greek].sum() for greek in ("delta", "gamma", "vega", "theta", "rho")})
+    return np.array([sums[key] for key in _SUMS])
+
+
+class MonteCarloStrategy(PricingStrategy):
+    """
+    Monte Carlo pricing of European options under geometric Brownian motion.
+
+    Paths are generated in chunks of at most `chunk_size` so memory stays bounded
+    for any path count. Each chunk draws from its own child of a `SeedSequence`,
+    so results for a given seed do not depend on the number of workers.
+    """
+
+    def __init__(self, n_paths: int = 200_000, chunk_size: int = 50_000, antithetic: bool = True,
+                 control_variate: bool = True, n_workers: int = 1, seed=None):
+        self.n_paths = n_paths
+        self.chunk_size = chunk_size
+        self.antithetic = antithetic
+        self.control_variate = control_variate
+        self.n_workers = n_workers
+        self.seed = seed
+        self._executor = None
+
+    def calculate_call_values(self, option, spot_price: float, volatility: float, risk_free_rate: float) -> dict:
+        """
+        Estimate the call price, its standard error and path-wise Greeks.
+
+        :param option: The option to price.
+        :param spot_price: The current spot price of the underlying asset.
+        :param volatility: The volatility of the underlying asset.
+        :param risk_free_rate: The risk-free interest rate.
+        :return: A dictionary containing the price, "std_error" and Greeks, in the units used by Black-Scholes.
+        """
+        return self._simulate(option, spot_price, volatility, risk_free_rate, is_call=True)
+
+    def calculate_put_values(self, option, spot_price: float, volatility: float, risk_free_rate: float) -> dict:
+        """
+        Estimate the put price, its standard error and path-wise Greeks.
+
+        :param option: The option to price.
+        :param spot_price: The current spot price of the underlying asset.
+        :param volatility: The volatility of the underlying asset.
+        :param risk_free_rate: The risk-free interest rate.
+        :return: A dictionary containing the price, "std_error" and Greeks, in the units used by Black-Scholes.
+        """
+        return self._simulate(option, spot_price, volatility, risk_free_rate, is_call=False)
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _simulate(self, option, spot_price, volatility, risk_free_rate, is_call):
+        T = option.time_to_expiration()
+        if T <= 0:
+            return {"price": 0.0, "std_error": 0.0, "delta": 0.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0, "rho": 0.0}
+
+        # Each antithetic sample consumes two paths
+        paths_per_sample = 2 if self.antithetic else 1
+        n_samples = max(self.n_paths // paths_per_sample, 2)
+        chunk_samples = max(self.chunk_size // paths_per_sample, 1)
+        sizes = [chunk_samples] * (n_samples // chunk_samples)
+        if n_samples % chunk_samples:
+            sizes.append(n_samples % chunk_samples)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        args = [(seed, size, float(spot_price), float(option.strike_price), T, float(volatility),
+                 float(risk_free_rate), is_call, self.antithetic) for seed, size in zip(seeds, sizes)]
+
+        if self.n_workers > 1 and len(args) > 1:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.n_workers)
+            chunks = list(self._executor.map(_simulate_chunk, *zip(*args)))
+        else:
+            chunks = [_simulate_chunk(*chunk_args) for chunk_args in args]
+        sums = dict(zip(_SUMS, np.sum(chunks, axis=0)))
+        return self._summarise(sums, spot_price)
+
+    def _summarise(self, sums, spot_price):
+        n = sums["n"]
+        mean_y, mean_x = sums["y"] / n, sums["x"] / n
+        var_y = (sums["yy"] - n * mean_y ** 2) / (n - 1)
+        price, variance = mean_y, var_y
+        if self.control_variate:
+            var_x = (sums["xx"] - n * mean_x ** 2) / (n - 1)
+            cov_xy = (sums["xy"] - n * mean_x * mean_y) / (n - 1)
+            if var_x > 0:
+                beta = cov_xy / var_x
+                price = mean_y - beta * (mean_x - spot_price)
+                variance = var_y - beta * cov_xy
+
+        return {
+            "price": float(price),
+            "std_error": float(sqrt(max(variance, 0.0) / n)),
+            "delta": float(sums["delta"] / n),
+            "gamma": float(sums["gamma"] / n),
+            "vega": float(sums["vega"] / n / 100),  # Convert to per 1% change in volatility
+            "theta": float(sums["theta"] / n / 365),  # Convert to per day
+            "rho": float(sums["rho"] / n),
+        }
@@ -0,0 +1,155 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.metrics import DISABLED_METRICS
+
+FIELDS = ("price", "delta", "gamma", "vega", "theta", "rho")
+SIDES = ("call", "put")
+N_INPUTS = 5
+N_OUTPUTS = len(SIDES) * len(FIELDS)
+DEFAULT_MIN_PARALLEL_SIZE = 100_000
+
+# Per worker process: the shared blocks it has attached, by name
+_attached = {}
+
+def _attach(name: str, rows: int, capacity: int) -> np.ndarray:
+    """View a shared block as a (rows x capacity) float64 array, attaching on first use."""
+    block = _attached.get(name)
+    if block is None:
+        # Workers share the parent's resource tracker, so attaching here registers nothing new
+        shm = shared_memory.SharedMemory(name=name)
+        block = _attached[name] = (shm, np.ndarray((rows, capacity), dtype=np.float64, buffer=shm.buf))
+    return block[1]
+
+def _detach_except(names):
+    """Let go of blocks the parent has since replaced."""
+    for name in [name for name in _attached if name not in names]:
+        shm, array = _attached.pop(name)
+        del array
+        shm.close()
+
+def _price_shard(input_name, output_name, capacity, scalars, start, stop):
+    """Price rows [start, stop) of the shared inputs and write the results into the shared outputs."""
+    _detach_except((input_name, output_name))
+    inputs = _attach(input_name, N_INPUTS, capacity)
+    outputs = _attach(output_name, N_OUTPUTS, capacity)
+    columns = [inputs[i, start:stop] if value is None else value for i, value in enumerate(scalars)]
+    results = BlackScholesStrategy().calculate_call_put_values_batch(*columns)
+    for row, (side, field) in enumerate((side, field) for side in SIDES for field in FIELDS):
+        outputs[row, start:stop] = results[side][field]
+
+class _SharedBlock:
+    """A (rows x capacity) float64 array in shared memory, owned and unlinked by this process."""
+
+    def __init__(self, rows: int, capacity: int):
+        self.capacity = capacity
+        self.shm = shared_memory.SharedMemory(create=True, size=rows * capacity * 8)
+        self.array = np.ndarray((rows, capacity), dtype=np.float64, buffer=self.shm.buf)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def release(self):
+        del self.array
+        self.shm.unlink()
+        self.shm.close()
+
+class ParallelBatchExecutor:
+    """
+    Black-Scholes batch pricing sharded across a persistent process pool.
+
+    Array inputs are copied once into a shared-memory block and each worker
+    prices a contiguous index range of it, writing prices and Greeks straight
+    into a shared output block, so no array is pickled either way. Scalar inputs
+    travel with the task instead. Blocks are kept and reused while batches fit
+    in them. Batches smaller than `min_parallel_size` are priced in-process,
+    where the dispatch would cost more than it saves.
+
+    Results are copied out of the shared output block, which the next batch
+    reuses, so they belong to the caller like in-process results do.
+    """
+    metrics = DISABLED_METRICS
+
+    def __init__(self, n_workers: int = None, min_parallel_size: int = DEFAULT_MIN_PARALLEL_SIZE):
+        """
+        :param n_workers: Worker processes; defaults to the CPU count.
+        :param min_parallel_size: Smallest batch sent to the pool.
+        """
+        self.n_workers = n_workers or os.cpu_count()
+        self.min_parallel_size = min_parallel_size
+        self.strategy = BlackScholesStrategy()
+        self._executor = None
+        self._inputs = None
+        self._outputs = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool and release the shared blocks."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for block in (self._inputs, self._outputs):
+            if block is not None:
+                block.release()
+        self._inputs = self._outputs = None
+
+    def calculate_call_put_values_batch(self, spot_price, strike_price, time_to_expiration,
+                                        volatility, risk_free_rate) -> dict:
+        """
+        Calculate call and put values for arrays of inputs, as `BlackScholesStrategy` does.
+
+        :return: A dictionary with "call" and "put" entries mapping price and Greeks to arrays of the broadcast shape.
+        """
+        values = [np.asarray(x, dtype=np.float64) for x in (
+            spot_price, strike_price, time_to_expiration, volatility, risk_free_rate)]
+        shape = np.broadcast_shapes(*(value.shape for value in values))
+        size = int(np.prod(shape))
+        if self.n_workers <= 1 or size < self.min_parallel_size:
+            self.metrics.increment("batch_in_process")
+            return self.strategy.calculate_call_put_values_batch(*values)
+
+        self.metrics.increment("batch_parallel")
+        with self.metrics.timer("parallel_batch"):
+            self._reserve(size)
+            inputs, outputs = self._inputs.array, self._outputs.array
+            scalars = []
+            for row, value in enumerate(values):
+                if value.ndim == 0:
+                    scalars.append(float(value))
+                else:
+                    inputs[row, :size].reshape(shape)[...] = value
+                    scalars.append(None)
+
+            bounds = np.linspace(0, size, min(self.n_workers, size) + 1).astype(int)
+            futures = [self._executor.submit(_price_shard, self._inputs.name, self._outputs.name,
+                                             self._inputs.capacity, scalars, start, stop)
+                       for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+            for future in futures:
+                future.result()
+
+            block = outputs[:, :size].copy()
+        results = {}
+        for row, (side, field) in enumerate((side, field) for side in SIDES for field in FIELDS):
+            results.setdefault(side, {})[field] = block[row].reshape(shape)
+        return results
+
+    def _reserve(self, size: int):
+        """Start the pool on first use and make sure the shared blocks hold `size` rows."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers)
+        if self._inputs is None or self._inputs.capacity < size:
+            for block in (self._inputs, self._outputs):
+                if block is not None:
+                    block.release()
+            # Grow geometrically so a slowly growing batch does not reallocate every call
+            capacity = max(size, 2 * self._inputs.capacity if self._inputs is not None else 0)
+            self._inputs = _SharedBlock(N_INPUTS, capacity)
+            self._outputs = _SharedBlock(N_OUTPUTS, capacity)
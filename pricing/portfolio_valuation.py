@@ -0,0 +1,69 @@
+import numpy as np
+
+GREEKS = ("delta", "gamma", "vega", "theta", "rho")
+
+class PortfolioValuation:
+    """
+    Prices and Greeks for every position of a `Portfolio`.
+
+    `volatility` is a scalar or one value per position in the order the
+    positions were given; `unit_values` are held in the portfolio's internal
+    order, while `position_values` returns the caller's order.
+
+    Unit prices and Greeks are held per position; times to expiration are fixed
+    when the valuation is created. `update_spot` reprices only the positions on
+    the underlying whose spot moved.
+    """
+
+    def __init__(self, portfolio, strategy, volatility, risk_free_rate, today=None):
+        self.portfolio = portfolio
+        self.strategy = strategy
+        self.volatility = portfolio.per_position(volatility)
+        self.risk_free_rate = risk_free_rate
+        self.times = portfolio.time_to_expiration(today)
+        self.spots = dict.fromkeys(portfolio.symbols, np.nan)
+        self.unit_values = {key: np.full(len(portfolio), np.nan) for key in ("price",) + GREEKS}
+
+    def revalue(self, spots: dict):
+        """Reprice the whole book against a dict of symbol to spot price."""
+        self.spots.update(spots)
+        spot_column = np.array([self.spots[symbol] for symbol in self.portfolio.symbols])[self.portfolio.symbol_ids]
+        self._price_slice(slice(None), spot_column)
+        return self
+
+    def update_spot(self, symbol: str, spot: float):
+        """Reprice only the positions on `symbol` after its spot ticks."""
+        self.spots[symbol] = spot
+        self._price_slice(self.portfolio.positions_for(symbol), spot)
+        return self
+
+    def position_values(self) -> dict:
+        """Quantity-weighted value and Greeks for each position, in the order the positions were given."""
+        return {key: self.portfolio.in_input_order(column) for key, column in self._position_values().items()}
+
+    def underlying_values(self) -> dict:
+        """Value and Greeks summed per underlying, as a dict of symbol to totals."""
+        totals = {
+            key: np.bincount(self.portfolio.symbol_ids, weights=column, minlength=len(self.portfolio.symbols))
+            for key, column in self._position_values().items()
+        }
+        return {
+            symbol: {key: float(column[i]) for key, column in totals.items()}
+            for i, symbol in enumerate(self.portfolio.symbols)
+        }
+
+    def _position_values(self) -> dict:
+        """Quantity-weighted value and Greeks in the portfolio's internal, symbol-grouped order."""
+        quantities = self.portfolio.quantities
+        values = {"value": self.unit_values["price"] * quantities}
+        values.update({greek: self.unit_values[greek] * quantities for greek in GREEKS})
+        return values
+
+    def _price_slice(self, positions: slice, spot):
+        portfolio = self.portfolio
+        results = self.strategy.calculate_call_put_values_batch(
+            spot, portfolio.strikes[positions], self.times[positions],
+            self.volatility[positions], self.risk_free_rate)
+        is_call = portfolio.is_call[positions]
+        for key, column in self.unit_values.items():
+            column[positions] = np.where(is_call, results["call"][key], results["put"][key])
@@ -1,26 +1,242 @@
+import numpy as np
 from pricing.black_scholes import BlackScholesStrategy
+from pricing.implied_volatility import ImpliedVolatilitySolver
+from pricing.lattice import LatticeStrategy
+from pricing.metrics import Metrics, timed
+from pricing.monte_carlo import MonteCarloStrategy
+from pricing.portfolio_valuation import PortfolioValuation
+from pricing.result_cache import ResultCache
+from pricing.scenario_engine import ScenarioEngine
+from pricing.taylor_valuation import TaylorValuation
+from pricing.volatility_surface import VolatilitySurface
+from data_fetchers.cached_fetcher import CachedFetcher
 from data_fetchers.yahoo_fetcher import YahooFetcher
 
 class PricingEngine:
-    def __init__(self):
-        """Only current model is Black-Scholes."""
+    def __init__(self, metrics: Metrics = None, result_cache: ResultCache = None, data_provider=None,
+                 batch_executor=None):
+        """
+        Black-Scholes is the default model; others are selected by name.
+
+        :param metrics: Optional `Metrics` shared with the strategies and fetchers.
+            Instrumentation is disabled unless an enabled instance is given.
+        :param result_cache: Optional `ResultCache` memoizing grid results; a
+            default-sized cache is used if none is given.
+        :param data_provider: Optional spot fetcher, e.g. one shared across engines;
+            defaults to a `CachedFetcher` around `YahooFetcher`.
+        :param batch_executor: Optional `ParallelBatchExecutor` that large call/put
+            batches and chains are sharded across; the caller closes it.
+        """
+        self.metrics = metrics or Metrics(enabled=False)
+        self.result_cache = result_cache if result_cache is not None else ResultCache()
         self.strategies = {
             'Black-Scholes': BlackScholesStrategy(),
+            'Monte-Carlo': MonteCarloStrategy(),
+            'Binomial': LatticeStrategy(method="binomial"),
+            'Trinomial': LatticeStrategy(method="trinomial"),
         }
-        self.data_provider = YahooFetcher()
+        self.data_provider = data_provider if data_provider is not None else CachedFetcher(YahooFetcher())
+        self._async_data_provider = None
+        self.implied_volatility_solver = ImpliedVolatilitySolver(self.strategies['Black-Scholes'])
+        self.scenario_engine = ScenarioEngine(self.strategies['Black-Scholes'])
+        self.batch_executor = batch_executor
+        wrapped = getattr(self.data_provider, "fetcher", None)
+        for component in (*self.strategies.values(), self.data_provider, self.result_cache, batch_executor):
+            if component is None:
+                continue
+            component.metrics = self.metrics
+        if wrapped is not None:
+            wrapped.metrics = self.metrics
+
+    @property
+    def async_data_provider(self):
+        """Concurrent quote fetcher, created on first use so requests is only imported when needed."""
+        if self._async_data_provider is None:
+            from data_fetchers.async_fetcher import AsyncQuoteFetcher
+            self.async_data_provider = AsyncQuoteFetcher()
+        return self._async_data_provider
+
+    @async_data_provider.setter
+    def async_data_provider(self, fetcher):
+        fetcher.metrics = self.metrics
+        self._async_data_provider = fetcher
 
-    def calculate_call(self, option, volatility: float, risk_free_rate: float, spot=None):
+    def profile(self, path: str = None, **kwargs):
+        """Context manager running the enclosed block under cProfile; see `Metrics.profile`."""
+        return self.metrics.profile(path, **kwargs)
+
+    @timed("calculate_call")
+    def calculate_call(self, option, volatility: float, risk_free_rate: float, spot=None, model: str = 'Black-Scholes'):
         """Calculate price & Greeks for an option using the specified model."""
-        strategy = self.strategies['Black-Scholes']
+        strategy = self.strategies[model]
         if spot is None:
-            spot = self.data_provider.fetch_ticker_price(option.underlying_symbol)
-        call_result = strategy.calculate_call_values(option, spot, volatility, risk_free_rate)
-        return call_result
+            with self.metrics.timer("fetch"):
+                spot = self.data_provider.fetch_ticker_price(option.underlying_symbol)
+        return strategy.calculate_call_values(option, spot, volatility, risk_free_rate)
     
-    def calculate_put(self, option, volatility: float, risk_free_rate: float, spot=None):
+    @timed("calculate_put")
+    def calculate_put(self, option, volatility: float, risk_free_rate: float, spot=None, model: str = 'Black-Scholes'):
         """Calculate price & Greeks for an option using the specified model."""
-        strategy = self.strategies['Black-Scholes']
+        strategy = self.strategies[model]
+        if spot is None:
+            with self.metrics.timer("fetch"):
+                spot = self.data_provider.fetch_ticker_price(option.underlying_symbol)
+        return strategy.calculate_put_values(option, spot, volatility, risk_free_rate)
+
+    @timed("calculate_call_put")
+    def calculate_call_put(self, option, volatility: float, risk_free_rate: float, spot=None, model: str = 'Black-Scholes'):
+        """Calculate call and put price & Greeks together, sharing one spot fetch and one set of intermediates."""
+        strategy = self.strategies[model]
         if spot is None:
-            spot = self.data_provider.fetch_ticker_price(option.underlying_symbol)
-        put_result = strategy.calculate_put_values(option, spot, volatility, risk_free_rate)
-        return put_result
\ No newline at end of file
+            with self.metrics.timer("fetch"):
+                spot = self.data_provider.fetch_ticker_price(option.underlying_symbol)
+        return strategy.calculate_call_put_values(option, spot, volatility, risk_free_rate)
+
+    async def calculate_call_put_async(self, options, volatility, risk_free_rate):
+        """
+        Price many options, fetching the spots of all their underlyings concurrently.
+
+        Returns the batch call/put results plus an "errors" dict of symbols whose spot
+        could not be fetched; their options are priced as NaN.
+        """
+        strategy = self.strategies['Black-Scholes']
+        options = list(options)
+        with self.metrics.timer("fetch"):
+            fetched = await self.async_data_provider.fetch_ticker_prices_async(
+                option.underlying_symbol for option in options)
+        spots = np.array([fetched["prices"].get(option.underlying_symbol, np.nan) for option in options])
+        strikes = np.array([option.strike_price for option in options], dtype=np.float64)
+        times = np.array([option.time_to_expiration() for option in options])
+        results = strategy.calculate_call_put_values_batch(spots, strikes, times, volatility, risk_free_rate)
+        results["errors"] = fetched["errors"]
+        return results
+
+    @timed("price_portfolio")
+    def price_portfolio(self, portfolio, volatility, risk_free_rate: float, spots: dict = None):
+        """
+        Price every position of a `Portfolio` in one vectorised pass.
+
+        Spots missing from `spots` are fetched for all underlyings in one bulk request.
+        Returns a `PortfolioValuation` that can be revalued per underlying as spots tick.
+        """
+        strategy = self.strategies['Black-Scholes']
+        spots = self._resolve_spots(portfolio.symbols, spots)
+        return PortfolioValuation(portfolio, strategy, volatility, risk_free_rate).revalue(spots)
+
+    @timed("price_portfolio_fast")
+    def price_portfolio_fast(self, portfolio, volatility, risk_free_rate: float, spots: dict = None, **thresholds):
+        """
+        Price a `Portfolio` fully once and return a `TaylorValuation` for fast intraday revaluation.
+
+        Later `revalue`/`update_spot` calls approximate small moves from the cached
+        Greeks and fully reprice only positions beyond the thresholds, which are the
+        keyword arguments of `TaylorValuation` (max_spot_move, max_vol_move, max_days,
+        max_error). Spots missing from `spots` are fetched in one bulk request.
+        """
+        strategy = self.strategies['Black-Scholes']
+        spots = self._resolve_spots(portfolio.symbols, spots)
+        return TaylorValuation(portfolio, strategy, volatility, risk_free_rate, **thresholds).revalue(spots)
+
+    @timed("run_scenarios")
+    def run_scenarios(self, portfolio, volatility, risk_free_rate: float, spots: dict = None, **scenarios):
+        """
+        Stress a `Portfolio` over a spot x vol x rate x time scenario cube.
+
+        Keyword arguments are passed to `ScenarioEngine.run`; spots missing from
+        `spots` are fetched in one bulk request.
+        """
+        spots = self._resolve_spots(portfolio.symbols, spots)
+        return self.scenario_engine.run(portfolio, spots, volatility, risk_free_rate, **scenarios)
+
+    @timed("calculate_chain")
+    def calculate_chain(self, chain, volatility, risk_free_rate, spots: dict = None):
+        """
+        Price every contract of an `OptionChain` as both a call and a put in one vectorised pass.
+
+        Times to expiration come from the chain's cached year fractions. `volatility`
+        is a scalar, an array with one entry per contract, a `VolatilitySurface`, or a
+        dict of symbol to `VolatilitySurface` covering every underlying; surfaces are
+        read with one vectorised lookup per underlying. Spots missing from `spots` are fetched in one bulk
+        request; contracts whose spot cannot be fetched are priced as NaN. Large
+        chains are sharded across the `batch_executor` when one was given.
+        """
+        strategy = self.batch_executor or self.strategies['Black-Scholes']
+        spots = self._resolve_spots(chain.underlyings, spots)
+        spot_column = np.array([spots.get(symbol, np.nan) for symbol in chain.underlyings])[chain.symbol_ids]
+        times = chain.time_to_expiration()
+        volatility = self._chain_volatilities(chain, times, volatility)
+        return strategy.calculate_call_put_values_batch(spot_column, chain.strikes, times, volatility, risk_free_rate)
+
+    @staticmethod
+    def _chain_volatilities(chain, times, volatility):
+        if isinstance(volatility, VolatilitySurface):
+            return volatility.lookup(chain.strikes, times)
+        if not isinstance(volatility, dict):
+            return volatility
+        # A sliced chain keeps every underlying of its parent; only those with contracts need a surface
+        symbol_ids = np.unique(chain.symbol_ids)
+        missing = [chain.underlyings[symbol_id] for symbol_id in symbol_ids
+                   if chain.underlyings[symbol_id] not in volatility]
+        if missing:
+            raise ValueError(f"No volatility surface for: {', '.join(missing)}")
+        volatilities = np.empty(len(chain))
+        for symbol_id in symbol_ids:
+            rows = chain.symbol_ids == symbol_id
+            volatilities[rows] = volatility[chain.underlyings[symbol_id]].lookup(chain.strikes[rows], times[rows])
+        return volatilities
+
+    def _resolve_spots(self, symbols, spots: dict = None) -> dict:
+        """Return `spots` completed with one bulk fetch for any of `symbols` it lacks."""
+        spots = dict(spots or {})
+        missing = [symbol for symbol in symbols if symbol not in spots]
+        if missing:
+            with self.metrics.timer("fetch"):
+                spots.update(self.data_provider.fetch_ticker_prices(missing))
+        return spots
+
+    @timed("calculate_call_batch")
+    def calculate_call_batch(self, spot, strike, time_to_expiration, volatility, risk_free_rate):
+        """Calculate prices & Greeks for arrays of call options in one vectorised pass."""
+        strategy = self.strategies['Black-Scholes']
+        return strategy.calculate_call_values_batch(spot, strike, time_to_expiration, volatility, risk_free_rate)
+
+    @timed("calculate_put_batch")
+    def calculate_put_batch(self, spot, strike, time_to_expiration, volatility, risk_free_rate):
+        """Calculate prices & Greeks for arrays of put options in one vectorised pass."""
+        strategy = self.strategies['Black-Scholes']
+        return strategy.calculate_put_values_batch(spot, strike, time_to_expiration, volatility, risk_free_rate)
+
+    @timed("calculate_call_put_batch")
+    def calculate_call_put_batch(self, spot, strike, time_to_expiration, volatility, risk_free_rate):
+        """
+        Calculate call and put prices & Greeks for arrays of options from shared intermediates.
+
+        Large batches are sharded across the `batch_executor` when one was given.
+        """
+        strategy = self.batch_executor or self.strategies['Black-Scholes']
+        return strategy.calculate_call_put_values_batch(spot, strike, time_to_expiration, volatility, risk_free_rate)
+
+    @timed("calculate_implied_volatility")
+    def calculate_implied_volatility(self, market_price, spot, strike, time_to_expiration, risk_free_rate, is_call):
+        """Invert arrays of quoted prices into implied volatilities, with per-option iteration counts and convergence flags."""
+        return self.implied_volatility_solver.solve(market_price, spot, strike, time_to_expiration, risk_free_rate, is_call)
+
+    @timed("calculate_grid")
+    def calculate_grid(self, option, risk_free_rate: float, vol_range, spot_range):
+        """
+        Price an option over a volatility x spot mesh in a single broadcast pass.
+
+        Rows follow `vol_range` and columns follow `spot_range`. Returns a dict with
+        "call" and "put" entries, each mapping price and Greeks to 2-D arrays.
+        Meshes are memoized, so the returned arrays are read-only.
+        """
+        strategy = self.strategies['Black-Scholes']
+        T = option.time_to_expiration()
+        spots = np.asarray(spot_range, dtype=np.float64)[np.newaxis, :]
+        vols = np.asarray(vol_range, dtype=np.float64)[:, np.newaxis]
+        key = self.result_cache.key("grid", option.strike_price, T, risk_free_rate, vols, spots)
+        grids = self.result_cache.get(key)
+        if grids is None:
+            grids = self.result_cache.put(
+                key, strategy.calculate_call_put_values_batch(spots, option.strike_price, T, vols, risk_free_rate))
+        return grids
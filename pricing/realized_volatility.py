@@ -0,0 +1,84 @@
+"""
+Rolling realized-volatility estimators over daily OHLC bars.
+
+Every estimator takes arrays with dates along axis 0, so a (date x symbol)
+panel is estimated for all symbols in one pass, and returns annualised
+volatilities of the same shape. Row t uses the `window` bars ending at t; rows
+without a full window of finite inputs are NaN.
+"""
+import numpy as np
+
+TRADING_DAYS = 252
+
+def _rolling_sum(values, window: int):
+    """Sum of each trailing `window` of rows, NaN where the window is short or holds a NaN."""
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values)
+    zero = np.zeros((1,) + values.shape[1:])
+    sums = np.concatenate([zero, np.cumsum(np.where(finite, values, 0.0), axis=0)])
+    counts = np.concatenate([zero, np.cumsum(finite, axis=0)])
+    result = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        complete = counts[window:] - counts[:-window] == window
+        result[window - 1:] = np.where(complete, sums[window:] - sums[:-window], np.nan)
+    return result
+
+def _rolling_variance(values, window: int):
+    """Sample variance of each trailing `window` of rows."""
+    values = np.asarray(values, dtype=np.float64)
+    # Centre on the overall mean so the running sums do not cancel catastrophically
+    finite = np.isfinite(values)
+    values = values - np.where(finite, values, 0.0).sum(axis=0) / np.maximum(finite.sum(axis=0), 1)
+    total = _rolling_sum(values, window)
+    return (_rolling_sum(values * values, window) - total * total / window) / (window - 1)
+
+def _previous(values):
+    """Rows shifted down by one, with a NaN first row."""
+    values = np.asarray(values, dtype=np.float64)
+    return np.concatenate([np.full((1,) + values.shape[1:], np.nan), values[:-1]])
+
+def close_to_close(close, window: int = 21, periods_per_year: int = TRADING_DAYS):
+    """Standard deviation of daily log returns."""
+    returns = np.log(close / _previous(close))
+    return np.sqrt(np.maximum(_rolling_variance(returns, window), 0.0) * periods_per_year)
+
+def parkinson(high, low, window: int = 21, periods_per_year: int = TRADING_DAYS):
+    """High-low range estimator; uses no closes, so it ignores overnight gaps."""
+    log_range = np.log(np.asarray(high, dtype=np.float64) / low)
+    variance = _rolling_sum(log_range * log_range, window) / (window * 4 * np.log(2))
+    return np.sqrt(variance * periods_per_year)
+
+def yang_zhang(open, high, low, close, window: int = 21, periods_per_year: int = TRADING_DAYS):
+    """
+    Yang-Zhang estimator: overnight, open-to-close and Rogers-Satchell variances combined.
+
+    Handles both opening jumps and drift, with the minimum-variance weight
+    k = 0.34 / (1.34 + (n + 1) / (n - 1)).
+    """
+    open, high, low, close = (np.asarray(x, dtype=np.float64) for x in (open, high, low, close))
+    overnight = np.log(open / _previous(close))
+    open_to_close = np.log(close / open)
+    high_open, low_open = np.log(high / open), np.log(low / open)
+    rogers_satchell = high_open * (high_open - open_to_close) + low_open * (low_open - open_to_close)
+    # The first bar has no previous close, so its open-to-close and range terms are dropped too
+    open_to_close = np.where(np.isfinite(overnight), open_to_close, np.nan)
+    rogers_satchell = np.where(np.isfinite(overnight), rogers_satchell, np.nan)
+
+    k = 0.34 / (1.34 + (window + 1) / (window - 1))
+    variance = (_rolling_variance(overnight, window) + k * _rolling_variance(open_to_close, window)
+                + (1 - k) * _rolling_sum(rogers_satchell, window) / window)
+    return np.sqrt(np.maximum(variance, 0.0) * periods_per_year)
+
+ESTIMATORS = {
+    "close_to_close": lambda panel, window: close_to_close(panel["close"], window),
+    "parkinson": lambda panel, window: parkinson(panel["high"], panel["low"], window),
+    "yang_zhang": lambda panel, window: yang_zhang(panel["open"], panel["high"], panel["low"], panel["close"], window),
+}
+
+def realized_volatility(panel: dict, window: int = 21, method: str = "yang_zhang"):
+    """
+    Apply a named estimator to an OHLC panel such as `HistoryStore.history_panel` returns.
+
+    :param method: "close_to_close", "parkinson" or "yang_zhang".
+    """
+    return ESTIMATORS[method](panel, window)
@@ -0,0 +1,82 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+from pricing.metrics import DISABLED_METRICS
+
+class ResultCache:
+    """
+    Bounded LRU cache of pricing results keyed on quantized inputs.
+
+    Floats are snapped to multiples of `tolerance` before they form a key, so
+    inputs that differ by less than the tolerance share an entry. Keys carry
+    every pricing input, the spots included, so nothing needs invalidating when
+    a spot moves: the new spot simply forms a new key, and entries for old spots
+    age out of the LRU. Cached arrays are made read-only and cached dicts are
+    copied on the way out, so callers cannot corrupt them.
+    """
+    metrics = DISABLED_METRICS
+
+    def __init__(self, max_size: int = 1024, tolerance: float = 1e-8):
+        self.max_size = max_size
+        self.tolerance = tolerance
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, *values) -> tuple:
+        """Build a key from strings, numbers and arrays, quantizing every float."""
+        return tuple(self._quantize(value) for value in values)
+
+    def get(self, key):
+        """Return a copy of the cached result for `key`, or None, recording the hit or miss."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                self.metrics.increment("result_cache_miss")
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        self.metrics.increment("result_cache_hit")
+        return _copy(result)
+
+    def put(self, key, result):
+        """Store `result` under `key` and return a copy."""
+        result = _freeze(result)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return _copy(result)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _quantize(self, value):
+        if isinstance(value, (str, bool, type(None))):
+            return value
+        if isinstance(value, (int, float)):
+            return round(value / self.tolerance)
+        array = np.asarray(value)
+        if array.ndim == 0:
+            return round(float(array) / self.tolerance)
+        return array.shape, np.rint(array / self.tolerance).astype(np.int64).tobytes()
+
+def _freeze(result):
+    if isinstance(result, dict):
+        return {key: _freeze(value) for key, value in result.items()}
+    if isinstance(result, np.ndarray):
+        result.flags.writeable = False
+    return result
+
+def _copy(result):
+    if isinstance(result, dict):
+        return {key: _copy(value) for key, value in result.items()}
+    return result
@@ -0,0 +1,141 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from pricing.black_scholes import BlackScholesStrategy
+
+AXES = ("spot", "volatility", "rate", "time")
+
+# Per-process scenario state, set once per run (or once per worker) to avoid
+# pickling the position columns with every chunk
+_state = None
+
+def _set_state(state):
+    global _state
+    _state = state
+
+def _evaluate_chunk(start: int, stop: int):
+    """
+    Revalue scenarios [start, stop) of the cube and return their total P&L.
+
+    Per-position P&L is written to the spill file when one is configured.
+    """
+    state = _state
+    scenario_ids = np.arange(start, stop)
+    i_spot, i_vol, i_rate, i_time = np.unravel_index(scenario_ids, state["shape"])
+
+    spots = state["spots"] * (1.0 + state["spot_shocks"][i_spot, np.newaxis])
+    vols = np.maximum(state["vols"] + state["vol_shocks"][i_vol, np.newaxis], 1e-8)
+    rates = state["rate"] + state["rate_shocks"][i_rate, np.newaxis]
+    times = state["times"] - state["time_shifts"][i_time, np.newaxis] / 365.0
+
+    results = state["strategy"].calculate_call_put_values_batch(spots, state["strikes"], times, vols, rates)
+    prices = np.where(state["is_call"], results["call"]["price"], results["put"]["price"])
+    pnl = (prices - state["base_prices"]) * state["quantities"]
+
+    if state["spill_path"] is not None:
+        spill = np.load(state["spill_path"], mmap_mode="r+")
+        spill[start:stop] = pnl[:, state["inverse_order"]]
+        spill.flush()
+        del spill
+    return pnl.sum(axis=1)
+
+
+class ScenarioEngine:
+    """
+    Full revaluation of a `Portfolio` over a spot x volatility x rate x time cube.
+
+    Scenarios are evaluated in chunks sized so that each chunk holds about
+    `chunk_size` position revaluations, and only the total P&L per scenario is
+    kept in memory. The full scenario x position P&L can optionally be spilled to
+    a memory-mapped `.npy` file. Chunks can be spread over a process pool.
+    """
+
+    def __init__(self, strategy=None, chunk_size: int = 1_000_000, n_workers: int = 1):
+        self.strategy = strategy or BlackScholesStrategy()
+        self.chunk_size = chunk_size
+        self.n_workers = n_workers
+
+    def run(self, portfolio, spots: dict, volatility, risk_free_rate: float,
+            spot_shocks=(0.0,), vol_shocks=(0.0,), rate_shocks=(0.0,), time_shifts=(0.0,),
+            confidence_levels=(0.95, 0.99), spill_path=None, today=None) -> dict:
+        """
+        Revalue every position under every scenario of the cube.
+
+        :param portfolio: The `Portfolio` to stress.
+        :param spots: Dict of symbol to current spot price, covering every underlying.
+        :param volatility: Current volatility, scalar or one per position in the order the positions were given.
+        :param risk_free_rate: Current risk-free interest rate.
+        :param spot_shocks: Relative spot moves, e.g. -0.1 for a 10% fall.
+        :param vol_shocks: Absolute volatility moves, e.g. 0.05 for +5 vol points.
+        :param rate_shocks: Absolute rate moves.
+        :param time_shifts: Days to roll forward.
+        :param confidence_levels: Confidence levels for the value-at-risk figures.
+        :param spill_path: Optional `.npy` path for the scenario x position P&L, positions in input order.
+        :param today: Valuation date; defaults to today.
+        :return: A dictionary with the "pnl" cube of total P&L, "max_loss", the
+            "worst_scenario" shocks, "var" per confidence level and "by_axis"
+            min/mean/max P&L for each value of each axis.
+        """
+        axes = [np.atleast_1d(np.asarray(values, dtype=np.float64))
+                for values in (spot_shocks, vol_shocks, rate_shocks, time_shifts)]
+        shape = tuple(len(values) for values in axes)
+        n_scenarios = int(np.prod(shape))
+        n_positions = len(portfolio)
+
+        missing = [symbol for symbol in portfolio.symbols if symbol not in spots]
+        if missing:
+            raise ValueError(f"No spot price for: {', '.join(missing)}")
+        spot_column = np.array([spots[symbol] for symbol in portfolio.symbols])[portfolio.symbol_ids]
+        vols = portfolio.per_position(volatility)
+        times = portfolio.time_to_expiration(today)
+        base = self.strategy.calculate_call_put_values_batch(spot_column, portfolio.strikes, times, vols, risk_free_rate)
+
+        if spill_path is not None:
+            np.lib.format.open_memmap(spill_path, mode="w+", dtype=np.float64, shape=(n_scenarios, n_positions)).flush()
+
+        state = {
+            "strategy": self.strategy,
+            "shape": shape,
+            "spot_shocks": axes[0], "vol_shocks": axes[1], "rate_shocks": axes[2], "time_shifts": axes[3],
+            "spots": spot_column, "vols": vols, "rate": risk_free_rate, "times": times,
+            "strikes": portfolio.strikes, "is_call": portfolio.is_call, "quantities": portfolio.quantities,
+            "base_prices": np.where(portfolio.is_call, base["call"]["price"], base["put"]["price"]),
+            "spill_path": spill_path, "inverse_order": portfolio.inverse_order,
+        }
+        scenarios_per_chunk = max(1, self.chunk_size // max(n_positions, 1))
+        bounds = [(start, min(start + scenarios_per_chunk, n_scenarios))
+                  for start in range(0, n_scenarios, scenarios_per_chunk)]
+
+        totals = np.empty(n_scenarios)
+        if self.n_workers > 1 and len(bounds) > 1:
+            with ProcessPoolExecutor(max_workers=self.n_workers, initializer=_set_state, initargs=(state,)) as pool:
+                for (start, stop), chunk in zip(bounds, pool.map(_evaluate_chunk, *zip(*bounds))):
+                    totals[start:stop] = chunk
+        else:
+            _set_state(state)
+            try:
+                for start, stop in bounds:
+                    totals[start:stop] = _evaluate_chunk(start, stop)
+            finally:
+                _set_state(None)
+
+        return self._summarise(totals.reshape(shape), axes, confidence_levels)
+
+    @staticmethod
+    def _summarise(pnl, axes, confidence_levels) -> dict:
+        worst = np.unravel_index(np.argmin(pnl), pnl.shape)
+        by_axis = {}
+        for axis, (name, values) in enumerate(zip(AXES, axes)):
+            others = tuple(i for i in range(pnl.ndim) if i != axis)
+            by_axis[name] = {
+                "shocks": values,
+                "min": pnl.min(axis=others),
+                "mean": pnl.mean(axis=others),
+                "max": pnl.max(axis=others),
+            }
+        return {
+            "pnl": pnl,
+            "max_loss": float(-min(pnl.min(), 0.0)),
+            "worst_scenario": {name: float(values[i]) for name, values, i in zip(AXES, axes, worst)},
+            "var": {level: float(-np.percentile(pnl, 100 * (1 - level))) for level in confidence_levels},
+            "by_axis": by_axis,
+        }
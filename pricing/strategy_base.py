@@ -1,10 +1,12 @@
 import abc
 from domain.option import Option
+from pricing.metrics import DISABLED_METRICS
 
 class PricingStrategy(abc.ABC):
     """
     Base class for pricing
     """
+    metrics = DISABLED_METRICS
     @abc.abstractmethod
     def calculate_call_values(self, option: Option, spot_price: float,
                   volatility: float, risk_free_rate: float) -> dict:
@@ -31,4 +33,54 @@ class PricingStrategy(abc.ABC):
         :param risk_free_rate: The risk-free interest rate.
         :return: A dictionary containing the calculated price and other relevant data.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def calculate_call_put_values(self, option: Option, spot_price: float,
+                                  volatility: float, risk_free_rate: float) -> dict:
+        """
+        Calculate the values for the call and the put together.
+
+        Subclasses that can share work between the two sides should override this.
+
+        :param option: The option to price.
+        :param spot_price: The current spot price of the underlying asset.
+        :param volatility: The volatility of the underlying asset.
+        :param risk_free_rate: The risk-free interest rate.
+        :return: A dictionary with "call" and "put" entries.
+        """
+        return {
+            "call": self.calculate_call_values(option, spot_price, volatility, risk_free_rate),
+            "put": self.calculate_put_values(option, spot_price, volatility, risk_free_rate),
+        }
+
+    def calculate_call_values_batch(self, spot_price, strike_price, time_to_expiration,
+                                    volatility, risk_free_rate) -> dict:
+        """
+        Calculate the values for many call options at once.
+
+        Inputs are array-like and broadcast against each other.
+
+        :param spot_price: The spot prices of the underlying asset.
+        :param strike_price: The strike prices of the options.
+        :param time_to_expiration: The times to expiration in years.
+        :param volatility: The volatilities of the underlying asset.
+        :param risk_free_rate: The risk-free interest rates.
+        :return: A dictionary mapping each value name to an array of results.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def calculate_put_values_batch(self, spot_price, strike_price, time_to_expiration,
+                                   volatility, risk_free_rate) -> dict:
+        """
+        Calculate the values for many put options at once.
+
+        Inputs are array-like and broadcast against each other.
+
+        :param spot_price: The spot prices of the underlying asset.
+        :param strike_price: The strike prices of the options.
+        :param time_to_expiration: The times to expiration in years.
+        :param volatility: The volatilities of the underlying asset.
+        :param risk_free_rate: The risk-free interest rates.
+        :return: A dictionary mapping each value name to an array of results.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
@@ -0,0 +1,129 @@
+import numpy as np
+from pricing.black_scholes import SQRT_2PI
+from pricing.portfolio_valuation import GREEKS, PortfolioValuation
+
+class TaylorValuation(PortfolioValuation):
+    """
+    Portfolio valuation that revalues small moves from cached Greeks.
+
+    Every full reprice stores each position's spot, volatility, time, price and
+    Greeks as its anchor. Later revaluations estimate prices from the second
+    order expansion around the anchor
+
+        price + delta dS + gamma dS^2 / 2 + vega dsigma + theta dt
+
+    and delta from delta + gamma dS + vanna dsigma; the other Greeks stay at
+    their anchor values. The leading terms the expansion leaves out (speed
+    dS^3 / 6, vanna dS dsigma and volga dsigma^2 / 2) give a per-position error
+    estimate. Positions whose move exceeds a threshold, or whose estimate
+    exceeds `max_error`, are fully repriced instead and re-anchored.
+    """
+
+    def __init__(self, portfolio, strategy, volatility, risk_free_rate, today=None, max_spot_move: float = 0.02,
+                 max_vol_move: float = 0.02, max_days: float = 1.0, max_error: float = 0.01):
+        """
+        :param max_spot_move: Largest relative spot move from the anchor approximated.
+        :param max_vol_move: Largest absolute volatility move from the anchor approximated, e.g. 0.02 for 2 points.
+        :param max_days: Largest time decay from the anchor approximated, in days.
+        :param max_error: Largest estimated price error per unit approximated.
+        """
+        super().__init__(portfolio, strategy, volatility, risk_free_rate, today)
+        self.max_spot_move = max_spot_move
+        self.max_vol_move = max_vol_move
+        self.max_days = max_days
+        self.max_error = max_error
+        self.expiry_times = self.times
+        self.elapsed_days = 0.0
+        n_positions = len(portfolio)
+        self.anchor = {key: np.full(n_positions, np.nan)
+                       for key in ("spot", "volatility", "time", "price", "speed", "vanna", "volga") + GREEKS}
+        self.approximated = 0
+        self.repriced = 0
+
+    def revalue(self, spots: dict, volatility=None, elapsed_days: float = None):
+        """
+        Revalue the whole book against a dict of symbol to spot price.
+
+        :param volatility: New volatility, scalar or one per position; unchanged if omitted.
+        :param elapsed_days: Days since the valuation was created; unchanged if omitted.
+        """
+        self._move(volatility, elapsed_days)
+        self.spots.update(spots)
+        spot_column = np.array([self.spots[symbol] for symbol in self.portfolio.symbols])[self.portfolio.symbol_ids]
+        self._revalue_slice(slice(None), spot_column)
+        return self
+
+    def update_spot(self, symbol: str, spot: float):
+        """Revalue only the positions on `symbol` after its spot ticks."""
+        self.spots[symbol] = spot
+        self._revalue_slice(self.portfolio.positions_for(symbol), spot)
+        return self
+
+    def reprice(self):
+        """Fully reprice and re-anchor every position at the current inputs."""
+        return PortfolioValuation.revalue(self, self.spots)
+
+    def _move(self, volatility, elapsed_days):
+        if volatility is not None:
+            self.volatility = self.portfolio.per_position(volatility)
+        if elapsed_days is not None:
+            self.elapsed_days = elapsed_days
+            self.times = self.expiry_times - elapsed_days / 365.0
+
+    def _revalue_slice(self, positions: slice, spot):
+        # Slices keep every anchor read a view rather than a gathered copy
+        anchor = {key: column[positions] for key, column in self.anchor.items()}
+        d_spot = spot - anchor["spot"]
+        d_vol = self.volatility[positions] - anchor["volatility"]
+        d_days = (anchor["time"] - self.times[positions]) * 365.0
+
+        # Products rather than ** 3, which goes through the much slower generic pow
+        error = np.abs(anchor["speed"] / 6 * d_spot * d_spot + anchor["vanna"] * d_vol)
+        error *= np.abs(d_spot)
+        error += np.abs(anchor["volga"] / 2 * d_vol * d_vol)
+        # NaN anchors (never priced) compare False and so are repriced
+        within = error <= self.max_error
+        within &= np.abs(d_spot) <= self.max_spot_move * anchor["spot"]
+        within &= np.abs(d_vol) <= self.max_vol_move
+        within &= d_days <= self.max_days
+
+        price = anchor["delta"] + 0.5 * anchor["gamma"] * d_spot
+        price *= d_spot
+        price += anchor["price"] + anchor["vega"] * 100 * d_vol + anchor["theta"] * d_days
+        delta = anchor["delta"] + anchor["gamma"] * d_spot + anchor["vanna"] * d_vol
+        np.copyto(self.unit_values["price"][positions], price, where=within)
+        np.copyto(self.unit_values["delta"][positions], delta, where=within)
+
+        fallback = np.flatnonzero(~within)
+        if len(fallback):
+            self._price_slice(np.arange(len(self.portfolio))[positions][fallback],
+                              spot[fallback] if np.ndim(spot) else spot)
+        n_approximated = len(within) - len(fallback)
+        self.approximated += n_approximated
+        self.repriced += len(fallback)
+        self.strategy.metrics.increment("taylor_approximated", n_approximated)
+        self.strategy.metrics.increment("taylor_repriced", len(fallback))
+
+    def _price_slice(self, positions, spot):
+        super()._price_slice(positions, spot)
+        S = np.broadcast_to(np.asarray(spot, dtype=np.float64), self.portfolio.strikes[positions].shape)
+        K, T = self.portfolio.strikes[positions], self.times[positions]
+        sigma = self.volatility[positions]
+        anchor = self.anchor
+        anchor["spot"][positions] = S
+        anchor["volatility"][positions] = sigma
+        anchor["time"][positions] = T
+        for key, column in self.unit_values.items():
+            anchor[key][positions] = column[positions]
+
+        # Third-order sensitivities are shared by calls and puts; expired positions have none
+        live = T > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sqrt_T = np.sqrt(np.where(live, T, 1.0))
+            d1 = (np.log(S / K) + (self.risk_free_rate + sigma ** 2 / 2) * sqrt_T ** 2) / (sigma * sqrt_T)
+            d2 = d1 - sigma * sqrt_T
+            n_d1 = np.exp(-0.5 * d1 ** 2) / SQRT_2PI
+            gamma = n_d1 / (S * sigma * sqrt_T)
+            anchor["speed"][positions] = np.where(live, -gamma / S * (1 + d1 / (sigma * sqrt_T)), 0.0)
+            anchor["vanna"][positions] = np.where(live, -n_d1 * d2 / sigma, 0.0)
+            anchor["volga"][positions] = np.where(live, S * n_d1 * sqrt_T * d1 * d2 / sigma, 0.0)
@@ -0,0 +1,148 @@
+import numpy as np
+
+MIN_VOLATILITY = 1e-4
+
+class VolatilitySurface:
+    """
+    Implied-volatility surface of one underlying, sampled on a dense grid.
+
+    Each expiry's quotes are fitted with a quadratic smile in log-moneyness
+    ln(K / spot). Between expiries, total variance sigma^2 * T is interpolated
+    linearly in time; before the first and after the last expiry the nearest
+    smile is held flat. The result is precomputed on a regular time x
+    moneyness grid, so a lookup is a bilinear blend of four array reads
+    whatever the number of quotes.
+
+    Refitting one expiry only recomputes the grid rows between its
+    neighbouring expiries.
+    """
+
+    def __init__(self, spot: float, moneyness_range=(-1.0, 1.0), n_moneyness: int = 201,
+                 max_time: float = None, n_times: int = 256):
+        """
+        :param spot: Spot price that moneyness is measured against.
+        :param moneyness_range: Lowest and highest log-moneyness on the grid; lookups outside are clamped.
+        :param n_moneyness: Grid points along the moneyness axis.
+        :param max_time: Longest time on the grid, in years; defaults to the last fitted expiry.
+        :param n_times: Grid points along the time axis.
+        """
+        self.spot = spot
+        self.moneyness = np.linspace(*moneyness_range, n_moneyness)
+        self.max_time = max_time
+        self.n_times = n_times
+        self.expiries = np.empty(0)
+        self.coefficients = np.empty((0, 3))
+        self.times = None
+        self.grid = None
+
+    def fit(self, quotes: dict):
+        """
+        Fit every smile and build the grid.
+
+        :param quotes: Dict of time to expiration in years to (strikes, implied vols).
+        """
+        expiries = sorted(quotes)
+        self.expiries = np.array(expiries, dtype=np.float64)
+        self.coefficients = np.array([self._fit_smile(*quotes[expiry]) for expiry in expiries])
+        self.times = np.linspace(0.0, self.max_time or self.expiries[-1], self.n_times)
+        self.grid = self._volatility_rows(self.times)
+        return self
+
+    def update_expiry(self, expiry: float, strikes, volatilities):
+        """
+        Refit the smile of one expiry, adding it if new, and refresh only the grid rows it affects.
+
+        Rebuilds the whole grid instead when `expiry` lies beyond the grid's time axis.
+        """
+        if self.grid is None or expiry > self.times[-1]:
+            coefficients = dict(zip(self.expiries, self.coefficients))
+            coefficients[expiry] = self._fit_smile(strikes, volatilities)
+            self.expiries = np.array(sorted(coefficients), dtype=np.float64)
+            self.coefficients = np.array([coefficients[t] for t in self.expiries])
+            self.times = np.linspace(0.0, self.max_time or self.expiries[-1], self.n_times)
+            self.grid = self._volatility_rows(self.times)
+            return self
+
+        position = np.searchsorted(self.expiries, expiry)
+        if position < len(self.expiries) and self.expiries[position] == expiry:
+            self.coefficients[position] = self._fit_smile(strikes, volatilities)
+        else:
+            self.expiries = np.insert(self.expiries, position, expiry)
+            self.coefficients = np.insert(self.coefficients, position, self._fit_smile(strikes, volatilities), axis=0)
+
+        # Rows strictly between the neighbouring expiries depend on this smile;
+        # with no neighbour on a side, the flat extrapolation there does too
+        lower = self.expiries[position - 1] if position > 0 else -np.inf
+        upper = self.expiries[position + 1] if position + 1 < len(self.expiries) else np.inf
+        rows = np.flatnonzero((self.times > lower) & (self.times < upper))
+        self.grid[rows] = self._volatility_rows(self.times[rows])
+        return self
+
+    def smile(self, expiry: float, strikes) -> np.ndarray:
+        """Evaluate the fitted smile of a quoted expiry at `strikes`, bypassing the grid."""
+        position = int(np.flatnonzero(self.expiries == expiry)[0])
+        return self._evaluate(self.coefficients[position], np.log(np.asarray(strikes, dtype=np.float64) / self.spot))
+
+    def lookup(self, strikes, times) -> np.ndarray:
+        """
+        Implied volatilities for arrays of strikes and times to expiration.
+
+        Inputs broadcast against each other; points off the grid are clamped to its edges.
+        Strikes must be positive and finite, and times finite.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            k = np.log(np.asarray(strikes, dtype=np.float64) / self.spot)
+        times = np.asarray(times, dtype=np.float64)
+        # NaN survives the clamp and would become an arbitrary grid index
+        if not np.isfinite(k).all():
+            raise ValueError("Strikes must be positive and finite")
+        if not np.isfinite(times).all():
+            raise ValueError("Times to expiration must be finite")
+        column, column_weight = self._locate(k, self.moneyness)
+        row, row_weight = self._locate(times, self.times)
+        flat, width = self.grid.ravel(), self.grid.shape[1]
+        corner = row * width + column
+        near = flat.take(corner)
+        near += (flat.take(corner + 1) - near) * column_weight
+        far = flat.take(corner + width)
+        far += (flat.take(corner + width + 1) - far) * column_weight
+        near += (far - near) * row_weight
+        return near
+
+    @staticmethod
+    def _locate(values, axis):
+        """Lower grid index and interpolation weight of each value on a uniform axis."""
+        step = axis[1] - axis[0]
+        position = np.clip((values - axis[0]) / step, 0.0, len(axis) - 1)
+        index = np.minimum(position.astype(np.intp), len(axis) - 2)
+        return index, position - index
+
+    def _fit_smile(self, strikes, volatilities) -> np.ndarray:
+        """Least-squares (a, b, c) of sigma = a + b k + c k^2, lowering the degree for few quotes."""
+        k = np.log(np.asarray(strikes, dtype=np.float64) / self.spot)
+        volatilities = np.asarray(volatilities, dtype=np.float64)
+        degree = min(2, len(k) - 1)
+        coefficients = np.zeros(3)
+        coefficients[:degree + 1] = np.polynomial.polynomial.polyfit(k, volatilities, degree)
+        return coefficients
+
+    @staticmethod
+    def _evaluate(coefficients, k):
+        a, b, c = coefficients
+        return np.maximum(a + (b + c * k) * k, MIN_VOLATILITY)
+
+    def _volatility_rows(self, times) -> np.ndarray:
+        """Grid rows for `times`: total-variance interpolation between smiles, flat outside them."""
+        k = self.moneyness
+        smiles = np.array([self._evaluate(coefficients, k) for coefficients in self.coefficients])
+        expiries = self.expiries
+        if len(expiries) == 1:
+            return np.broadcast_to(smiles[0], (len(times), len(k))).copy()
+
+        upper = np.clip(np.searchsorted(expiries, times), 1, len(expiries) - 1)
+        lower = upper - 1
+        t0, t1 = expiries[lower][:, np.newaxis], expiries[upper][:, np.newaxis]
+        w0, w1 = smiles[lower] ** 2 * t0, smiles[upper] ** 2 * t1
+        t = np.clip(times, expiries[0], expiries[-1])[:, np.newaxis]
+        variance = w0 + (w1 - w0) * (t - t0) / (t1 - t0)
+        return np.sqrt(np.maximum(variance, 0.0) / t)
@@ -0,0 +1,352 @@
+"""
+Local HTTP/JSON pricing service with request micro-batching.
+
+Concurrent single-option requests arriving within a short window are
+coalesced into one vectorised Black-Scholes evaluation and the results fanned
+back out to their callers. Requests beyond `max_pending`, counting every
+option of a batch, are rejected with 503 instead of queueing without bound.
+Malformed requests get 400 and failed spot fetches 502.
+
+Endpoints:
+
+- POST /price: one option, returns {"call": {...}, "put": {...}}
+- POST /price/batch: a list of options, priced directly as one batch
+- GET /stats: request, batch and latency statistics as JSON
+- GET /metrics: the same in the Prometheus text format
+- GET /health
+
+An option is a JSON object with `strike_price`, `volatility`, `risk_free_rate`,
+`time_to_expiration` (years) or `expiration_date` (YYYY-MM-DD), and
+`spot_price` or an `underlying_symbol` whose spot is fetched.
+
+Run from the repository root with:
+
+    python -m service.pricing_service --port 8000 --window-ms 2
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import date
+import numpy as np
+from pricing.metrics import Metrics
+from pricing.pricing_engine import PricingEngine
+
+FIELDS = ("price", "delta", "gamma", "vega", "theta", "rho")
+MAX_BODY_BYTES = 1 << 20
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large",
+           500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable"}
+
+class Overloaded(Exception):
+    """Raised when a request arrives while `max_pending` requests are already queued or in flight."""
+
+class BadRequest(Exception):
+    """Raised when a request line or its headers cannot be parsed."""
+
+class UpstreamError(Exception):
+    """Raised when the spot of an underlying cannot be fetched."""
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-option requests into vectorised evaluations.
+
+    The first request of a batch starts a `window`-second timer; the batch is
+    priced when the timer fires or `max_batch_size` requests have gathered,
+    whichever comes first. A window of 0 prices every request on its own.
+    """
+
+    def __init__(self, strategy, window: float = 0.002, max_batch_size: int = 1024, max_pending: int = 10_000,
+                 metrics: Metrics = None):
+        self.strategy = strategy
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.max_pending = max_pending
+        self.metrics = metrics or Metrics(enabled=True)
+        self.pending = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self._queue = []
+        self._timer = None
+
+    @contextmanager
+    def admit(self, count: int = 1):
+        """Count `count` requests as pending while the block runs, or raise `Overloaded` if they do not fit."""
+        if self.pending + count > self.max_pending:
+            self.metrics.increment("rejected")
+            raise Overloaded(f"More than {self.max_pending} requests pending")
+        self.pending += count
+        try:
+            yield
+        finally:
+            self.pending -= count
+
+    async def price(self, spot, strike, time_to_expiration, volatility, risk_free_rate) -> dict:
+        with self.admit():
+            return await self.enqueue(spot, strike, time_to_expiration, volatility, risk_free_rate)
+
+    async def enqueue(self, spot, strike, time_to_expiration, volatility, risk_free_rate) -> dict:
+        """Price one option with the next batch; the caller has already admitted it."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append(((spot, strike, time_to_expiration, volatility, risk_free_rate), future))
+        if self.window <= 0 or len(self._queue) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+        started = time.perf_counter()
+        try:
+            columns = np.array([inputs for inputs, _ in queue], dtype=np.float64).T
+            results = self.strategy.calculate_call_put_values_batch(*columns)
+        except Exception as exc:
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for i, (_, future) in enumerate(queue):
+            if not future.done():
+                future.set_result({side: {field: float(results[side][field][i]) for field in FIELDS}
+                                   for side in ("call", "put")})
+        self.batches += 1
+        self.batched_requests += len(queue)
+        self.metrics.observe("batch", time.perf_counter() - started)
+
+class PricingService:
+    """
+    asyncio HTTP/1.1 server exposing a `PricingEngine` over JSON.
+
+    :param engine: Engine used for spot fetches and batch pricing.
+    :param window: Micro-batching window in seconds; 0 disables batching.
+    :param max_batch_size: Largest coalesced batch.
+    :param max_pending: Requests queued or in flight before new ones get 503.
+    :param latency_samples: Recent request latencies kept for percentiles.
+    """
+
+    def __init__(self, engine: PricingEngine = None, window: float = 0.002, max_batch_size: int = 1024,
+                 max_pending: int = 10_000, latency_samples: int = 10_000):
+        self.engine = engine or PricingEngine()
+        self.metrics = Metrics(enabled=True)
+        self.strategy = self.engine.strategies['Black-Scholes']
+        self.batcher = MicroBatcher(self.strategy, window, max_batch_size, max_pending, self.metrics)
+        self.latencies = deque(maxlen=latency_samples)
+        self.requests = 0
+        self.errors = 0
+        self.started = time.monotonic()
+        self._server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8000):
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self.started = time.monotonic()
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def stats(self) -> dict:
+        uptime = time.monotonic() - self.started
+        latencies = np.array(self.latencies)
+        percentiles = map(float, np.percentile(latencies, [50, 95, 99]) * 1e3) if latencies.size else [None] * 3
+        batcher = self.batcher
+        return {
+            "uptime_seconds": uptime,
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.metrics.snapshot()["counters"].get("rejected", 0),
+            "requests_per_second": self.requests / uptime if uptime else 0.0,
+            "pending": batcher.pending,
+            "batches": batcher.batches,
+            "mean_batch_size": batcher.batched_requests / batcher.batches if batcher.batches else 0.0,
+            "latency_ms": dict(zip(("p50", "p95", "p99"), percentiles)),
+            "batching": {"window_ms": batcher.window * 1e3, "max_batch_size": batcher.max_batch_size,
+                         "max_pending": batcher.max_pending},
+        }
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except BadRequest as exc:
+                    # The stream can no longer be framed, so answer and close
+                    self._write_response(writer, 400, {"error": str(exc)}, keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                started = time.perf_counter()
+                status, payload = await self._route(method, path, body)
+                latency = time.perf_counter() - started
+                # An oversized body is left unread, so that connection cannot be reused
+                keep_alive = body is not None and headers.get("connection", "").lower() != "close"
+                status = self._write_response(writer, status, payload, keep_alive)
+                if path.startswith("/price"):
+                    self.requests += 1
+                    self.latencies.append(latency)
+                    self.metrics.observe("request", latency)
+                    self.errors += status not in (200, 503)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise BadRequest(f"Malformed request line: {request_line[:100]!r}") from None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise BadRequest(f"Malformed Content-Length: {headers['content-length'][:100]!r}") from None
+        if length < 0:
+            raise BadRequest(f"Negative Content-Length: {length}")
+        if length > MAX_BODY_BYTES:
+            body = None
+        else:
+            body = await reader.readexactly(length) if length else b""
+        return method, path, headers, body
+
+    async def _route(self, method, path, body):
+        if body is None:
+            return 413, {"error": f"Body larger than {MAX_BODY_BYTES} bytes"}
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        if method == "GET" and path == "/stats":
+            return 200, self.stats()
+        if method == "GET" and path == "/metrics":
+            return 200, self.metrics.to_prometheus()
+        if method != "POST" or path not in ("/price", "/price/batch"):
+            return 404, {"error": f"No route for {method} {path}"}
+        try:
+            payload = json.loads(body)
+            if path == "/price":
+                # Admitted before the spot fetch, so queued fetches count against max_pending too
+                with self.batcher.admit():
+                    return 200, await self.batcher.enqueue(*await self._inputs(payload))
+            return 200, await self._price_batch(payload)
+        except Overloaded as exc:
+            return 503, {"error": str(exc)}
+        except UpstreamError as exc:
+            return 502, {"error": str(exc)}
+        except (ValueError, KeyError, TypeError) as exc:
+            return 400, {"error": str(exc) or type(exc).__name__}
+        except Exception as exc:
+            return 500, {"error": str(exc) or type(exc).__name__}
+
+    async def _inputs(self, option: dict) -> tuple:
+        if "time_to_expiration" in option:
+            time_to_expiration = float(option["time_to_expiration"])
+        else:
+            time_to_expiration = (date.fromisoformat(option["expiration_date"]) - date.today()).days / 365.0
+        spot = option.get("spot_price")
+        if spot is None:
+            symbol = option["underlying_symbol"]
+            loop = asyncio.get_running_loop()
+            try:
+                spot = await loop.run_in_executor(None, self.engine.data_provider.fetch_ticker_price, symbol)
+            except Exception as exc:
+                raise UpstreamError(f"Could not fetch the spot of {symbol}: {exc}") from exc
+        inputs = (float(spot), float(option["strike_price"]), time_to_expiration,
+                  float(option["volatility"]), float(option["risk_free_rate"]))
+        self._validate(*inputs)
+        return inputs
+
+    @staticmethod
+    def _validate(spot, strike, time_to_expiration, volatility, risk_free_rate):
+        """Reject inputs the formulas would turn into NaN rather than a price."""
+        for name, value in (("spot_price", spot), ("strike_price", strike), ("volatility", volatility)):
+            if not (math.isfinite(value) and value > 0):
+                raise ValueError(f"{name} must be positive and finite, got {value}")
+        if not (math.isfinite(time_to_expiration) and time_to_expiration >= 0):
+            raise ValueError(f"time_to_expiration must be finite and not negative, got {time_to_expiration}")
+        if not math.isfinite(risk_free_rate):
+            raise ValueError(f"risk_free_rate must be finite, got {risk_free_rate}")
+
+    async def _price_batch(self, options: list) -> list:
+        if not isinstance(options, list):
+            raise TypeError("A batch must be a JSON list of options")
+        with self.batcher.admit(len(options)):
+            # Fetch every spot concurrently; let all fetches settle before reporting the first failure
+            inputs = await asyncio.gather(*(self._inputs(option) for option in options), return_exceptions=True)
+            for result in inputs:
+                if isinstance(result, BaseException):
+                    raise result
+            columns = np.array(inputs, dtype=np.float64).reshape(-1, 5).T
+            results = self.strategy.calculate_call_put_values_batch(*columns)
+        return [{side: {field: float(results[side][field][i]) for field in FIELDS} for side in ("call", "put")}
+                for i in range(len(options))]
+
+    @staticmethod
+    def _write_response(writer, status, payload, keep_alive) -> int:
+        """Write one response and return the status actually sent."""
+        if isinstance(payload, str):
+            body, content_type = payload.encode(), "text/plain; version=0.0.4"
+        else:
+            try:
+                body = json.dumps(payload, allow_nan=False).encode()
+            except ValueError:
+                # NaN and infinity are not JSON; never send them as a result
+                status, body = 500, json.dumps({"error": "Result is not a finite number"}).encode()
+            content_type = "application/json"
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        return status
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--window-ms", type=float, default=2.0, help="micro-batching window; 0 disables batching")
+    parser.add_argument("--max-batch-size", type=int, default=1024)
+    parser.add_argument("--max-pending", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        service = PricingService(window=args.window_ms / 1e3, max_batch_size=args.max_batch_size,
+                                 max_pending=args.max_pending)
+        host, port = await service.start(args.host, args.port)
+        print(f"Pricing service listening on http://{host}:{port}", flush=True)
+        await service.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+import numpy as np
+import pytest
+from data_fetchers.async_fetcher import AsyncQuoteFetcher
+from domain.option import Option
+from pricing.pricing_engine import PricingEngine
+
+class QuoteServer:
+    """Local stand-in for the chart endpoint with injected latency and failures."""
+
+    def __init__(self, prices, latency=0.0, slow=None, failures=None):
+        self.prices = prices
+        self.latency = latency
+        self.slow = slow or {}
+        self.failures = dict(failures or {})
+        self.connections = set()
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                symbol = self.path.split("?")[0].rsplit("/", 1)[-1]
+                with server.lock:
+                    server.requests += 1
+                    server.connections.add(self.client_address)
+                    failing = server.failures.get(symbol, 0)
+                    if failing:
+                        server.failures[symbol] = failing - 1
+                time.sleep(server.slow.get(symbol, server.latency))
+                if failing:
+                    self._send(503, {})
+                elif symbol not in server.prices:
+                    self._send(404, {"chart": {"result": None}})
+                else:
+                    self._send(200, {"chart": {"result": [{"meta": {"regularMarketPrice": server.prices[symbol]}}]}})
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/chart/"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class TestAsyncQuoteFetcher(TestCase):
+    def test_concurrent_fetch_takes_about_one_request(self):
+        prices = {f"SYM{i}": 100.0 + i for i in range(16)}
+        with QuoteServer(prices, latency=0.2) as server:
+            fetcher = AsyncQuoteFetcher(base_url=server.url, max_workers=16)
+            start = time.perf_counter()
+            result = asyncio.run(fetcher.fetch_ticker_prices_async(prices))
+            elapsed = time.perf_counter() - start
+            fetcher.close()
+
+        self.assertEqual(result["prices"], prices)
+        self.assertEqual(result["errors"], {})
+        self.assertLess(elapsed, 0.2 * 4)
+
+    def test_partial_failures_are_reported(self):
+        with QuoteServer({"AAPL": 190.0}, slow={"SLOW": 1.0}) as server:
+            fetcher = AsyncQuoteFetcher(base_url=server.url, timeout=0.2, retries=0)
+            result = asyncio.run(fetcher.fetch_ticker_prices_async(["AAPL", "FAKE", "SLOW"]))
+            fetcher.close()
+
+        self.assertEqual(result["prices"], {"AAPL": 190.0})
+        self.assertIsInstance(result["errors"]["FAKE"], ValueError)
+        self.assertIn("SLOW", result["errors"])
+
+    def test_retries_server_errors_with_backoff(self):
+        with QuoteServer({"MSFT": 410.0}, failures={"MSFT": 2}) as server:
+            fetcher = AsyncQuoteFetcher(base_url=server.url, retries=2, backoff=0.01)
+            price = fetcher.fetch_ticker_price("MSFT")
+            fetcher.close()
+
+        self.assertEqual(price, 410.0)
+        self.assertEqual(server.requests, 3)
+
+    def test_gives_up_after_retries(self):
+        with QuoteServer({"MSFT": 410.0}, failures={"MSFT": 5}) as server:
+            fetcher = AsyncQuoteFetcher(base_url=server.url, retries=1, backoff=0.01)
+            prices = fetcher.fetch_ticker_prices(["MSFT"])
+            fetcher.close()
+
+        self.assertEqual(prices, {})
+        self.assertEqual(server.requests, 2)
+
+    def test_worker_reuses_its_connection(self):
+        with QuoteServer({"AAPL": 190.0}) as server:
+            fetcher = AsyncQuoteFetcher(base_url=server.url, max_workers=1)
+            for _ in range(5):
+                fetcher.fetch_ticker_price("AAPL")
+            fetcher.close()
+
+        self.assertEqual(len(server.connections), 1)
+
+class TestPricingEngineAsync(TestCase):
+    def test_async_pricing_path_uses_concurrent_fetcher(self):
+        expiry = date.today() + timedelta(days=60)
+        options = [Option("AAPL", 180.0, expiry), Option("MSFT", 400.0, expiry), Option("FAKE", 10.0, expiry)]
+        engine = PricingEngine()
+
+        with QuoteServer({"AAPL": 190.0, "MSFT": 410.0}, latency=0.05) as server:
+            engine.async_data_provider = AsyncQuoteFetcher(base_url=server.url)
+            result = asyncio.run(engine.calculate_call_put_async(options, 0.25, 0.02))
+            engine.async_data_provider.close()
+
+        expected = engine.calculate_call(options[0], 0.25, 0.02, spot=190.0)
+        assert result["call"]["price"][0] == pytest.approx(expected["price"])
+        assert np.isnan(result["put"]["price"][2])
+        assert list(result["errors"]) == ["FAKE"]
@@ -0,0 +1,11 @@
+from unittest import TestCase
+from benchmarks.suite import compare_results
+
+class TestBenchmarkSuite(TestCase):
+    def test_compare_flags_only_slowdowns_beyond_threshold(self):
+        baseline = {"results": {"fast": {"seconds": 1.0}, "slow": {"seconds": 1.0}, "removed": {"seconds": 1.0}}}
+        current = {"results": {"fast": {"seconds": 1.1}, "slow": {"seconds": 1.5}, "new": {"seconds": 9.0}}}
+
+        regressions = compare_results(current, baseline, threshold=0.25)
+
+        self.assertEqual(regressions, [("slow", 1.0, 1.5, 1.5)])
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from pricing.black_scholes import BlackScholesStrategy
 from math import isclose
 from datetime import datetime, timedelta
@@ -12,6 +13,14 @@ class DummyOption:
     def time_to_expiration(self):
         return max(0, (self.expiry_date - datetime.now()).days / 365.0)
 
+class FixedTimeOption:
+    def __init__(self, strike_price, time_to_expiration):
+        self.strike_price = strike_price
+        self.time = time_to_expiration
+
+    def time_to_expiration(self):
+        return self.time
+
 class TestBlackScholes(TestCase):
     def setUp(self):  # Fixed: was setup_method()
         self.strategy = BlackScholesStrategy()
@@ -71,4 +80,89 @@ class TestBlackScholes(TestCase):
         self.assertLess(N_d1, 1)
         self.assertGreater(N_d2, 0)
         self.assertLess(N_d2, 1)
-        self.assertGreater(n_d1, 0)
\ No newline at end of file
+        self.assertGreater(n_d1, 0)
+
+    def test_batch_matches_scalar_path(self):
+        spots = np.array([80.0, 100.0, 125.0])
+        strikes = np.array([90.0, 100.0, 110.0])
+        times = np.array([0.1, 0.5, 2.0])
+        vols = np.array([0.15, 0.3, 0.6])
+        rate = 0.03
+
+        call_batch = self.strategy.calculate_call_values_batch(spots, strikes, times, vols, rate)
+        put_batch = self.strategy.calculate_put_values_batch(spots, strikes, times, vols, rate)
+
+        for i in range(len(spots)):
+            option = FixedTimeOption(strikes[i], times[i])
+            call = self.strategy.calculate_call_values(option, spots[i], vols[i], rate)
+            put = self.strategy.calculate_put_values(option, spots[i], vols[i], rate)
+            for greek in call:
+                self.assertTrue(isclose(call_batch[greek][i], call[greek], rel_tol=1e-12, abs_tol=1e-12))
+                self.assertTrue(isclose(put_batch[greek][i], put[greek], rel_tol=1e-12, abs_tol=1e-12))
+
+    def test_batch_broadcasts_inputs(self):
+        spots = np.linspace(80, 120, 5)
+        vols = np.linspace(0.1, 0.5, 3)[:, None]
+
+        result = self.strategy.calculate_call_values_batch(spots, 100.0, 0.5, vols, 0.01)
+
+        for greek in ["price", "delta", "gamma", "vega", "theta", "rho"]:
+            self.assertEqual(result[greek].shape, (3, 5))
+        self.assertTrue(np.all(np.diff(result["price"], axis=1) > 0))
+        self.assertTrue(np.all(np.diff(result["price"], axis=0) > 0))
+
+    def test_batch_expired_entries_return_zero(self):
+        times = np.array([-0.1, 0.0, 0.5])
+
+        call_result = self.strategy.calculate_call_values_batch(110.0, 100.0, times, 0.2, 0.01)
+        put_result = self.strategy.calculate_put_values_batch(90.0, 100.0, times, 0.2, 0.01)
+
+        for greek in call_result:
+            np.testing.assert_array_equal(call_result[greek][:2], 0.0)
+            np.testing.assert_array_equal(put_result[greek][:2], 0.0)
+            self.assertTrue(np.isfinite(call_result[greek][2]))
+        self.assertGreater(call_result["price"][2], 0)
+        self.assertGreater(put_result["price"][2], 0)
+
+    def test_fused_call_put_matches_separate_paths(self):
+        option = FixedTimeOption(strike_price=100, time_to_expiration=0.75)
+
+        fused = self.strategy.calculate_call_put_values(option, 95.0, 0.25, 0.03)
+        call = self.strategy.calculate_call_values(option, 95.0, 0.25, 0.03)
+        put = self.strategy.calculate_put_values(option, 95.0, 0.25, 0.03)
+
+        for greek in call:
+            self.assertTrue(isclose(fused["call"][greek], call[greek], rel_tol=1e-12, abs_tol=1e-12))
+            self.assertTrue(isclose(fused["put"][greek], put[greek], rel_tol=1e-12, abs_tol=1e-12))
+
+    def test_fused_batch_matches_separate_batches(self):
+        spots = np.array([80.0, 100.0, 125.0])
+        times = np.array([0.0, 0.5, 2.0])
+
+        fused = self.strategy.calculate_call_put_values_batch(spots, 100.0, times, 0.3, 0.02)
+        call = self.strategy.calculate_call_values_batch(spots, 100.0, times, 0.3, 0.02)
+        put = self.strategy.calculate_put_values_batch(spots, 100.0, times, 0.3, 0.02)
+
+        for greek in call:
+            np.testing.assert_allclose(fused["call"][greek], call[greek], rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(fused["put"][greek], put[greek], rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(fused["put"]["price"][0], 0.0)
+
+    def test_fused_batch_sides_do_not_share_arrays(self):
+        fused = self.strategy.calculate_call_put_values_batch(np.array([90.0, 110.0]), 100.0, 0.5, 0.3, 0.02)
+        put_gamma, put_vega = fused["put"]["gamma"].copy(), fused["put"]["vega"].copy()
+
+        fused["call"]["gamma"] *= 2
+        fused["call"]["vega"][:] = 0.0
+
+        np.testing.assert_array_equal(fused["put"]["gamma"], put_gamma)
+        np.testing.assert_array_equal(fused["put"]["vega"], put_vega)
+
+    def test_fused_expired_option_returns_zero(self):
+        option = DummyOption(strike_price=100, expiry_days=-1)
+
+        result = self.strategy.calculate_call_put_values(option, 100, 0.2, 0.01)
+
+        for side in ("call", "put"):
+            for greek in result[side]:
+                self.assertTrue(isclose(result[side][greek], 0.0))
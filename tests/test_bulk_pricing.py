@@ -0,0 +1,116 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from datetime import date, timedelta
+from unittest import TestCase
+import numpy as np
+import pandas as pd
+import pytest
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.bulk_pricing import main, price_file
+
+VALUATION_DATE = date(2025, 1, 2)
+
+class TestBulkPricing(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(3)
+        n_rows = 1_000
+        self.frame = pd.DataFrame({
+            "underlying_symbol": rng.choice(["AAPL", "MSFT"], n_rows),
+            "spot_price": rng.uniform(80, 120, n_rows),
+            "strike_price": rng.uniform(80, 120, n_rows),
+            "expiration_date": [str(VALUATION_DATE + timedelta(days=int(d))) for d in rng.integers(1, 700, n_rows)],
+            "volatility": rng.uniform(0.1, 0.5, n_rows),
+            "option_type": rng.choice(["call", "put"], n_rows),
+        })
+        self.input_path = self._path("options.csv")
+        self.frame.to_csv(self.input_path, index=False)
+        times = (pd.to_datetime(self.frame["expiration_date"]) - pd.Timestamp(VALUATION_DATE)).dt.days / 365.0
+        self.expected = BlackScholesStrategy().calculate_call_put_values_batch(
+            self.frame["spot_price"].to_numpy(), self.frame["strike_price"].to_numpy(), times.to_numpy(),
+            self.frame["volatility"].to_numpy(), 0.03)
+        self.is_call = (self.frame["option_type"] == "call").to_numpy()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def _expected(self, field):
+        return np.where(self.is_call, self.expected["call"][field], self.expected["put"][field])
+
+    def test_csv_output_matches_batch_pricing(self):
+        output = self._path("priced.csv")
+        stats = price_file(self.input_path, output, chunk_size=128, rate=0.03, valuation_date=VALUATION_DATE)
+
+        priced = pd.read_csv(output)
+        self.assertEqual(stats["rows"], 1_000)
+        self.assertGreater(stats["rows_per_second"], 0)
+        self.assertEqual(list(priced["underlying_symbol"]), list(self.frame["underlying_symbol"]))
+        for field in ("price", "delta", "gamma", "vega", "theta", "rho"):
+            np.testing.assert_allclose(priced[field], self._expected(field), rtol=1e-12, atol=1e-12)
+
+    def test_parquet_round_trip_with_process_pool(self):
+        parquet_input, output = self._path("options.parquet"), self._path("priced.parquet")
+        self.frame.to_parquet(parquet_input, index=False)
+        price_file(parquet_input, output, chunk_size=300, n_workers=2, rate=0.03, valuation_date=VALUATION_DATE)
+
+        priced = pd.read_parquet(output)
+        np.testing.assert_allclose(priced["price"], self._expected("price"), rtol=1e-12)
+
+    def test_parquet_output_when_chunks_infer_different_dtypes(self):
+        # The first chunk's strikes are whole numbers, the second's are not
+        path, output = self._path("strikes.csv"), self._path("priced.parquet")
+        with open(path, "w") as f:
+            f.write("spot_price,strike_price,time_to_expiration,volatility\n"
+                    "100,100,0.5,0.2\n101,100,0.5,0.2\n102,100.25,0.5,0.2\n")
+        price_file(path, output, chunk_size=2, rate=0.03)
+
+        priced = pd.read_parquet(output)
+        self.assertEqual(priced["strike_price"].dtype, np.float64)
+        np.testing.assert_array_equal(priced["strike_price"], [100.0, 100.0, 100.25])
+
+    def test_npy_output_without_option_type(self):
+        self.frame.drop(columns="option_type").assign(risk_free_rate=0.03).to_csv(self.input_path, index=False)
+        output = self._path("priced.npy")
+        price_file(self.input_path, output, chunk_size=333, valuation_date=VALUATION_DATE)
+
+        priced = np.load(output, mmap_mode="r")
+        self.assertEqual(priced.shape, (1_000,))
+        np.testing.assert_allclose(priced["call_price"], self.expected["call"]["price"], rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(priced["put_delta"], self.expected["put"]["delta"], rtol=1e-9, atol=1e-12)
+
+    def test_missing_rate_is_rejected(self):
+        with pytest.raises(ValueError):
+            price_file(self.input_path, self._path("priced.csv"), valuation_date=VALUATION_DATE)
+
+    def test_unknown_option_type_is_rejected(self):
+        self.frame.loc[7, "option_type"] = "straddle"
+        self.frame.to_csv(self.input_path, index=False)
+        with pytest.raises(ValueError, match="straddle"):
+            price_file(self.input_path, self._path("priced.csv"), rate=0.03, valuation_date=VALUATION_DATE)
+
+    def test_npy_output_matches_rows_read(self):
+        # A quoted field spanning lines and trailing blank lines must not change the row count
+        path, output = self._path("notes.csv"), self._path("priced.npy")
+        with open(path, "w") as f:
+            f.write('spot_price,strike_price,time_to_expiration,volatility,note\n'
+                    '105,100,0.5,0.2,"first\nline"\n95,100,0.5,0.2,plain\n\n\n')
+        stats = price_file(path, output, rate=0.03)
+
+        priced = np.load(output)
+        self.assertEqual(stats["rows"], 2)
+        self.assertEqual(priced.shape, (2,))
+        expected = BlackScholesStrategy().calculate_call_put_values_batch(np.array([105.0, 95.0]), 100.0, 0.5, 0.2, 0.03)
+        np.testing.assert_allclose(priced["call_price"], expected["call"]["price"], rtol=1e-12)
+
+    def test_cli_reports_throughput(self):
+        output = self._path("priced.csv")
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            status = main([self.input_path, output, "--rate", "0.03", "--valuation-date", str(VALUATION_DATE)])
+        self.assertEqual(status, 0)
+        self.assertIn("Priced 1,000 rows", stdout.getvalue())
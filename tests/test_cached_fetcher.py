@@ -0,0 +1,103 @@
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from data_fetchers.base_fetcher import BaseFetcher
+from data_fetchers.cached_fetcher import CachedFetcher
+
+class StubFetcher(BaseFetcher):
+    def __init__(self, prices, release=None):
+        self.prices = prices
+        self.release = release
+        self.single_calls = []
+        self.bulk_calls = []
+
+    def fetch_ticker_price(self, symbol: str) -> float:
+        self.single_calls.append(symbol)
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        if symbol not in self.prices:
+            raise ValueError(f"Could not fetch price for ticker: {symbol}")
+        return self.prices[symbol]
+
+    def fetch_ticker_prices(self, symbols) -> dict:
+        self.bulk_calls.append(list(symbols))
+        return {symbol: self.prices[symbol] for symbol in symbols if symbol in self.prices}
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestCachedFetcher(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.stub = StubFetcher({"AAPL": 190.0, "MSFT": 410.0, "GOOG": 170.0})
+        self.fetcher = CachedFetcher(self.stub, ttl=10.0, max_size=2, clock=self.clock)
+
+    def test_repeat_fetch_within_ttl_hits_cache(self):
+        self.assertEqual(self.fetcher.fetch_ticker_price("AAPL"), 190.0)
+        self.assertEqual(self.fetcher.fetch_ticker_price("AAPL"), 190.0)
+
+        self.assertEqual(self.stub.single_calls, ["AAPL"])
+        self.assertEqual((self.fetcher.hits, self.fetcher.misses), (1, 1))
+        self.assertEqual(self.fetcher.hit_rate, 0.5)
+
+    def test_entry_expires_after_ttl(self):
+        self.fetcher.fetch_ticker_price("AAPL")
+        self.clock.now = 10.0
+        self.stub.prices["AAPL"] = 191.0
+
+        self.assertEqual(self.fetcher.fetch_ticker_price("AAPL"), 191.0)
+        self.assertEqual(self.stub.single_calls, ["AAPL", "AAPL"])
+
+    def test_least_recently_used_symbol_is_evicted(self):
+        self.fetcher.fetch_ticker_price("AAPL")
+        self.fetcher.fetch_ticker_price("MSFT")
+        self.fetcher.fetch_ticker_price("AAPL")
+        self.fetcher.fetch_ticker_price("GOOG")
+
+        self.fetcher.fetch_ticker_price("AAPL")
+        self.fetcher.fetch_ticker_price("MSFT")
+
+        self.assertEqual(self.stub.single_calls, ["AAPL", "MSFT", "GOOG", "MSFT"])
+
+    def test_concurrent_requests_share_one_fetch(self):
+        release = threading.Event()
+        stub = StubFetcher({"AAPL": 190.0}, release=release)
+        fetcher = CachedFetcher(stub, ttl=10.0)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(fetcher.fetch_ticker_price, "AAPL") for _ in range(8)]
+            while not stub.single_calls:
+                pass
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(results, [190.0] * 8)
+        self.assertEqual(stub.single_calls, ["AAPL"])
+
+    def test_bulk_fetch_only_requests_missing_symbols_in_one_call(self):
+        self.fetcher.fetch_ticker_price("AAPL")
+
+        prices = self.fetcher.fetch_ticker_prices(["AAPL", "MSFT", "FAKE", "MSFT"])
+
+        self.assertEqual(prices, {"AAPL": 190.0, "MSFT": 410.0})
+        self.assertEqual(self.stub.bulk_calls, [["MSFT", "FAKE"]])
+
+    def test_failed_fetch_is_not_cached(self):
+        with pytest.raises(ValueError):
+            self.fetcher.fetch_ticker_price("FAKE")
+        with pytest.raises(ValueError):
+            self.fetcher.fetch_ticker_price("FAKE")
+
+        self.assertEqual(self.stub.single_calls, ["FAKE", "FAKE"])
+
+    def test_invalidate_forces_refetch(self):
+        self.fetcher.fetch_ticker_price("AAPL")
+        self.fetcher.invalidate("AAPL")
+        self.fetcher.fetch_ticker_price("AAPL")
+
+        self.assertEqual(self.stub.single_calls, ["AAPL", "AAPL"])
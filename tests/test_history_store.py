@@ -0,0 +1,133 @@
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from datetime import date, timedelta
+from unittest import TestCase
+from data_fetchers.base_fetcher import BaseFetcher
+from data_fetchers.history_store import HistoryStore
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "ohlc_history.csv")
+
+class FixtureFetcher(BaseFetcher):
+    """Serves daily bars from the CSV fixture and records every requested range."""
+
+    def __init__(self):
+        self.frame = pd.read_csv(FIXTURE, parse_dates=["date"])
+        self.calls = []
+
+    def fetch_ticker_price(self, symbol: str) -> float:
+        return float(self.frame.loc[self.frame["symbol"] == symbol, "close"].iloc[-1])
+
+    def fetch_ohlc_history(self, symbol: str, start, end) -> dict:
+        self.calls.append((symbol, start, end))
+        rows = self.frame[(self.frame["symbol"] == symbol) & (self.frame["date"] >= pd.Timestamp(start))
+                          & (self.frame["date"] <= pd.Timestamp(end))]
+        history = {"date": rows["date"].to_numpy().astype("datetime64[D]")}
+        history.update({name: rows[name].to_numpy() for name in ("open", "high", "low", "close")})
+        return history
+
+class LiveFetcher(BaseFetcher):
+    """Serves a bar for every day up to today, where the close is whatever `live_close` is now."""
+
+    def __init__(self):
+        self.live_close = 100.0
+        self.offline = False
+        self.calls = []
+
+    def fetch_ticker_price(self, symbol: str) -> float:
+        return self.live_close
+
+    def fetch_ohlc_history(self, symbol: str, start, end) -> dict:
+        if self.offline:
+            raise ConnectionError("offline")
+        self.calls.append((symbol, start, end))
+        dates = np.arange(np.datetime64(start, "D"), min(np.datetime64(end, "D"), np.datetime64(date.today(), "D"))
+                          + np.timedelta64(1, "D"))
+        close = np.full(len(dates), 90.0)
+        close[dates == np.datetime64(date.today(), "D")] = self.live_close
+        return {"date": dates, "open": close, "high": close, "low": close, "close": close}
+
+class TestHistoryStore(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.fetcher = FixtureFetcher()
+        self.store = HistoryStore(self.fetcher, self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def expected(self, symbol, start, end):
+        return self.fetcher.fetch_ohlc_history(symbol, start, end)
+
+    def test_repeat_loads_are_served_from_disk(self):
+        first = self.store.fetch_ohlc_history("AAPL", date(2024, 2, 1), date(2024, 3, 29))
+        # A fresh store over the same directory must not fetch again either
+        reopened = HistoryStore(self.fetcher, self.directory.name)
+        second = reopened.fetch_ohlc_history("AAPL", date(2024, 2, 5), date(2024, 3, 1))
+
+        self.assertEqual(len(self.fetcher.calls), 1)
+        self.assertIsInstance(second["close"], np.memmap)
+        expected = self.expected("AAPL", date(2024, 2, 5), date(2024, 3, 1))
+        for name, column in expected.items():
+            np.testing.assert_array_equal(second[name], column)
+        self.assertEqual(len(first["date"]), len(self.expected("AAPL", date(2024, 2, 1), date(2024, 3, 29))["date"]))
+
+    def test_only_missing_ranges_are_fetched(self):
+        self.store.fetch_ohlc_history("AAPL", date(2024, 2, 1), date(2024, 3, 1))
+        history = self.store.fetch_ohlc_history("AAPL", date(2024, 1, 10), date(2024, 4, 15))
+
+        self.assertEqual(self.fetcher.calls[1:], [("AAPL", date(2024, 1, 10), date(2024, 1, 31)),
+                                                  ("AAPL", date(2024, 3, 2), date(2024, 4, 15))])
+        expected = self.expected("AAPL", date(2024, 1, 10), date(2024, 4, 15))
+        for name, column in expected.items():
+            np.testing.assert_array_equal(history[name], column)
+        self.assertEqual(len(np.unique(history["date"])), len(history["date"]))
+
+    def test_history_panel_aligns_symbols_by_date(self):
+        panel = self.store.history_panel(["AAPL", "MSFT"], date(2024, 1, 2), date(2024, 6, 28))
+
+        self.assertEqual(panel["symbols"], ["AAPL", "MSFT"])
+        self.assertEqual(panel["close"].shape, (len(panel["dates"]), 2))
+        msft = self.expected("MSFT", date(2024, 1, 2), date(2024, 6, 28))
+        np.testing.assert_array_equal(panel["close"][:, 1], msft["close"])
+
+    def test_spot_prices_pass_through(self):
+        self.assertEqual(self.store.fetch_ticker_price("MSFT"), self.fetcher.fetch_ticker_price("MSFT"))
+
+    def test_default_end_repeat_load_stays_on_disk(self):
+        fetcher = LiveFetcher()
+        start = date.today() - timedelta(days=10)
+        first = HistoryStore(fetcher, self.directory.name).fetch_ohlc_history("AAPL", start)
+        fetcher.offline = True
+        second = HistoryStore(fetcher, self.directory.name).fetch_ohlc_history("AAPL", start)
+
+        self.assertEqual(second["date"][-1], np.datetime64(date.today() - timedelta(days=1), "D"))
+        for name, column in first.items():
+            np.testing.assert_array_equal(second[name], column)
+
+    def test_todays_bar_is_refetched_and_not_stored(self):
+        fetcher = LiveFetcher()
+        store = HistoryStore(fetcher, self.directory.name)
+        start = date.today() - timedelta(days=10)
+        first = store.fetch_ohlc_history("AAPL", start, include_today=True)
+        fetcher.live_close = 101.5
+        second = store.fetch_ohlc_history("AAPL", start, include_today=True)
+
+        self.assertEqual(first["close"][-1], 100.0)
+        self.assertEqual(second["close"][-1], 101.5)
+        self.assertEqual(len(second["date"]), 11)
+        self.assertEqual(fetcher.calls[1:], [("AAPL", date.today(), date.today())] * 2)
+        stored = HistoryStore(fetcher, self.directory.name)._load("AAPL")
+        self.assertEqual(stored["date"][-1], np.datetime64(date.today() - timedelta(days=1), "D"))
+
+    def test_failed_fetch_of_todays_bar_returns_stored_bars(self):
+        fetcher = LiveFetcher()
+        store = HistoryStore(fetcher, self.directory.name)
+        start = date.today() - timedelta(days=10)
+        stored = store.fetch_ohlc_history("AAPL", start)
+        fetcher.offline = True
+        history = store.fetch_ohlc_history("AAPL", start, include_today=True)
+
+        for name, column in stored.items():
+            np.testing.assert_array_equal(history[name], column)
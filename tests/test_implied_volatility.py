@@ -0,0 +1,53 @@
+import numpy as np
+from unittest import TestCase
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.implied_volatility import ImpliedVolatilitySolver
+
+class TestImpliedVolatility(TestCase):
+    def setUp(self):
+        self.strategy = BlackScholesStrategy()
+        self.solver = ImpliedVolatilitySolver(self.strategy)
+
+    def test_recovers_volatility_from_forward_pricer(self):
+        rng = np.random.default_rng(7)
+        n = 2_000
+        spots = rng.uniform(80, 120, n)
+        strikes = rng.uniform(85, 115, n)
+        times = rng.uniform(0.25, 2.0, n)
+        vols = rng.uniform(0.1, 1.0, n)
+        is_call = rng.random(n) < 0.5
+        values = self.strategy.calculate_call_put_values_batch(spots, strikes, times, vols, 0.03)
+        prices = np.where(is_call, values["call"]["price"], values["put"]["price"])
+
+        result = self.solver.solve(prices, spots, strikes, times, 0.03, is_call)
+
+        self.assertTrue(result["converged"].all())
+        np.testing.assert_allclose(result["volatility"], vols, atol=1e-7)
+        self.assertLessEqual(result["iterations"].max(), self.solver.max_iterations)
+        self.assertLess(result["iterations"].mean(), 6)
+
+    def test_reports_failures_instead_of_raising(self):
+        prices = np.array([-1.0, 0.5, 150.0, np.nan, 10.0])
+        times = np.array([0.5, 0.5, 0.5, 0.5, 0.0])
+
+        result = self.solver.solve(prices, 100.0, 100.0, times, 0.01, True)
+
+        np.testing.assert_array_equal(result["converged"], [False, True, False, False, False])
+        self.assertTrue(np.isnan(result["volatility"][[0, 2, 3, 4]]).all())
+        np.testing.assert_array_equal(result["iterations"][[0, 2, 3, 4]], 0)
+        self.assertGreater(result["iterations"][1], 0)
+
+    def test_below_intrinsic_put_is_rejected(self):
+        result = self.solver.solve(5.0, 80.0, 100.0, 1.0, 0.0, False)
+
+        self.assertFalse(result["converged"])
+        self.assertTrue(np.isnan(result["volatility"]))
+
+    def test_broadcasts_scalar_quote_against_strikes(self):
+        strikes = np.array([[90.0, 100.0], [110.0, 120.0]])
+        prices = self.strategy.calculate_call_values_batch(100.0, strikes, 0.5, 0.25, 0.01)["price"]
+
+        result = self.solver.solve(prices, 100.0, strikes, 0.5, 0.01, True)
+
+        self.assertEqual(result["volatility"].shape, (2, 2))
+        np.testing.assert_allclose(result["volatility"], 0.25, atol=1e-8)
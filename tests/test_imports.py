@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loaded_modules(module, candidates):
+    """Import `module` in a fresh interpreter and return which of `candidates` it pulled in."""
+    script = f"import sys, {module}; print(','.join(m for m in {tuple(candidates)!r} if m in sys.modules))"
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                               cwd=REPO_ROOT)
+    return [name for name in completed.stdout.strip().split(",") if name]
+
+@pytest.mark.parametrize("module", ["pricing.black_scholes", "pricing.pricing_engine", "ui.plots",
+                                    "data_fetchers.history_store", "pricing.realized_volatility"])
+def test_import_does_not_load_heavy_dependencies(module):
+    assert loaded_modules(module, ("matplotlib", "seaborn", "yfinance", "scipy.stats")) == []
+
+def test_scalar_pricing_needs_no_scipy():
+    script = ("import sys; from datetime import date, timedelta; from domain.option import Option; "
+              "from pricing.black_scholes import BlackScholesStrategy; "
+              "option = Option('AAPL', 100.0, date.today() + timedelta(days=90)); "
+              "BlackScholesStrategy().calculate_call_put_values(option, 105.0, 0.2, 0.01); "
+              "print('scipy' in sys.modules)")
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                               cwd=REPO_ROOT)
+    assert completed.stdout.strip() == "False"
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from math import isclose
+from unittest import TestCase
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.lattice import LatticeStrategy
+from pricing.pricing_engine import PricingEngine
+
+class FixedTimeOption:
+    def __init__(self, strike_price, time_to_expiration):
+        self.strike_price = strike_price
+        self.time = time_to_expiration
+
+    def time_to_expiration(self):
+        return self.time
+
+class TestLattice(TestCase):
+    def setUp(self):
+        self.option = FixedTimeOption(strike_price=100, time_to_expiration=0.75)
+        self.black_scholes = BlackScholesStrategy()
+
+    def test_european_exercise_converges_to_black_scholes(self):
+        for method in ("binomial", "trinomial"):
+            strategy = LatticeStrategy(steps=1000, method=method, american=False)
+            for side in ("calculate_call_values", "calculate_put_values"):
+                lattice = getattr(strategy, side)(self.option, 105.0, 0.25, 0.03)
+                bs = getattr(self.black_scholes, side)(self.option, 105.0, 0.25, 0.03)
+
+                self.assertTrue(isclose(lattice["price"], bs["price"], rel_tol=1e-3), (method, side))
+                for greek in ("delta", "gamma", "vega", "theta", "rho"):
+                    self.assertTrue(isclose(lattice[greek], bs[greek], rel_tol=1e-2), (method, side, greek))
+
+    def test_error_shrinks_with_more_steps(self):
+        bs = self.black_scholes.calculate_put_values(self.option, 100.0, 0.2, 0.01)["price"]
+        errors = [abs(LatticeStrategy(steps=steps, american=False).calculate_put_values(
+            self.option, 100.0, 0.2, 0.01)["price"] - bs) for steps in (50, 200, 800)]
+
+        self.assertLess(errors[2], errors[1])
+        self.assertLess(errors[1], errors[0])
+
+    def test_american_put_carries_early_exercise_premium(self):
+        american = LatticeStrategy(steps=500).calculate_put_values(self.option, 90.0, 0.2, 0.05)
+        european = LatticeStrategy(steps=500, american=False).calculate_put_values(self.option, 90.0, 0.2, 0.05)
+
+        self.assertGreater(american["price"], european["price"] + 0.05)
+        self.assertGreaterEqual(american["price"], 10.0)
+
+    def test_american_call_without_dividends_matches_european(self):
+        american = LatticeStrategy(steps=500).calculate_call_values(self.option, 100.0, 0.2, 0.05)
+        european = LatticeStrategy(steps=500, american=False).calculate_call_values(self.option, 100.0, 0.2, 0.05)
+
+        self.assertAlmostEqual(american["price"], european["price"], places=10)
+
+    def test_strike_array_matches_single_strike_pricing(self):
+        strategy = LatticeStrategy(steps=300, method="trinomial")
+        strikes = np.array([[90.0, 100.0], [110.0, 120.0]])
+
+        batch = strategy.calculate_put_values_batch(100.0, strikes, 0.75, 0.3, 0.02)
+
+        for index, strike in np.ndenumerate(strikes):
+            single = strategy.calculate_put_values(FixedTimeOption(strike, 0.75), 100.0, 0.3, 0.02)
+            for greek, value in single.items():
+                self.assertAlmostEqual(batch[greek][index], value, places=10)
+
+    def test_batch_rejects_array_spots(self):
+        with pytest.raises(ValueError):
+            LatticeStrategy().calculate_call_values_batch([100.0, 101.0], 100.0, 0.5, 0.2, 0.01)
+
+    def test_too_few_steps_are_rejected(self):
+        for method in ("binomial", "trinomial"):
+            with pytest.raises(ValueError, match="at least 3 steps"):
+                LatticeStrategy(steps=2, method=method)
+        LatticeStrategy(steps=3).calculate_call_values(FixedTimeOption(100, 0.5), 100.0, 0.2, 0.01)
+
+    def test_probabilities_outside_unit_interval_are_rejected(self):
+        # A 50% rate against 1% volatility over three one-third-year steps
+        for method in ("binomial", "trinomial"):
+            strategy = LatticeStrategy(steps=3, method=method)
+            with pytest.raises(ValueError, match="outside"):
+                strategy.calculate_call_values(FixedTimeOption(100, 1.0), 100.0, 0.01, 0.5)
+
+    def test_expired_option_returns_zero(self):
+        result = LatticeStrategy().calculate_call_values(FixedTimeOption(100, 0.0), 110.0, 0.2, 0.01)
+
+        for value in result.values():
+            self.assertEqual(value, 0.0)
+        batch = LatticeStrategy().calculate_call_values_batch(100.0, np.array([90.0, 110.0]), 0.0, 0.2, 0.01)
+        batch["delta"][0] = 1.0
+        self.assertEqual(batch["price"][0], 0.0)
+
+    def test_registered_in_pricing_engine(self):
+        engine = PricingEngine()
+        result = engine.calculate_put(self.option, 0.2, 0.05, spot=90.0, model='Binomial')
+
+        self.assertGreaterEqual(result["price"], 10.0)
@@ -0,0 +1,78 @@
+import pstats
+from datetime import date, timedelta
+from domain.option import Option
+from data_fetchers.base_fetcher import BaseFetcher
+from data_fetchers.cached_fetcher import CachedFetcher
+from pricing.metrics import Metrics
+from pricing.pricing_engine import PricingEngine
+
+class StubFetcher(BaseFetcher):
+    def __init__(self):
+        pass
+
+    def fetch_ticker_price(self, symbol: str) -> float:
+        return 105.0
+
+class TestMetrics:
+    def setup_method(self):
+        self.option = Option(underlying_symbol="AAPL", strike_price=100.0,
+                             expiration_date=date.today() + timedelta(days=90))
+
+    def _engine(self, enabled):
+        engine = PricingEngine(metrics=Metrics(enabled=enabled))
+        engine.data_provider.fetcher = StubFetcher()
+        return engine
+
+    def test_disabled_metrics_record_nothing(self):
+        engine = self._engine(enabled=False)
+        engine.calculate_call_put(self.option, 0.2, 0.01)
+        assert engine.metrics.snapshot() == {"timers": {}, "counters": {}}
+
+    def test_enabled_metrics_time_each_stage(self):
+        engine = self._engine(enabled=True)
+        engine.calculate_call_put(self.option, 0.2, 0.01)
+        engine.calculate_call(self.option, 0.2, 0.01)
+        snapshot = engine.metrics.snapshot()
+
+        for stage in ("fetch", "d1_d2", "cdf", "assembly", "calculate_call_put", "calculate_call"):
+            assert snapshot["timers"][stage]["count"] >= 1
+        assert snapshot["timers"]["fetch"]["count"] == 2
+        assert snapshot["timers"]["calculate_call_put"]["histogram"][float("inf")] == 1
+        assert snapshot["counters"]["calculate_call_put_calls"] == 1
+        assert snapshot["counters"]["fetch_cache_miss"] == 1
+        assert snapshot["counters"]["fetch_cache_hit"] == 1
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = Metrics(enabled=True, buckets=(0.01, 0.1, float("inf")))
+        for seconds in (0.005, 0.05, 0.05, 2.0):
+            metrics.observe("fetch", seconds)
+        timer = metrics.snapshot()["timers"]["fetch"]
+        assert timer["histogram"] == {0.01: 1, 0.1: 3, float("inf"): 4}
+        assert timer["max_seconds"] == 2.0
+
+    def test_prometheus_output(self):
+        metrics = Metrics(enabled=True, buckets=(0.1, float("inf")))
+        metrics.observe("cdf", 0.05)
+        metrics.increment("fetch_cache_hit", 3)
+        text = metrics.to_prometheus()
+        assert '# TYPE options_pricer_stage_seconds histogram' in text
+        assert 'options_pricer_stage_seconds_bucket{stage="cdf",le="0.1"} 1' in text
+        assert 'options_pricer_stage_seconds_bucket{stage="cdf",le="+Inf"} 1' in text
+        assert 'options_pricer_stage_seconds_count{stage="cdf"} 1' in text
+        assert 'options_pricer_events_total{event="fetch_cache_hit"} 3' in text
+
+    def test_cached_fetcher_counts_hits_and_misses(self):
+        metrics = Metrics(enabled=True)
+        fetcher = CachedFetcher(StubFetcher())
+        fetcher.metrics = metrics
+        for _ in range(3):
+            fetcher.fetch_ticker_price("AAPL")
+        assert metrics.snapshot()["counters"] == {"fetch_cache_miss": 1, "fetch_cache_hit": 2}
+
+    def test_profile_dumps_stats(self, tmp_path):
+        engine = self._engine(enabled=False)
+        path = tmp_path / "pricing.prof"
+        with engine.profile(str(path)):
+            engine.calculate_call_put(self.option, 0.2, 0.01, spot=105.0)
+        stats = pstats.Stats(str(path))
+        assert any(name == "calculate_call_put_values" for _, _, name in stats.stats)
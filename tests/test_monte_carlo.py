@@ -0,0 +1,65 @@
+from math import isclose
+from unittest import TestCase
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.monte_carlo import MonteCarloStrategy
+from pricing.pricing_engine import PricingEngine
+
+class FixedTimeOption:
+    def __init__(self, strike_price, time_to_expiration, underlying_symbol="AAPL"):
+        self.strike_price = strike_price
+        self.time = time_to_expiration
+        self.underlying_symbol = underlying_symbol
+
+    def time_to_expiration(self):
+        return self.time
+
+class TestMonteCarlo(TestCase):
+    def setUp(self):
+        self.option = FixedTimeOption(strike_price=100, time_to_expiration=0.75)
+        self.black_scholes = BlackScholesStrategy()
+
+    def test_converges_to_black_scholes(self):
+        strategy = MonteCarloStrategy(n_paths=200_000, seed=11)
+        for mc_method, bs_method in ((strategy.calculate_call_values, self.black_scholes.calculate_call_values),
+                                     (strategy.calculate_put_values, self.black_scholes.calculate_put_values)):
+            mc = mc_method(self.option, 105.0, 0.25, 0.03)
+            bs = bs_method(self.option, 105.0, 0.25, 0.03)
+
+            self.assertLess(abs(mc["price"] - bs["price"]), 4 * mc["std_error"])
+            for greek in ("delta", "gamma", "vega", "theta", "rho"):
+                self.assertTrue(isclose(mc[greek], bs[greek], rel_tol=0.02), greek)
+
+    def test_variance_reduction_shrinks_standard_error(self):
+        plain = MonteCarloStrategy(n_paths=100_000, antithetic=False, control_variate=False, seed=5)
+        reduced = MonteCarloStrategy(n_paths=100_000, seed=5)
+
+        plain_result = plain.calculate_call_values(self.option, 100.0, 0.2, 0.01)
+        reduced_result = reduced.calculate_call_values(self.option, 100.0, 0.2, 0.01)
+
+        self.assertLess(reduced_result["std_error"], plain_result["std_error"] / 2)
+
+    def test_seeded_results_do_not_depend_on_worker_count(self):
+        serial = MonteCarloStrategy(n_paths=40_000, chunk_size=10_000, seed=3)
+        parallel = MonteCarloStrategy(n_paths=40_000, chunk_size=10_000, seed=3, n_workers=2)
+
+        try:
+            self.assertEqual(serial.calculate_put_values(self.option, 95.0, 0.3, 0.02),
+                             parallel.calculate_put_values(self.option, 95.0, 0.3, 0.02))
+        finally:
+            parallel.close()
+
+    def test_expired_option_returns_zero(self):
+        strategy = MonteCarloStrategy(n_paths=1_000, seed=1)
+        result = strategy.calculate_call_values(FixedTimeOption(100, 0.0), 100.0, 0.2, 0.01)
+
+        for value in result.values():
+            self.assertEqual(value, 0.0)
+
+    def test_registered_in_pricing_engine(self):
+        engine = PricingEngine()
+        engine.strategies['Monte-Carlo'] = MonteCarloStrategy(n_paths=20_000, seed=2)
+
+        result = engine.calculate_call_put(self.option, 0.2, 0.01, spot=100.0, model='Monte-Carlo')
+
+        self.assertIn("std_error", result["call"])
+        self.assertIn("std_error", result["put"])
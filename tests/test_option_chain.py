@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from datetime import date, timedelta
+from unittest import TestCase
+from domain.option import Option
+from domain.option_chain import OptionChain
+from pricing.pricing_engine import PricingEngine
+
+VALUATION_DATE = date(2025, 3, 3)
+
+class TestOptionChain(TestCase):
+    def setUp(self):
+        self.options = [
+            Option("MSFT", 400.0, VALUATION_DATE + timedelta(days=30)),
+            Option("AAPL", 180.0, VALUATION_DATE + timedelta(days=90)),
+            Option("MSFT", 420.0, VALUATION_DATE + timedelta(days=365)),
+        ]
+        self.chain = OptionChain.from_options(self.options, valuation_date=VALUATION_DATE)
+
+    def test_option_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.options[0], "__dict__"))
+
+    def test_columns_are_typed(self):
+        self.assertEqual(self.chain.underlyings, ["AAPL", "MSFT"])
+        self.assertEqual(self.chain.symbol_ids.dtype, np.int32)
+        self.assertEqual(self.chain.strikes.dtype, np.float64)
+        self.assertEqual(self.chain.expiries.dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(list(self.chain.symbols), ["MSFT", "AAPL", "MSFT"])
+        self.assertEqual(self.chain.nbytes, 3 * (4 + 8 + 8))
+
+    def test_time_to_expiration_matches_options_and_is_cached(self):
+        times = self.chain.time_to_expiration()
+        expected = [option.time_to_expiration(VALUATION_DATE) for option in self.options]
+        np.testing.assert_allclose(times, expected)
+        self.assertIs(self.chain.time_to_expiration(), times)
+        with pytest.raises(ValueError):
+            times[0] = 1.0
+
+    def test_changing_valuation_date_recomputes(self):
+        before = self.chain.time_to_expiration()
+        self.chain.valuation_date = VALUATION_DATE + timedelta(days=30)
+        after = self.chain.time_to_expiration()
+        np.testing.assert_allclose(after, before - 30 / 365.0)
+
+    def test_indexing_returns_options_and_sub_chains(self):
+        self.assertEqual(self.chain[1], self.options[1])
+        self.assertEqual(list(self.chain), self.options)
+        self.chain.time_to_expiration()
+        msft = self.chain[self.chain.symbol_ids == 1]
+        self.assertEqual(len(msft), 2)
+        np.testing.assert_allclose(msft.time_to_expiration(), [30 / 365.0, 365 / 365.0])
+
+    def test_mismatched_columns_are_rejected(self):
+        with pytest.raises(ValueError):
+            OptionChain(["AAPL"], [100.0, 110.0], ["2025-06-01"])
+
+    def test_engine_prices_chain_like_single_options(self):
+        engine = PricingEngine()
+        chain = OptionChain.from_options(self.options)
+        results = engine.calculate_chain(chain, 0.25, 0.02, spots={"AAPL": 185.0, "MSFT": 410.0})
+
+        for i, option in enumerate(self.options):
+            spot = 185.0 if option.underlying_symbol == "AAPL" else 410.0
+            expected = engine.calculate_call_put(option, 0.25, 0.02, spot=spot)
+            assert results["call"]["price"][i] == pytest.approx(expected["call"]["price"])
+            assert results["put"]["delta"][i] == pytest.approx(expected["put"]["delta"])
@@ -0,0 +1,79 @@
+import numpy as np
+from unittest import TestCase
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.metrics import Metrics
+from pricing.parallel_batch import ParallelBatchExecutor
+from pricing.pricing_engine import PricingEngine
+
+class TestParallelBatchExecutor(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ParallelBatchExecutor(n_workers=2, min_parallel_size=1_000)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.close()
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        n = 10_001
+        self.inputs = (rng.uniform(50, 150, n), rng.uniform(50, 150, n), rng.uniform(-0.1, 2.0, n),
+                       rng.uniform(0.1, 0.6, n), 0.03)
+
+    def assert_matches_strategy(self, results, inputs):
+        expected = BlackScholesStrategy().calculate_call_put_values_batch(*inputs)
+        for side in ("call", "put"):
+            for field, values in expected[side].items():
+                np.testing.assert_array_equal(results[side][field], values, err_msg=f"{side} {field}")
+
+    def test_sharded_results_match_in_process_pricing(self):
+        results = self.executor.calculate_call_put_values_batch(*self.inputs)
+
+        self.assert_matches_strategy(results, self.inputs)
+
+    def test_results_survive_later_batches(self):
+        first = self.executor.calculate_call_put_values_batch(*self.inputs)
+        price = first["call"]["price"].copy()
+        other = (self.inputs[0] * 2, *self.inputs[1:])
+
+        self.executor.calculate_call_put_values_batch(*other)
+
+        np.testing.assert_array_equal(first["call"]["price"], price)
+
+    def test_broadcast_inputs_keep_their_shape(self):
+        spots = np.linspace(80, 120, 50)[np.newaxis, :]
+        vols = np.linspace(0.1, 0.5, 40)[:, np.newaxis]
+        inputs = (spots, 100.0, 0.5, vols, 0.02)
+
+        results = self.executor.calculate_call_put_values_batch(*inputs)
+
+        self.assertEqual(results["put"]["delta"].shape, (40, 50))
+        self.assert_matches_strategy(results, inputs)
+
+    def test_blocks_grow_for_larger_batches(self):
+        self.executor.calculate_call_put_values_batch(*self.inputs)
+        larger = tuple(np.tile(x, 3) if np.ndim(x) else x for x in self.inputs)
+
+        results = self.executor.calculate_call_put_values_batch(*larger)
+
+        self.assertGreaterEqual(self.executor._inputs.capacity, len(larger[0]))
+        self.assert_matches_strategy(results, larger)
+
+    def test_small_batches_stay_in_process(self):
+        metrics = Metrics(enabled=True)
+        with ParallelBatchExecutor(n_workers=2, min_parallel_size=1_000) as executor:
+            executor.metrics = metrics
+            inputs = tuple(x[:10] if np.ndim(x) else x for x in self.inputs)
+            results = executor.calculate_call_put_values_batch(*inputs)
+            self.assertIsNone(executor._executor)
+
+        self.assert_matches_strategy(results, inputs)
+        self.assertEqual(metrics.snapshot()["counters"], {"batch_in_process": 1})
+
+    def test_engine_routes_batches_through_executor(self):
+        engine = PricingEngine(batch_executor=self.executor)
+
+        results = engine.calculate_call_put_batch(*self.inputs)
+
+        self.assertIs(self.executor.metrics, engine.metrics)
+        self.assert_matches_strategy(results, self.inputs)
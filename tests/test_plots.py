@@ -0,0 +1,98 @@
+import numpy as np
+from datetime import date, timedelta
+from unittest import TestCase
+from domain.option import Option
+from pricing.pricing_engine import PricingEngine
+from ui.plots import (HeatmapRenderer, generate_option_grids, generate_option_price_grid, get_heatmap_ranges,
+                      plot_call_heatmap)
+
+class TestPlots(TestCase):
+    def setUp(self):
+        self.engine = PricingEngine()
+        self.option = Option(underlying_symbol="AAPL", strike_price=100,
+                             expiration_date=date.today() + timedelta(days=90))
+        self.vol_range = np.linspace(0.1, 0.5, 4)
+        self.spot_range = np.linspace(80, 120, 6)
+
+    def test_grids_match_per_cell_pricing(self):
+        grids = generate_option_grids(self.engine, self.option, 0.02, self.vol_range, self.spot_range,
+                                      call_purchase_price=5.0, put_purchase_price=3.0)
+
+        for i, vol in enumerate(self.vol_range):
+            for j, spot in enumerate(self.spot_range):
+                call = self.engine.calculate_call(self.option, volatility=vol, risk_free_rate=0.02, spot=spot)
+                put = self.engine.calculate_put(self.option, volatility=vol, risk_free_rate=0.02, spot=spot)
+                for greek in call:
+                    self.assertAlmostEqual(grids["call"][greek][i, j], call[greek], places=10)
+                    self.assertAlmostEqual(grids["put"][greek][i, j], put[greek], places=10)
+                self.assertAlmostEqual(grids["call"]["pnl"][i, j], call["price"] - 5.0, places=10)
+                self.assertAlmostEqual(grids["put"]["pnl"][i, j], put["price"] - 3.0, places=10)
+
+    def test_price_grid_subtracts_purchase_price(self):
+        grid = generate_option_price_grid(self.engine, self.option, "put", 0.02, 2.0,
+                                          self.vol_range, self.spot_range)
+        grids = self.engine.calculate_grid(self.option, 0.02, self.vol_range, self.spot_range)
+
+        self.assertEqual(grid.shape, (4, 6))
+        np.testing.assert_allclose(grid, grids["put"]["price"] - 2.0)
+
+    def test_heatmap_ranges_resolution(self):
+        ranges = {'min_spot': 90, 'max_spot': 120, 'min_vol': 0.1, 'max_vol': 0.5}
+        vol_range, spot_range = get_heatmap_ranges(ranges)
+        self.assertEqual((len(vol_range), len(spot_range)), (10, 10))
+
+        vol_range, spot_range = get_heatmap_ranges({**ranges, 'resolution': 500})
+        self.assertEqual((len(vol_range), len(spot_range)), (500, 500))
+
+class TestHeatmapRenderer(TestCase):
+    def setUp(self):
+        self.engine = PricingEngine()
+        self.option = Option(underlying_symbol="AAPL", strike_price=100,
+                             expiration_date=date.today() + timedelta(days=90))
+        self.renderer = HeatmapRenderer(max_figures=2)
+
+    def tearDown(self):
+        self.renderer.close()
+
+    def render(self, resolution, side="call", field="pnl", purchase_price=0.0):
+        ranges = {'min_spot': 80, 'max_spot': 120, 'min_vol': 0.1, 'max_vol': 0.5, 'resolution': resolution}
+        vol_range, spot_range = get_heatmap_ranges(ranges)
+        grids = generate_option_grids(self.engine, self.option, 0.02, vol_range, spot_range)
+        return self.renderer.render(self.option, 0.02, grids, vol_range, spot_range, side, field, purchase_price), grids
+
+    def test_purchase_price_change_updates_the_cached_figure(self):
+        fig, grids = self.render(10, purchase_price=5.0)
+        updated, _ = self.render(10, purchase_price=7.5)
+
+        self.assertIs(updated, fig)
+        self.assertEqual((self.renderer.draws, self.renderer.updates), (1, 1))
+        axes = fig.axes[0]
+        np.testing.assert_allclose(axes.images[0].get_array(), grids["call"]["price"] - 7.5)
+        self.assertEqual(axes.texts[0].get_text(), f"{grids['call']['price'][0, 0] - 7.5:.2f}")
+
+    def test_large_meshes_drop_annotations_and_thin_ticks(self):
+        fig, _ = self.render(200)
+
+        axes = fig.axes[0]
+        self.assertEqual(len(axes.texts), 0)
+        self.assertEqual(axes.images[0].get_array().shape, (200, 200))
+        self.assertLessEqual(len(axes.get_xticks()), 11)
+
+    def test_sides_and_fields_get_their_own_figures(self):
+        call, grids = self.render(10)
+        gamma, _ = self.render(10, side="put", field="gamma")
+
+        self.assertIsNot(call, gamma)
+        np.testing.assert_allclose(gamma.axes[0].images[0].get_array(), grids["put"]["gamma"])
+
+        self.render(12)
+        self.assertEqual(len(self.renderer), 2)
+        self.assertIsNot(self.render(10)[0], call)
+
+    def test_plot_call_heatmap_annotates_small_meshes(self):
+        ranges = {'min_spot': 80, 'max_spot': 120, 'min_vol': 0.1, 'max_vol': 0.5, 'resolution': 5}
+        fig = plot_call_heatmap(self.engine, self.option, 0.02, ranges, purchase_price=1.0)
+
+        self.assertEqual(len(fig.axes[0].texts), 25)
+        import matplotlib.pyplot as plt
+        plt.close(fig)
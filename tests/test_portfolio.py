@@ -0,0 +1,47 @@
+import numpy as np
+from datetime import date, timedelta
+from unittest import TestCase
+from domain.option import Option
+from domain.portfolio import Portfolio
+
+class TestPortfolio(TestCase):
+    def setUp(self):
+        self.today = date(2025, 1, 1)
+        self.portfolio = Portfolio(
+            symbols=["MSFT", "AAPL", "MSFT", "AAPL"],
+            strikes=[400.0, 180.0, 420.0, 200.0],
+            expiries=[date(2025, 7, 1), date(2025, 4, 1), date(2025, 12, 31), date(2025, 1, 1)],
+            is_call=[True, False, True, True],
+            quantities=[10, -5, 2, 1],
+        )
+
+    def test_positions_are_grouped_by_underlying(self):
+        self.assertEqual(self.portfolio.symbols, ["AAPL", "MSFT"])
+        np.testing.assert_array_equal(self.portfolio.symbol_ids, [0, 0, 1, 1])
+        np.testing.assert_array_equal(self.portfolio.strikes, [180.0, 200.0, 400.0, 420.0])
+        np.testing.assert_array_equal(self.portfolio.quantities, [-5, 1, 10, 2])
+        self.assertEqual(self.portfolio.positions_for("MSFT"), slice(2, 4))
+        self.assertEqual(len(self.portfolio), 4)
+
+    def test_order_maps_between_input_and_internal_order(self):
+        np.testing.assert_array_equal(self.portfolio.order, [1, 3, 0, 2])
+        np.testing.assert_array_equal(self.portfolio.per_position([0.4, 0.1, 0.5, 0.2]), [0.1, 0.2, 0.4, 0.5])
+        np.testing.assert_array_equal(self.portfolio.per_position(0.3), [0.3] * 4)
+        np.testing.assert_array_equal(self.portfolio.in_input_order(self.portfolio.strikes), [400.0, 180.0, 420.0, 200.0])
+
+    def test_columns_are_contiguous_and_typed(self):
+        for column in (self.portfolio.strikes, self.portfolio.expiries, self.portfolio.is_call, self.portfolio.quantities):
+            self.assertTrue(column.flags["C_CONTIGUOUS"])
+        self.assertEqual(self.portfolio.expiries.dtype, np.dtype("datetime64[D]"))
+
+    def test_time_to_expiration(self):
+        times = self.portfolio.time_to_expiration(self.today)
+        np.testing.assert_allclose(times, np.array([90, 0, 181, 364]) / 365.0)
+
+    def test_from_options(self):
+        expiry = date.today() + timedelta(days=30)
+        options = [Option("AAPL", 180.0, expiry), Option("GOOG", 170.0, expiry)]
+        portfolio = Portfolio.from_options(options, quantities=[1, 2], is_call=[True, False])
+
+        self.assertEqual(portfolio.symbols, ["AAPL", "GOOG"])
+        np.testing.assert_array_equal(portfolio.is_call, [True, False])
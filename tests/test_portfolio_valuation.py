@@ -0,0 +1,84 @@
+import numpy as np
+from datetime import date, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from domain.option import Option
+from domain.portfolio import Portfolio
+from pricing.pricing_engine import PricingEngine
+
+class TestPortfolioValuation(TestCase):
+    def setUp(self):
+        self.engine = PricingEngine()
+        expiry = date.today() + timedelta(days=120)
+        self.options = [Option("AAPL", 180.0, expiry), Option("MSFT", 400.0, expiry),
+                        Option("AAPL", 200.0, expiry), Option("MSFT", 380.0, expiry)]
+        self.quantities = [10, -4, 3, 7]
+        self.is_call = [True, False, False, True]
+        self.portfolio = Portfolio.from_options(self.options, self.quantities, self.is_call)
+        self.spots = {"AAPL": 190.0, "MSFT": 410.0}
+
+    def expected_position_values(self, spots):
+        expected = {}
+        for option, quantity, is_call in zip(self.options, self.quantities, self.is_call):
+            results = self.engine.calculate_call_put(option, 0.3, 0.02, spot=spots[option.underlying_symbol])
+            side = results["call"] if is_call else results["put"]
+            totals = expected.setdefault(option.underlying_symbol, dict.fromkeys(side, 0.0))
+            for key, value in side.items():
+                totals[key] += value * quantity
+        return expected
+
+    def test_aggregates_match_per_option_pricing(self):
+        valuation = self.engine.price_portfolio(self.portfolio, 0.3, 0.02, spots=self.spots)
+
+        aggregated = valuation.underlying_values()
+        for symbol, totals in self.expected_position_values(self.spots).items():
+            self.assertAlmostEqual(aggregated[symbol]["value"], totals["price"], places=8)
+            for greek in ("delta", "gamma", "vega", "theta", "rho"):
+                self.assertAlmostEqual(aggregated[symbol][greek], totals[greek], places=8)
+
+    def test_update_spot_reprices_only_that_underlying(self):
+        valuation = self.engine.price_portfolio(self.portfolio, 0.3, 0.02, spots=self.spots)
+        # position_values() follows the input order, where MSFT positions are the 2nd and 4th
+        msft = [1, 3]
+        msft_before = valuation.position_values()["value"][msft].copy()
+
+        strategy = self.engine.strategies['Black-Scholes']
+        with patch.object(strategy, 'calculate_call_put_values_batch',
+                          wraps=strategy.calculate_call_put_values_batch) as mock_calc:
+            valuation.update_spot("AAPL", 195.0)
+            self.assertEqual(len(mock_calc.call_args.args[1]), 2)
+
+        np.testing.assert_array_equal(valuation.position_values()["value"][msft], msft_before)
+        expected = self.expected_position_values({"AAPL": 195.0, "MSFT": 410.0})
+        self.assertAlmostEqual(valuation.underlying_values()["AAPL"]["value"], expected["AAPL"]["price"], places=8)
+
+    def test_missing_spots_are_fetched_in_bulk(self):
+        with patch.object(self.engine.data_provider, 'fetch_ticker_prices', return_value={"MSFT": 410.0}) as mock_fetch:
+            valuation = self.engine.price_portfolio(self.portfolio, 0.3, 0.02, spots={"AAPL": 190.0})
+            mock_fetch.assert_called_once_with(["MSFT"])
+
+        self.assertTrue(np.isfinite(valuation.position_values()["value"]).all())
+
+    def test_per_position_volatilities_follow_input_order(self):
+        # The book is given MSFT first, so its internal (symbol-sorted) order differs from the input order
+        expiry = date.today() + timedelta(days=120)
+        options = [Option("MSFT", 400.0, expiry), Option("AAPL", 180.0, expiry)]
+        portfolio = Portfolio.from_options(options, quantities=[1, 1], is_call=[True, True])
+        vols = [0.5, 0.1]
+        spots = {"AAPL": 190.0, "MSFT": 410.0}
+
+        valuation = self.engine.price_portfolio(portfolio, vols, 0.02, spots=spots)
+
+        expected = [self.engine.calculate_call(option, vol, 0.02, spot=spots[option.underlying_symbol])["price"]
+                    for option, vol in zip(options, vols)]
+        np.testing.assert_allclose(valuation.position_values()["value"], expected, rtol=1e-10)
+        self.assertAlmostEqual(valuation.underlying_values()["MSFT"]["value"], expected[0], places=8)
+
+        fast = self.engine.price_portfolio_fast(portfolio, 0.2, 0.02, spots=spots)
+        fast.revalue(spots, volatility=vols)
+        np.testing.assert_allclose(fast.position_values()["value"], expected, rtol=1e-10)
+
+        scenarios = self.engine.run_scenarios(portfolio, vols, 0.02, spots=spots, vol_shocks=(0.0, 0.01))
+        shocked = sum(self.engine.calculate_call(option, vol + 0.01, 0.02, spot=spots[option.underlying_symbol])["price"]
+                      for option, vol in zip(options, vols))
+        self.assertAlmostEqual(float(scenarios["pnl"].ravel()[1]), shocked - sum(expected), places=8)
@@ -3,8 +3,13 @@ from unittest.mock import patch
 from pricing.pricing_engine import PricingEngine
 
 class DummyOption:
-    def __init__(self, underlying_symbol):
+    def __init__(self, underlying_symbol, strike_price=100.0, time=0.5):
         self.underlying_symbol = underlying_symbol
+        self.strike_price = strike_price
+        self.time = time
+
+    def time_to_expiration(self):
+        return self.time
 
 class TestPricingEngine:
     def setup_method(self):
@@ -61,3 +66,35 @@ class TestPricingEngine:
             mock_fetch.assert_called_once_with("TSLA")
             mock_calc.assert_called_once_with(option, fetched_spot, volatility, rate)
             assert result == expected_result
+
+    def test_calculate_call_batch_delegates_to_strategy(self):
+        spots = [100.0, 110.0]
+        expected_result = {"price": [5.0, 11.0]}
+
+        with patch.object(self.engine.strategies['Black-Scholes'], 'calculate_call_values_batch', return_value=expected_result) as mock_calc:
+            result = self.engine.calculate_call_batch(spots, 100.0, 0.5, 0.2, 0.01)
+            mock_calc.assert_called_once_with(spots, 100.0, 0.5, 0.2, 0.01)
+            assert result == expected_result
+
+    def test_calculate_put_batch_delegates_to_strategy(self):
+        spots = [90.0, 95.0]
+        expected_result = {"price": [10.0, 6.0]}
+
+        with patch.object(self.engine.strategies['Black-Scholes'], 'calculate_put_values_batch', return_value=expected_result) as mock_calc:
+            result = self.engine.calculate_put_batch(spots, 100.0, 0.5, 0.2, 0.01)
+            mock_calc.assert_called_once_with(spots, 100.0, 0.5, 0.2, 0.01)
+            assert result == expected_result
+
+    def test_calculate_call_put_fetches_spot_once(self):
+        option = DummyOption("MSFT")
+        volatility = 0.2
+        rate = 0.01
+        fetched_spot = 410.0
+        expected_result = {"call": {"price": 15}, "put": {"price": 12}}
+
+        with patch.object(self.engine.data_provider, 'fetch_ticker_price', return_value=fetched_spot) as mock_fetch, \
+            patch.object(self.engine.strategies['Black-Scholes'], 'calculate_call_put_values', return_value=expected_result) as mock_calc:
+            result = self.engine.calculate_call_put(option, volatility, rate)
+            mock_fetch.assert_called_once_with("MSFT")
+            mock_calc.assert_called_once_with(option, fetched_spot, volatility, rate)
+            assert result == expected_result
@@ -0,0 +1,199 @@
+import asyncio
+import json
+import threading
+from unittest import TestCase
+import numpy as np
+from data_fetchers.base_fetcher import BaseFetcher
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.pricing_engine import PricingEngine
+from service.pricing_service import MicroBatcher, Overloaded, PricingService
+
+OPTION = {"spot_price": 105.0, "strike_price": 100.0, "time_to_expiration": 0.5,
+          "volatility": 0.2, "risk_free_rate": 0.01}
+
+async def request(port, method, path, payload=None):
+    """Send one HTTP request on a fresh connection and return (status, decoded body)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+                 f"Connection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    if b"application/json" in head:
+        return status, json.loads(content)
+    return status, content.decode()
+
+async def raw_request(port, data: bytes):
+    """Send raw bytes on a fresh connection and return the response status."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split(b" ", 2)[1])
+
+class FlakyFetcher(BaseFetcher):
+    """Quotes every symbol at 105 except "DOWN", whose fetch fails."""
+
+    def __init__(self):
+        pass
+
+    def fetch_ticker_price(self, symbol: str) -> float:
+        if symbol == "DOWN":
+            raise ConnectionError("upstream unavailable")
+        return 105.0
+
+def run_with_service(scenario, **options):
+    async def main():
+        service = PricingService(**options)
+        _, port = await service.start("127.0.0.1", 0)
+        try:
+            return await scenario(service, port)
+        finally:
+            await service.stop()
+    return asyncio.run(main())
+
+class TestPricingService(TestCase):
+    def test_concurrent_requests_are_coalesced(self):
+        options = [{**OPTION, "spot_price": spot} for spot in np.linspace(90, 110, 20)]
+
+        async def scenario(service, port):
+            responses = await asyncio.gather(*(request(port, "POST", "/price", option) for option in options))
+            return responses, service.stats()
+
+        responses, stats = run_with_service(scenario, window=0.05)
+        expected = BlackScholesStrategy().calculate_call_put_values_batch(
+            np.linspace(90, 110, 20), 100.0, 0.5, 0.2, 0.01)
+        for i, (status, result) in enumerate(responses):
+            self.assertEqual(status, 200)
+            self.assertAlmostEqual(result["call"]["price"], expected["call"]["price"][i], places=12)
+            self.assertAlmostEqual(result["put"]["delta"], expected["put"]["delta"][i], places=12)
+        self.assertEqual(stats["requests"], 20)
+        self.assertLess(stats["batches"], 20)
+        self.assertGreater(stats["mean_batch_size"], 1.0)
+
+    def test_zero_window_prices_each_request_alone(self):
+        async def scenario(service, port):
+            await asyncio.gather(*(request(port, "POST", "/price", OPTION) for _ in range(5)))
+            return service.stats()
+
+        stats = run_with_service(scenario, window=0.0)
+        self.assertEqual((stats["batches"], stats["mean_batch_size"]), (5, 1.0))
+
+    def test_batch_stats_metrics_and_errors(self):
+        async def scenario(service, port):
+            return {
+                "batch": await request(port, "POST", "/price/batch", [OPTION, {**OPTION, "strike_price": 110.0}]),
+                "missing": await request(port, "POST", "/price", {"spot_price": 100.0}),
+                "unknown": await request(port, "GET", "/nowhere"),
+                "stats": await request(port, "GET", "/stats"),
+                "metrics": await request(port, "GET", "/metrics"),
+            }
+
+        responses = run_with_service(scenario)
+        status, results = responses["batch"]
+        self.assertEqual(status, 200)
+        self.assertEqual(len(results), 2)
+        self.assertGreater(results[0]["call"]["price"], results[1]["call"]["price"])
+        self.assertEqual(responses["missing"][0], 400)
+        self.assertEqual(responses["unknown"][0], 404)
+        self.assertEqual(responses["stats"][1]["errors"], 1)
+        self.assertIn('options_pricer_stage_seconds_count{stage="request"}', responses["metrics"][1])
+
+    def test_invalid_inputs_get_400(self):
+        async def scenario(service, port):
+            return [await request(port, "POST", "/price", {**OPTION, **bad}) for bad in (
+                {"spot_price": -5.0}, {"volatility": 0.0}, {"strike_price": float("nan")},
+                {"time_to_expiration": -0.1})]
+
+        for status, result in run_with_service(scenario):
+            self.assertEqual(status, 400)
+            self.assertIn("must be", result["error"])
+
+    def test_non_finite_result_is_never_sent_as_200(self):
+        writer = type("Writer", (), {"write": lambda self, data: setattr(self, "data", data)})()
+        status = PricingService._write_response(writer, 200, {"call": {"price": float("nan")}}, keep_alive=False)
+
+        self.assertEqual(status, 500)
+        self.assertTrue(writer.data.startswith(b"HTTP/1.1 500"))
+        json.loads(writer.data.partition(b"\r\n\r\n")[2])
+
+    def test_malformed_requests_get_400(self):
+        async def scenario(service, port):
+            return (await raw_request(port, b"GARBAGE\r\n\r\n"),
+                    await raw_request(port, b"POST /price HTTP/1.1\r\nContent-Length: ten\r\n\r\n"),
+                    await raw_request(port, b"POST /price HTTP/1.1\r\nContent-Length: -1\r\n\r\n"))
+
+        self.assertEqual(run_with_service(scenario), (400, 400, 400))
+
+    def test_failed_spot_fetch_gets_502(self):
+        quoted = {key: value for key, value in OPTION.items() if key != "spot_price"}
+
+        async def scenario(service, port):
+            return (await request(port, "POST", "/price", {**quoted, "underlying_symbol": "DOWN"}),
+                    await request(port, "POST", "/price/batch", [{**quoted, "underlying_symbol": "UP"},
+                                                                 {**quoted, "underlying_symbol": "DOWN"}]),
+                    await request(port, "POST", "/price/batch", [{**quoted, "underlying_symbol": "UP"}] * 3))
+
+        single, failed_batch, batch = run_with_service(scenario, engine=PricingEngine(data_provider=FlakyFetcher()))
+        self.assertEqual((single[0], failed_batch[0]), (502, 502))
+        self.assertIn("DOWN", single[1]["error"])
+        self.assertEqual(batch[0], 200)
+        self.assertAlmostEqual(batch[1][2]["call"]["price"], batch[1][0]["call"]["price"])
+
+    def test_batch_options_count_against_max_pending(self):
+        async def scenario(service, port):
+            return (await request(port, "POST", "/price/batch", [OPTION] * 3),
+                    await request(port, "POST", "/price/batch", [OPTION] * 2),
+                    service.batcher.pending)
+
+        too_large, fits, pending = run_with_service(scenario, max_pending=2)
+        self.assertEqual((too_large[0], fits[0], pending), (503, 200, 0))
+
+    def test_single_requests_are_admitted_before_their_spot_fetch(self):
+        quoted = {**{key: value for key, value in OPTION.items() if key != "spot_price"}, "underlying_symbol": "UP"}
+        release = threading.Event()
+
+        class SlowFetcher(FlakyFetcher):
+            def fetch_ticker_price(self, symbol):
+                release.wait(timeout=5)
+                return 105.0
+
+        async def scenario(service, port):
+            first = asyncio.ensure_future(request(port, "POST", "/price", quoted))
+
+            async def fetching():
+                while service.batcher.pending == 0:
+                    await asyncio.sleep(0.01)
+            try:
+                await asyncio.wait_for(fetching(), timeout=1.0)
+                rejected = await request(port, "POST", "/price", quoted)
+            finally:
+                release.set()
+            return rejected, await first
+
+        rejected, first = run_with_service(scenario, engine=PricingEngine(data_provider=SlowFetcher()), max_pending=1)
+        self.assertEqual((rejected[0], first[0]), (503, 200))
+
+class TestMicroBatcher(TestCase):
+    def test_requests_beyond_max_pending_are_rejected(self):
+        async def scenario():
+            batcher = MicroBatcher(BlackScholesStrategy(), window=0.05, max_pending=2)
+            inputs = (105.0, 100.0, 0.5, 0.2, 0.01)
+            return await asyncio.gather(*(batcher.price(*inputs) for _ in range(3)), return_exceptions=True)
+
+        results = asyncio.run(scenario())
+        self.assertEqual(sum(isinstance(result, Overloaded) for result in results), 1)
+        self.assertEqual(sum(isinstance(result, dict) for result in results), 2)
+
+    def test_full_batch_is_priced_without_waiting_for_window(self):
+        async def scenario():
+            batcher = MicroBatcher(BlackScholesStrategy(), window=10.0, max_batch_size=4)
+            inputs = (105.0, 100.0, 0.5, 0.2, 0.01)
+            await asyncio.wait_for(asyncio.gather(*(batcher.price(*inputs) for _ in range(4))), timeout=1.0)
+            return batcher.batches
+
+        self.assertEqual(asyncio.run(scenario()), 1)
@@ -0,0 +1,61 @@
+import os
+import numpy as np
+import pandas as pd
+from unittest import TestCase
+from pricing.realized_volatility import close_to_close, parkinson, realized_volatility, yang_zhang
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "ohlc_history.csv")
+WINDOW = 21
+
+class TestRealizedVolatility(TestCase):
+    def setUp(self):
+        frame = pd.read_csv(FIXTURE)
+        self.panel = {name: frame.pivot(index="date", columns="symbol", values=name).to_numpy()
+                      for name in ("open", "high", "low", "close")}
+
+    def test_close_to_close_matches_rolling_std(self):
+        close = self.panel["close"]
+        expected = pd.DataFrame(np.log(close)).diff().rolling(WINDOW).std().to_numpy() * np.sqrt(252)
+
+        np.testing.assert_allclose(close_to_close(close, WINDOW), expected, rtol=1e-9, equal_nan=True)
+
+    def test_parkinson_matches_direct_formula(self):
+        high, low = self.panel["high"], self.panel["low"]
+        result = parkinson(high, low, WINDOW)
+
+        squared = np.log(high / low) ** 2
+        for t in range(WINDOW - 1, len(high)):
+            expected = np.sqrt(squared[t - WINDOW + 1:t + 1].mean(axis=0) / (4 * np.log(2)) * 252)
+            np.testing.assert_allclose(result[t], expected, rtol=1e-9)
+        self.assertTrue(np.isnan(result[:WINDOW - 1]).all())
+
+    def test_yang_zhang_matches_direct_formula(self):
+        o, h, l, c = (self.panel[name] for name in ("open", "high", "low", "close"))
+        result = yang_zhang(o, h, l, c, WINDOW)
+
+        k = 0.34 / (1.34 + (WINDOW + 1) / (WINDOW - 1))
+        for t in (WINDOW, WINDOW + 7, len(c) - 1):
+            rows = slice(t - WINDOW + 1, t + 1)
+            overnight = np.log(o[rows] / c[t - WINDOW:t])
+            open_to_close = np.log(c[rows] / o[rows])
+            rs = (np.log(h[rows] / c[rows]) * np.log(h[rows] / o[rows])
+                  + np.log(l[rows] / c[rows]) * np.log(l[rows] / o[rows]))
+            variance = overnight.var(axis=0, ddof=1) + k * open_to_close.var(axis=0, ddof=1) + (1 - k) * rs.mean(axis=0)
+            np.testing.assert_allclose(result[t], np.sqrt(variance * 252), rtol=1e-9)
+        self.assertTrue(np.isnan(result[:WINDOW]).all())
+
+    def test_gaps_void_only_the_windows_that_span_them(self):
+        close = self.panel["close"].copy()
+        close[60, 0] = np.nan
+        result = close_to_close(close, WINDOW)
+
+        # Returns into and out of row 60 are missing
+        self.assertTrue(np.isnan(result[60:61 + WINDOW, 0]).all())
+        self.assertTrue(np.isfinite(result[61 + WINDOW:, 0]).all())
+        self.assertTrue(np.isfinite(result[WINDOW:, 1]).all())
+
+    def test_estimators_recover_the_simulated_volatility(self):
+        # The fixture was simulated at 25% (AAPL) and 18% (MSFT)
+        for method in ("close_to_close", "parkinson", "yang_zhang"):
+            full_sample = realized_volatility(self.panel, len(self.panel["close"]) - 1, method)[-1]
+            np.testing.assert_allclose(full_sample, [0.25, 0.18], rtol=0.25, err_msg=method)
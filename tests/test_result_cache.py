@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from datetime import date, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from domain.option import Option
+from pricing.pricing_engine import PricingEngine
+from pricing.result_cache import ResultCache
+from ui.plots import generate_option_grids
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.cache = ResultCache(max_size=2, tolerance=1e-4)
+
+    def test_inputs_within_tolerance_share_a_key(self):
+        self.assertEqual(self.cache.key("call", 100.0, 0.2), self.cache.key("call", 100.00001, 0.20002))
+        self.assertNotEqual(self.cache.key("call", 100.0, 0.2), self.cache.key("call", 100.001, 0.2))
+        self.assertEqual(self.cache.key(np.array([1.0, 2.0])), self.cache.key(np.array([1.00001, 2.0])))
+
+    def test_hits_misses_and_hit_rate(self):
+        key = self.cache.key("call", 100.0)
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, {"price": 5.0})
+        self.assertEqual(self.cache.get(key), {"price": 5.0})
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        keys = [self.cache.key(float(i)) for i in range(3)]
+        self.cache.put(keys[0], {"price": 0.0})
+        self.cache.put(keys[1], {"price": 1.0})
+        self.cache.get(keys[0])
+        self.cache.put(keys[2], {"price": 2.0})
+
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_cached_results_cannot_be_mutated(self):
+        key = self.cache.key("grid")
+        self.cache.put(key, {"call": {"price": np.ones(3)}})
+        result = self.cache.get(key)
+        result["call"]["pnl"] = result["call"]["price"] - 1.0
+        with pytest.raises(ValueError):
+            result["call"]["price"][0] = 2.0
+        self.assertEqual(set(self.cache.get(key)["call"]), {"price"})
+
+class TestEngineResultCache(TestCase):
+    def setUp(self):
+        self.engine = PricingEngine()
+        self.option = Option(underlying_symbol="AAPL", strike_price=100.0,
+                             expiration_date=date.today() + timedelta(days=90))
+        self.strategy = self.engine.strategies['Black-Scholes']
+
+    def test_single_option_pricing_bypasses_cache(self):
+        first = self.engine.calculate_call_put(self.option, 0.2, 0.01, spot=105.0)
+        second = self.engine.calculate_call(self.option, 0.2, 0.01, spot=110.0)
+        self.assertGreater(second["price"], first["call"]["price"])
+        self.assertEqual(len(self.engine.result_cache), 0)
+        self.assertEqual(self.engine.result_cache.hits + self.engine.result_cache.misses, 0)
+
+    def test_moved_spot_axis_reprices_grid(self):
+        vol_range = np.linspace(0.1, 0.5, 5)
+        first = self.engine.calculate_grid(self.option, 0.01, vol_range, np.linspace(80, 120, 7))
+        second = self.engine.calculate_grid(self.option, 0.01, vol_range, np.linspace(81, 121, 7))
+
+        self.assertEqual((self.engine.result_cache.hits, self.engine.result_cache.misses), (0, 2))
+        self.assertTrue((second["call"]["price"] > first["call"]["price"]).all())
+
+    def test_purchase_price_change_reuses_grid(self):
+        vol_range, spot_range = np.linspace(0.1, 0.5, 5), np.linspace(80, 120, 7)
+        first = generate_option_grids(self.engine, self.option, 0.01, vol_range, spot_range, call_purchase_price=5.0)
+        with patch.object(self.strategy, 'calculate_call_put_values_batch') as mock_calc:
+            second = generate_option_grids(self.engine, self.option, 0.01, vol_range, spot_range,
+                                           call_purchase_price=7.0)
+            mock_calc.assert_not_called()
+        np.testing.assert_allclose(second["call"]["pnl"], first["call"]["pnl"] - 2.0)
+        np.testing.assert_array_equal(second["call"]["price"], first["call"]["price"])
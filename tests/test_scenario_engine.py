@@ -0,0 +1,90 @@
+import os
+import tempfile
+import numpy as np
+import pytest
+from datetime import date, timedelta
+from unittest import TestCase
+from domain.portfolio import Portfolio
+from pricing.black_scholes import BlackScholesStrategy
+from pricing.pricing_engine import PricingEngine
+from pricing.scenario_engine import ScenarioEngine
+
+class TestScenarioEngine(TestCase):
+    def setUp(self):
+        self.today = date(2025, 1, 2)
+        self.portfolio = Portfolio(
+            symbols=["AAPL", "MSFT", "AAPL"],
+            strikes=[180.0, 400.0, 170.0],
+            expiries=[self.today + timedelta(days=90), self.today + timedelta(days=30), self.today + timedelta(days=200)],
+            is_call=[True, False, False],
+            quantities=[10, -3, 5],
+        )
+        self.spots = {"AAPL": 185.0, "MSFT": 405.0}
+        self.scenarios = dict(spot_shocks=[-0.1, 0.0, 0.1], vol_shocks=[-0.05, 0.05],
+                              rate_shocks=[0.0, 0.01], time_shifts=[0, 7, 45])
+
+    def brute_force_pnl(self, spot_shock, vol_shock, rate_shock, time_shift):
+        strategy = BlackScholesStrategy()
+        total = 0.0
+        times = self.portfolio.time_to_expiration(self.today)
+        for i in range(len(self.portfolio)):
+            spot = self.spots[self.portfolio.symbols[self.portfolio.symbol_ids[i]]]
+            side = "call" if self.portfolio.is_call[i] else "put"
+            base = strategy.calculate_call_put_values_batch(spot, self.portfolio.strikes[i], times[i], 0.3, 0.02)
+            shocked = strategy.calculate_call_put_values_batch(
+                spot * (1 + spot_shock), self.portfolio.strikes[i], times[i] - time_shift / 365.0,
+                0.3 + vol_shock, 0.02 + rate_shock)
+            total += (shocked[side]["price"] - base[side]["price"]) * self.portfolio.quantities[i]
+        return total
+
+    def test_cube_matches_brute_force_revaluation(self):
+        result = ScenarioEngine(chunk_size=4).run(self.portfolio, self.spots, 0.3, 0.02, today=self.today,
+                                                   **self.scenarios)
+
+        self.assertEqual(result["pnl"].shape, (3, 2, 2, 3))
+        for index in np.ndindex(result["pnl"].shape):
+            shocks = [self.scenarios[axis][i] for axis, i in zip(self.scenarios, index)]
+            self.assertAlmostEqual(result["pnl"][index], self.brute_force_pnl(*shocks), places=8)
+
+    def test_reductions(self):
+        result = ScenarioEngine().run(self.portfolio, self.spots, 0.3, 0.02, today=self.today, **self.scenarios)
+        pnl = result["pnl"]
+
+        self.assertAlmostEqual(result["max_loss"], -pnl.min())
+        worst = result["worst_scenario"]
+        index = tuple(list(self.scenarios[axis]).index(worst[name])
+                      for axis, name in zip(self.scenarios, ("spot", "volatility", "rate", "time")))
+        self.assertEqual(pnl[index], pnl.min())
+        self.assertGreaterEqual(result["var"][0.99], result["var"][0.95])
+        np.testing.assert_allclose(result["by_axis"]["spot"]["min"], pnl.min(axis=(1, 2, 3)))
+        np.testing.assert_allclose(result["by_axis"]["time"]["mean"], pnl.mean(axis=(0, 1, 2)))
+
+    def test_spills_position_pnl_to_memory_mapped_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pnl.npy")
+            result = ScenarioEngine(chunk_size=5).run(self.portfolio, self.spots, 0.3, 0.02, today=self.today,
+                                                       spill_path=path, **self.scenarios)
+            spilled = np.load(path, mmap_mode="r")
+
+            self.assertEqual(spilled.shape, (36, 3))
+            np.testing.assert_allclose(spilled.sum(axis=1), result["pnl"].ravel())
+            del spilled
+
+    def test_parallel_run_matches_serial(self):
+        serial = ScenarioEngine(chunk_size=6).run(self.portfolio, self.spots, 0.3, 0.02, today=self.today,
+                                                  **self.scenarios)
+        parallel = ScenarioEngine(chunk_size=6, n_workers=2).run(self.portfolio, self.spots, 0.3, 0.02,
+                                                                 today=self.today, **self.scenarios)
+
+        np.testing.assert_array_equal(parallel["pnl"], serial["pnl"])
+
+    def test_unshocked_scenario_has_zero_pnl(self):
+        engine = PricingEngine()
+        result = engine.run_scenarios(self.portfolio, 0.3, 0.02, spots=self.spots)
+
+        self.assertEqual(result["pnl"].shape, (1, 1, 1, 1))
+        self.assertAlmostEqual(result["pnl"].item(), 0.0)
+
+    def test_missing_spot_is_rejected(self):
+        with pytest.raises(ValueError, match="MSFT"):
+            ScenarioEngine().run(self.portfolio, {"AAPL": 185.0}, 0.3, 0.02, today=self.today)
@@ -0,0 +1,65 @@
+import numpy as np
+from datetime import date, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+from domain.portfolio import Portfolio
+from pricing.portfolio_valuation import PortfolioValuation
+from pricing.pricing_engine import PricingEngine
+
+class TestTaylorValuation(TestCase):
+    def setUp(self):
+        self.engine = PricingEngine()
+        self.strategy = self.engine.strategies['Black-Scholes']
+        rng = np.random.default_rng(7)
+        n_positions = 40
+        today = date.today()
+        self.portfolio = Portfolio(
+            symbols=["AAPL", "MSFT"] * (n_positions // 2),
+            strikes=rng.uniform(80, 120, n_positions),
+            expiries=[today + timedelta(days=int(days)) for days in rng.integers(60, 500, n_positions)],
+            is_call=rng.random(n_positions) < 0.5,
+            quantities=rng.integers(-10, 10, n_positions),
+        )
+        self.spots = {"AAPL": 100.0, "MSFT": 100.0}
+
+    def full_prices(self, spots, volatility=0.25, elapsed_days=0.0):
+        valuation = PortfolioValuation(self.portfolio, self.strategy, volatility, 0.03)
+        valuation.times = valuation.times - elapsed_days / 365.0
+        return valuation.revalue(spots).unit_values["price"]
+
+    def test_small_moves_are_approximated_within_the_error_bound(self):
+        valuation = self.engine.price_portfolio_fast(self.portfolio, 0.25, 0.03, spots=self.spots)
+        self.assertEqual(valuation.repriced, len(self.portfolio))
+
+        spots = {"AAPL": 100.4, "MSFT": 99.7}
+        with patch.object(self.strategy, 'calculate_call_put_values_batch') as mock_calc:
+            valuation.revalue(spots, volatility=0.252, elapsed_days=0.5)
+            mock_calc.assert_not_called()
+
+        self.assertEqual(valuation.approximated, len(self.portfolio))
+        expected = self.full_prices(spots, 0.252, 0.5)
+        np.testing.assert_allclose(valuation.unit_values["price"], expected, atol=valuation.max_error)
+
+    def test_large_moves_fall_back_to_full_repricing(self):
+        valuation = self.engine.price_portfolio_fast(self.portfolio, 0.25, 0.03, spots=self.spots)
+        valuation.update_spot("AAPL", 110.0)
+
+        aapl = self.portfolio.positions_for("AAPL")
+        self.assertEqual(valuation.repriced, len(self.portfolio) + aapl.stop - aapl.start)
+        np.testing.assert_allclose(valuation.unit_values["price"],
+                                   self.full_prices({"AAPL": 110.0, "MSFT": 100.0}), rtol=1e-12)
+        np.testing.assert_array_equal(valuation.anchor["spot"][aapl], 110.0)
+
+    def test_error_bound_triggers_partial_repricing(self):
+        valuation = self.engine.price_portfolio_fast(self.portfolio, 0.25, 0.03, spots=self.spots,
+                                                     max_spot_move=1.0, max_error=1e-4)
+        valuation.revalue({"AAPL": 101.5, "MSFT": 101.5})
+
+        self.assertGreater(valuation.approximated, 0)
+        self.assertGreater(valuation.repriced, len(self.portfolio))
+        expected = self.full_prices({"AAPL": 101.5, "MSFT": 101.5})
+        # The estimate drops higher-order terms, so allow some slack over the bound
+        np.testing.assert_allclose(valuation.unit_values["price"], expected, atol=10 * valuation.max_error)
+
+        valuation.reprice()
+        np.testing.assert_allclose(valuation.unit_values["price"], expected, rtol=1e-12)
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from datetime import date, timedelta
+from unittest import TestCase
+from domain.option_chain import OptionChain
+from pricing.pricing_engine import PricingEngine
+from pricing.volatility_surface import VolatilitySurface
+
+SPOT = 100.0
+STRIKES = np.array([70.0, 85.0, 100.0, 115.0, 130.0])
+
+def smile(a, b, c, strikes=STRIKES):
+    k = np.log(strikes / SPOT)
+    return a + b * k + c * k ** 2
+
+class TestVolatilitySurface(TestCase):
+    def setUp(self):
+        self.quotes = {
+            0.25: (STRIKES, smile(0.30, -0.10, 0.50)),
+            1.0: (STRIKES, smile(0.25, -0.05, 0.20)),
+            2.0: (STRIKES, smile(0.22, -0.03, 0.10)),
+        }
+        self.surface = VolatilitySurface(SPOT, n_times=9).fit(self.quotes)
+
+    def test_lookup_reproduces_quoted_smiles(self):
+        for expiry, (strikes, vols) in self.quotes.items():
+            np.testing.assert_allclose(self.surface.lookup(strikes, expiry), vols, rtol=1e-4)
+            np.testing.assert_allclose(self.surface.smile(expiry, strikes), vols, rtol=1e-12)
+
+    def test_total_variance_is_interpolated_between_expiries(self):
+        w0 = smile(0.25, -0.05, 0.20, np.array([SPOT])) ** 2 * 1.0
+        w1 = smile(0.22, -0.03, 0.10, np.array([SPOT])) ** 2 * 2.0
+        expected = np.sqrt((w0 + (w1 - w0) * 0.5) / 1.5)
+        np.testing.assert_allclose(self.surface.lookup(SPOT, 1.5), expected, rtol=1e-12)
+
+    def test_smiles_are_flat_outside_quoted_expiries(self):
+        np.testing.assert_allclose(self.surface.lookup(STRIKES, 0.0), self.quotes[0.25][1], rtol=1e-4)
+        np.testing.assert_allclose(self.surface.lookup(STRIKES, 5.0), self.quotes[2.0][1], rtol=1e-4)
+
+    def test_lookup_broadcasts(self):
+        vols = self.surface.lookup(STRIKES[:, np.newaxis], np.array([0.25, 1.0, 2.0]))
+        self.assertEqual(vols.shape, (5, 3))
+
+    def test_update_expiry_matches_full_refit(self):
+        new_quotes = (STRIKES, smile(0.27, -0.08, 0.30))
+        before = self.surface.grid.copy()
+        self.surface.update_expiry(1.0, *new_quotes)
+        refit = VolatilitySurface(SPOT, n_times=9).fit({**self.quotes, 1.0: new_quotes})
+
+        np.testing.assert_allclose(self.surface.grid, refit.grid, rtol=1e-12)
+        # Only rows strictly between the neighbouring expiries 0.25 and 2.0 change
+        unchanged = (self.surface.times <= 0.25) | (self.surface.times >= 2.0)
+        np.testing.assert_array_equal(self.surface.grid[unchanged], before[unchanged])
+
+    def test_update_expiry_inserts_new_expiry(self):
+        new_quotes = (STRIKES, smile(0.28, -0.07, 0.25))
+        self.surface.update_expiry(0.5, *new_quotes)
+        refit = VolatilitySurface(SPOT, n_times=9).fit({**self.quotes, 0.5: new_quotes})
+
+        np.testing.assert_array_equal(self.surface.expiries, [0.25, 0.5, 1.0, 2.0])
+        np.testing.assert_allclose(self.surface.grid, refit.grid, rtol=1e-12)
+
+    def test_single_quote_gives_flat_smile(self):
+        surface = VolatilitySurface(SPOT).fit({0.5: ([100.0], [0.2])})
+        np.testing.assert_allclose(surface.lookup(STRIKES, 0.5), 0.2)
+
+    def test_non_finite_inputs_are_rejected(self):
+        surface = VolatilitySurface(SPOT).fit({0.5: ([100.0], [0.2])})
+        for strikes, times in (([100.0, np.nan], 0.5), ([0.0], 0.5), ([np.inf], 0.5), ([100.0], [0.5, np.nan])):
+            with pytest.raises(ValueError):
+                surface.lookup(strikes, times)
+
+class TestEngineWithSurface(TestCase):
+    def test_chain_priced_with_surface_vols(self):
+        today = date.today()
+        expiries = [today + timedelta(days=days) for days in (30, 200, 400, 30)]
+        chain = OptionChain(["AAPL", "AAPL", "MSFT", "MSFT"], [90.0, 110.0, 400.0, 420.0], expiries)
+        aapl = VolatilitySurface(100.0).fit({0.1: (STRIKES, smile(0.3, -0.1, 0.5)), 1.0: (STRIKES, smile(0.25, 0, 0.2))})
+        msft = VolatilitySurface(400.0).fit({0.5: ([380.0, 400.0, 420.0], [0.22, 0.2, 0.21])})
+        engine = PricingEngine()
+        spots = {"AAPL": 100.0, "MSFT": 400.0}
+
+        results = engine.calculate_chain(chain, {"AAPL": aapl, "MSFT": msft}, 0.02, spots=spots)
+
+        times = chain.time_to_expiration()
+        vols = np.concatenate([aapl.lookup(chain.strikes[:2], times[:2]), msft.lookup(chain.strikes[2:], times[2:])])
+        expected = engine.calculate_chain(chain, vols, 0.02, spots=spots)
+        np.testing.assert_allclose(results["call"]["price"], expected["call"]["price"])
+        single = engine.calculate_chain(chain[:2], aapl, 0.02, spots=spots)
+        np.testing.assert_allclose(single["put"]["price"], expected["put"]["price"][:2])
+
+    def test_chain_underlying_without_surface_is_rejected(self):
+        chain = OptionChain(["AAPL", "MSFT"], [100.0, 400.0], [date.today() + timedelta(days=90)] * 2)
+        aapl = VolatilitySurface(100.0).fit({0.5: ([100.0], [0.2])})
+        with pytest.raises(ValueError, match="MSFT"):
+            PricingEngine().calculate_chain(chain, {"AAPL": aapl}, 0.02, spots={"AAPL": 100.0, "MSFT": 400.0})
+        priced = PricingEngine().calculate_chain(chain[:1], {"AAPL": aapl}, 0.02, spots={"AAPL": 100.0, "MSFT": 400.0})
+        self.assertTrue(np.isfinite(priced["call"]["price"]).all())
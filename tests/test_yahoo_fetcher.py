@@ -1,10 +1,11 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 from data_fetchers.yahoo_fetcher import YahooFetcher
+import pandas as pd
 import pytest
 
 class TestYahooFetcher(TestCase):
-    @patch("data_fetchers.yahoo_fetcher.yf.Ticker")
+    @patch("yfinance.Ticker")
     def test_fetch_price_from_history(self, mock_ticker):
         mock_history = MagicMock()
         mock_history.empty = False
@@ -20,7 +21,7 @@ class TestYahooFetcher(TestCase):
         assert isinstance(price, float)
         assert price == 150.75
 
-    @patch("data_fetchers.yahoo_fetcher.yf.Ticker")
+    @patch("yfinance.Ticker")
     def test_fetch_price_from_info(self, mock_ticker):
         mock_history = MagicMock()
         mock_history.empty = True
@@ -35,7 +36,7 @@ class TestYahooFetcher(TestCase):
         assert isinstance(price, float)
         assert price == 143.22
 
-    @patch("data_fetchers.yahoo_fetcher.yf.Ticker")
+    @patch("yfinance.Ticker")
     def test_fetch_price_raises_error(self, mock_ticker):
         mock_history = MagicMock()
         mock_history.empty = True
@@ -47,3 +48,23 @@ class TestYahooFetcher(TestCase):
         fetcher = YahooFetcher()
         with pytest.raises(ValueError, match="Could not fetch price for ticker: FAKE"):
             fetcher.fetch_ticker_price("FAKE")
+
+    @patch("yfinance.Ticker")
+    @patch("yfinance.download")
+    def test_fetch_prices_in_one_download(self, mock_download, mock_ticker):
+        closes = pd.DataFrame({"AAPL": [190.5], "MSFT": [float("nan")]})
+        mock_download.return_value = pd.concat({"Close": closes}, axis=1)
+        mock_history = MagicMock()
+        mock_history.empty = True
+        mock_instance = MagicMock()
+        mock_instance.history.return_value = mock_history
+        mock_instance.info = {'regularMarketPrice': 410.25}
+        mock_ticker.return_value = mock_instance
+
+        fetcher = YahooFetcher()
+        prices = fetcher.fetch_ticker_prices(["AAPL", "MSFT", "AAPL"])
+
+        mock_download.assert_called_once()
+        assert mock_download.call_args.args[0] == ["AAPL", "MSFT"]
+        mock_ticker.assert_called_once_with("MSFT")
+        assert prices == {"AAPL": 190.5, "MSFT": 410.25}
@@ -1,54 +1,172 @@
+from collections import OrderedDict
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+DEFAULT_HEATMAP_RESOLUTION = 10
+MAX_ANNOTATED_CELLS = 225  # 15x15; every label costs ~1.5 ms to rasterise
+MAX_TICK_LABELS = 11
+HEATMAP_FIELDS = {"pnl": "P&L", "price": "Price", "delta": "Delta", "gamma": "Gamma", "vega": "Vega",
+                  "theta": "Theta", "rho": "Rho"}
+
+def generate_option_grids(pricing_engine, option, rate, vol_range, spot_range,
+                          call_purchase_price=0.0, put_purchase_price=0.0):
+    """
+    Evaluate the whole vol x spot mesh once and return call and put grids together.
+
+    Each of "call" and "put" maps price, Greeks and "pnl" (price less purchase price)
+    to arrays of shape (len(vol_range), len(spot_range)).
+    """
+    grids = pricing_engine.calculate_grid(option, rate, vol_range, spot_range)
+    grids["call"]["pnl"] = grids["call"]["price"] - call_purchase_price
+    grids["put"]["pnl"] = grids["put"]["price"] - put_purchase_price
+    return grids
+
 
 def generate_option_price_grid(pricing_engine, option, option_type, rate, purchase_price, vol_range, spot_range):
-    price_matrix = np.zeros((len(vol_range), len(spot_range)))
-
-    for i, vol in enumerate(vol_range):
-        for j, spot in enumerate(spot_range):
-            if option_type == "call":
-                option_price = pricing_engine.calculate_call(
-                    option, volatility=vol, risk_free_rate=rate, spot=spot
-                )
-            else:
-                option_price = pricing_engine.calculate_put(
-                    option, volatility=vol, risk_free_rate=rate, spot=spot
-                )
-            price_matrix[i, j] = option_price['price'] - purchase_price
-            
-    return price_matrix
-
-
-def plot_call_heatmap(pricing_engine, option_template, rate, heatmap_ranges, purchase_price=0.0):
-    vol_range, spot_range = get_heatmap_ranges(heatmap_ranges)
-    call_prices = generate_option_price_grid(pricing_engine, option_template, "call", rate, purchase_price, vol_range, spot_range)
-    fig, axes = plt.subplots(1, 1, figsize=(14, 6))
+    grids = pricing_engine.calculate_grid(option, rate, vol_range, spot_range)
+    return grids[option_type]["price"] - purchase_price
 
-    cmap = sns.diverging_palette(10, 150, as_cmap=True)
-    sns.heatmap(call_prices, annot=True, fmt=".2f", xticklabels=np.round(spot_range, 2),
-                yticklabels=np.round(vol_range, 2), ax=axes, cmap=cmap, center=0)
-    axes.set_title("Call Price Heatmap")
-    axes.set_xlabel("Spot Price")
-    axes.set_ylabel("Volatility")
 
+def plot_call_heatmap(pricing_engine, option_template, rate, heatmap_ranges, purchase_price=0.0, grids=None):
+    vol_range, spot_range = get_heatmap_ranges(heatmap_ranges)
+    if grids is None:
+        call_prices = generate_option_price_grid(pricing_engine, option_template, "call", rate, purchase_price, vol_range, spot_range)
+    else:
+        call_prices = grids["call"]["price"] - purchase_price
+    fig, _, _ = _draw_heatmap(call_prices, vol_range, spot_range, "Call Price Heatmap", centered=True)
     return fig
 
-def plot_put_heatmap(pricing_engine, option_template, rate, heatmap_ranges, purchase_price=0.0):
+def plot_put_heatmap(pricing_engine, option_template, rate, heatmap_ranges, purchase_price=0.0, grids=None):
     vol_range, spot_range = get_heatmap_ranges(heatmap_ranges)
-    put_prices = generate_option_price_grid(pricing_engine, option_template, "put", rate, purchase_price, vol_range, spot_range)
+    if grids is None:
+        put_prices = generate_option_price_grid(pricing_engine, option_template, "put", rate, purchase_price, vol_range, spot_range)
+    else:
+        put_prices = grids["put"]["price"] - purchase_price
+    fig, _, _ = _draw_heatmap(put_prices, vol_range, spot_range, "Put Price Heatmap", centered=True)
+    return fig
+
+class HeatmapRenderer:
+    """
+    Keeps rendered heatmap figures and updates them in place where it can.
+
+    Figures are cached, least recently used first out, on the pricing inputs
+    (strike, time to expiration, rate and both axes) plus the side and field
+    shown. When only the purchase price changes, the cached figure's image
+    data, colour limits and any annotations are updated rather than redrawn.
+    All sides and fields are read from one `generate_option_grids` result.
+    """
+
+    def __init__(self, max_figures: int = 8, max_annotated_cells: int = MAX_ANNOTATED_CELLS):
+        """
+        :param max_figures: Figures kept before the least recently used is closed.
+        :param max_annotated_cells: Largest mesh whose cells are labelled with their values.
+        """
+        self.max_figures = max_figures
+        self.max_annotated_cells = max_annotated_cells
+        self.draws = 0
+        self.updates = 0
+        self._figures = OrderedDict()
+
+    def render(self, option, rate, grids, vol_range, spot_range, side: str = "call", field: str = "pnl",
+               purchase_price: float = 0.0):
+        """
+        Return a figure of one side and field of `grids`.
+
+        :param grids: Grids from `generate_option_grids` for `option`, `rate` and the two ranges.
+        :param side: "call" or "put".
+        :param field: "pnl" (price less `purchase_price`), "price" or a Greek.
+        """
+        vol_range = np.asarray(vol_range, dtype=np.float64)
+        spot_range = np.asarray(spot_range, dtype=np.float64)
+        key = (option.strike_price, option.time_to_expiration(), rate, vol_range.tobytes(), spot_range.tobytes(),
+               side, field)
+        values = grids[side]["price"] - purchase_price if field == "pnl" else grids[side][field]
+
+        entry = self._figures.get(key)
+        if entry is None:
+            title = f"{side.title()} {HEATMAP_FIELDS.get(field, field.title())} Heatmap"
+            fig, image, texts = _draw_heatmap(values, vol_range, spot_range, title, centered=field == "pnl",
+                                              max_annotated_cells=self.max_annotated_cells)
+            self._figures[key] = [fig, image, texts, purchase_price]
+            self.draws += 1
+            self._evict()
+            return fig
+
+        self._figures.move_to_end(key)
+        fig, image, texts, drawn_price = entry
+        if field == "pnl" and purchase_price != drawn_price:
+            image.set_data(values)
+            image.set_clim(*_color_limits(values, centered=True))
+            for text, value in zip(texts, values.ravel()):
+                text.set_text(f"{value:.2f}")
+            entry[3] = purchase_price
+            self.updates += 1
+        return fig
+
+    def close(self):
+        """Close every cached figure."""
+        plt, _ = _plotting_modules()
+        for fig, *_ in self._figures.values():
+            plt.close(fig)
+        self._figures.clear()
+
+    def __len__(self):
+        return len(self._figures)
+
+    def _evict(self):
+        plt, _ = _plotting_modules()
+        while len(self._figures) > self.max_figures:
+            _, (fig, *_) = self._figures.popitem(last=False)
+            plt.close(fig)
+
+def _color_limits(values, centered: bool):
+    """Colour limits of a grid; centred grids are symmetric about zero like a diverging heatmap."""
+    finite = values[np.isfinite(values)]
+    if not finite.size:
+        return -1.0, 1.0
+    if centered:
+        limit = float(np.abs(finite).max()) or 1.0
+        return -limit, limit
+    return float(finite.min()), float(finite.max())
+
+def _draw_heatmap(values, vol_range, spot_range, title, centered, max_annotated_cells=MAX_ANNOTATED_CELLS):
+    """
+    Draw a vol x spot grid as a single image and return (figure, image, annotation texts).
+
+    One `imshow` image replaces a patch per cell, so drawing cost barely grows
+    with the mesh; cells are labelled only up to `max_annotated_cells`, and
+    axis labels are thinned to at most `MAX_TICK_LABELS` per axis.
+    """
+    plt, sns = _plotting_modules()
     fig, axes = plt.subplots(1, 1, figsize=(14, 6))
+    cmap = sns.diverging_palette(10, 150, as_cmap=True) if centered else "viridis"
+    vmin, vmax = _color_limits(values, centered)
+    image = axes.imshow(values, cmap=cmap, vmin=vmin, vmax=vmax, aspect="auto", interpolation="nearest")
+    fig.colorbar(image, ax=axes)
+
+    for axis_ticks, axis_labels, labels in ((axes.set_xticks, axes.set_xticklabels, spot_range),
+                                            (axes.set_yticks, axes.set_yticklabels, vol_range)):
+        positions = np.unique(np.linspace(0, len(labels) - 1, min(len(labels), MAX_TICK_LABELS)).round().astype(int))
+        axis_ticks(positions)
+        axis_labels(np.round(np.asarray(labels)[positions], 2))
 
-    cmap = sns.diverging_palette(10, 150, as_cmap=True)
-    sns.heatmap(put_prices, annot=True, fmt=".2f", xticklabels=np.round(spot_range, 2),
-                yticklabels=np.round(vol_range, 2), ax=axes, cmap=cmap, center=0)
-    axes.set_title("Put Price Heatmap")
+    texts = []
+    if values.size <= max_annotated_cells:
+        rows, columns = np.indices(values.shape)
+        texts = [axes.text(column, row, f"{value:.2f}", ha="center", va="center", fontsize=8)
+                 for row, column, value in zip(rows.ravel(), columns.ravel(), values.ravel())]
+    axes.set_title(title)
     axes.set_xlabel("Spot Price")
     axes.set_ylabel("Volatility")
+    return fig, image, texts
 
-    return fig
+def _plotting_modules():
+    """Import matplotlib and seaborn on first render; pricing code never needs them."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return plt, sns
 
 def get_heatmap_ranges(heatmap_ranges):
-    spot_range = np.linspace(heatmap_ranges['min_spot'], heatmap_ranges['max_spot'], 10)
-    vol_range = np.linspace(heatmap_ranges['min_vol'], heatmap_ranges['max_vol'], 10)
+    resolution = heatmap_ranges.get('resolution', DEFAULT_HEATMAP_RESOLUTION)
+    spot_range = np.linspace(heatmap_ranges['min_spot'], heatmap_ranges['max_spot'], resolution)
+    vol_range = np.linspace(heatmap_ranges['min_vol'], heatmap_ranges['max_vol'], resolution)
     return vol_range, spot_range